@@ -0,0 +1,115 @@
+"""Benchmark generating the head view and model view for synthetic attention.
+
+Times head_view and model_view (with html_action='return') end to end for a grid of numbers of layers (L), heads (H)
+and sequence lengths (N), along with the time of each stage (see ``bertviz.profile``) and the size of the output.
+Results are written as JSON, so that the serialization path can be compared across releases.
+
+Usage (from the root of the repository):
+    python benchmarks/bench_views.py --output results.json
+    python benchmarks/bench_views.py --layers 12 --heads 12 --seq-lens 128 512 --precision float16 --repeat 5
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import torch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bertviz  # noqa: E402
+from bertviz import head_view, model_view  # noqa: E402
+
+VIEWS = {'head_view': head_view, 'model_view': model_view}
+
+
+def synthetic_attention(num_layers, num_heads, seq_len, seed=0):
+    """Return a tuple of num_layers softmax attention tensors of shape (1, num_heads, seq_len, seq_len)"""
+    generator = torch.Generator().manual_seed(seed)
+    return tuple(
+        torch.softmax(torch.randn(1, num_heads, seq_len, seq_len, generator=generator) * 3, dim=-1)
+        for _ in range(num_layers)
+    )
+
+
+def warm_up(views, **kwargs):
+    """Run each view once, untimed, so that the lazy imports of its first run (e.g. IPython) are not timed"""
+    attention = synthetic_attention(1, 1, 2)
+    for view in views:
+        VIEWS[view](attention, ['tok0', 'tok1'], html_action='return', **kwargs)
+
+
+def benchmark(view, attention, tokens, repeat, **kwargs):
+    """Time a view, returning the median and minimum wall time, median stage times and output sizes"""
+    times = []
+    stages = {}
+    for _ in range(repeat):
+        # Timed without profiling, which serializes the params once more to measure their sections
+        start = time.perf_counter()
+        html = VIEWS[view](attention, tokens, html_action='return', **kwargs).data
+        times.append(time.perf_counter() - start)
+        with bertviz.profile() as prof:
+            VIEWS[view](attention, tokens, html_action='return', **kwargs)
+        for stage, seconds in prof.renders[0]['stages'].items():
+            stages.setdefault(stage, []).append(seconds)
+    return {
+        'seconds': statistics.median(times),
+        'min_seconds': min(times),
+        'stages': {stage: statistics.median(seconds) for stage, seconds in stages.items()},
+        'sizes': prof.renders[0]['sizes'],
+        'html_bytes': len(html.encode('utf-8'))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--views', nargs='+', choices=list(VIEWS), default=list(VIEWS))
+    parser.add_argument('--layers', nargs='+', type=int, default=[6, 12, 24])
+    parser.add_argument('--heads', nargs='+', type=int, default=[12])
+    parser.add_argument('--seq-lens', nargs='+', type=int, default=[32, 128, 256])
+    parser.add_argument('--precision', choices=['float32', 'float16', 'uint8', 'uint16'], default=None,
+                        help='precision passed to the views (default: nested lists)')
+    parser.add_argument('--top-k', type=int, default=None, help='top_k sparsity passed to the views')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of each configuration, of which the median is kept')
+    parser.add_argument('--output', default='benchmark_results.json', help='path of the JSON results')
+    args = parser.parse_args()
+
+    kwargs = {'precision': args.precision}
+    if args.top_k is not None:
+        kwargs['sparsity'] = {'top_k': args.top_k}
+    warm_up(args.views, **kwargs)
+    results = []
+    for num_layers in args.layers:
+        for num_heads in args.heads:
+            for seq_len in args.seq_lens:
+                attention = synthetic_attention(num_layers, num_heads, seq_len)
+                tokens = [f'tok{i}' for i in range(seq_len)]
+                for view in args.views:
+                    result = benchmark(view, attention, tokens, args.repeat, **kwargs)
+                    result.update({'view': view, 'layers': num_layers, 'heads': num_heads, 'seq_len': seq_len})
+                    results.append(result)
+                    print(f"{view:<11} L={num_layers:<3} H={num_heads:<3} N={seq_len:<5} "
+                          f"{result['seconds'] * 1000:>9.1f} ms {result['html_bytes'] / 1e6:>9.2f} MB")
+
+    output = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'torch': torch.__version__,
+            'platform': platform.platform(),
+        },
+        'options': {'precision': args.precision, 'top_k': args.top_k, 'repeat': args.repeat},
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
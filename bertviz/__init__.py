@@ -1,2 +1,6 @@
+from .assets import set_asset_mode
+from .attention_cache import clear_attention_cache, set_attention_cache
 from .head_view import head_view
-from .model_view import model_view
\ No newline at end of file
+from .model_view import model_view
+from .runtime import init_notebook
+from .profiling import profile
@@ -0,0 +1,117 @@
+"""Javascript assets of the visualizations.
+
+The libraries used by the visualizations (require.js, d3 and jQuery) are either loaded from cdnjs or inlined from the
+minified copies that ship with bertviz (in bertviz/lib), so that the visualizations also work without network access.
+Files that ship with bertviz are read through a cache (see ``read_asset``).
+"""
+
+import os
+import sys
+
+try:
+    from importlib.resources import files
+except ImportError:  # Python < 3.9
+    files = None
+
+ASSET_MODES = ('cdn', 'inline', 'once')
+
+REQUIRE_JS_URL = 'https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.7/require.min.js'
+# require.js module name -> CDN path (without .js extension), vendored copy of the same version
+LIBRARIES = {
+    'd3': ('https://cdnjs.cloudflare.com/ajax/libs/d3/5.7.0/d3.min', 'd3.min.js'),
+    'jquery': ('https://cdnjs.cloudflare.com/ajax/libs/jquery/2.2.4/jquery.min', 'jquery.min.js'),
+}
+
+PACKAGE_DIR = os.path.dirname(os.path.realpath(__file__))
+# Running from a source checkout rather than an installed package, where files may be edited between calls
+DEV_MODE = os.path.basename(os.path.dirname(PACKAGE_DIR)) not in ('site-packages', 'dist-packages')
+
+_asset_mode = 'cdn'
+_injected = False
+_asset_cache = {}  # name -> (modification time in dev mode, contents)
+
+
+def set_asset_mode(mode):
+    """Set how visualizations load the javascript libraries they depend on (require.js, d3 and jQuery)
+
+    Args:
+        mode:
+            - 'cdn' (default): Every visualization loads the libraries from cdnjs
+            - 'inline': Every visualization embeds the copies of the libraries that ship with bertviz, so no network
+                access is needed, at the cost of ~350KB per visualization
+            - 'once': The libraries are embedded in the first visualization displayed in this session only, and later
+                visualizations reuse them. If the output of that first visualization is cleared, or the notebook is
+                reloaded, call set_asset_mode('once') again before displaying more visualizations. Visualizations
+                returned with html_action='return' or saved with html_action='save' always embed the libraries, as
+                they may be displayed anywhere. In Colab, which renders the output of each cell in its own iframe,
+                later visualizations cannot reuse the libraries, so 'once' embeds them in every visualization like
+                'inline'.
+    """
+    global _asset_mode, _injected
+    if mode not in ASSET_MODES:
+        raise ValueError(f"'mode' must be one of {', '.join(repr(m) for m in ASSET_MODES)}")
+    _asset_mode = mode
+    _injected = False
+
+
+def get_asset_mode():
+    """Return the mode set by ``set_asset_mode``"""
+    return _asset_mode
+
+
+def library_assets(html_action):
+    """Return the html and javascript that load the libraries for a visualization
+
+    Args:
+        html_action: html_action of the visualization ('view', 'return' or 'save')
+
+    Returns:
+        Tuple of html to insert before the visualization (loads require.js) and javascript to prepend to the
+        visualization script (makes the 'd3' and 'jquery' modules available to require.js). Either may be empty.
+    """
+    global _injected
+    if _asset_mode == 'cdn':
+        html = f'<script src="{REQUIRE_JS_URL}"></script>'
+        paths = ''.join(f"\n        {name}: '{url}'," for name, (url, _) in LIBRARIES.items())
+        js = f"require.config({{\n    paths: {{{paths}\n    }}\n}});\n"
+        return html, js
+    if _asset_mode == 'once' and html_action == 'view' and not in_colab():
+        if _injected:
+            return '', ''
+        _injected = True
+    # require.js does not replace an AMD loader that is already on the page (e.g. in the classic notebook)
+    html = '<script type="text/javascript">\n' + read_asset('lib/require.min.js') + '\n</script>'
+    # Named modules, so that the libraries neither register anonymous modules nor overwrite the page's globals
+    js = ''.join(
+        f"define('{name}', [], function () {{\n"
+        f"var module = {{exports: {{}}}}, exports = module.exports;\n"
+        f"{read_asset('lib/' + filename)}\n"
+        f"return module.exports;\n"
+        f"}});\n"
+        for name, (_, filename) in LIBRARIES.items()
+    )
+    return html, js
+
+
+def in_colab():
+    """Return whether bertviz runs in Colab, which renders the output of each cell in its own iframe, so that scripts
+    loaded by the output of one cell are not available to the others
+    """
+    return 'google.colab' in sys.modules
+
+
+def read_asset(name):
+    """Return the contents of a text file that ships with bertviz, e.g. 'head_view.js' or 'lib/d3.min.js'
+
+    Files are read once and cached. In dev mode (running from a source checkout), they are read again if modified.
+    """
+    mtime = os.path.getmtime(os.path.join(PACKAGE_DIR, name)) if DEV_MODE else None
+    cached = _asset_cache.get(name)
+    if cached is None or cached[0] != mtime:
+        if files is None:
+            with open(os.path.join(PACKAGE_DIR, name), encoding='utf-8') as f:
+                contents = f.read()
+        else:
+            contents = files(__package__).joinpath(name).read_text(encoding='utf-8')
+        cached = _asset_cache[name] = (mtime, contents)
+    return cached[1]
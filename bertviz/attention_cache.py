@@ -0,0 +1,200 @@
+"""Cache of the attention computed by the neuron view, so that showing the same inputs again does not run the model.
+
+Entries hold the attention (and queries and keys) of one input, keyed on the model and the token ids of the input
+(see ``cache_key``). They are kept in memory, least recently used first out once they exceed a byte budget, and
+optionally in a directory on disk, which persists across sessions and has a budget of its own. The cache is disabled
+until it is given a budget with ``set_attention_cache``.
+"""
+
+import hashlib
+import os
+import weakref
+from collections import OrderedDict
+
+_max_memory_bytes = 0
+_cache_dir = None
+_max_disk_bytes = 1024 ** 3
+_memory = OrderedDict()  # key -> dictionary of 'attn', 'queries' and 'keys' tensors
+_memory_bytes = 0
+_fingerprints = weakref.WeakKeyDictionary()  # model -> (signature of its tensors, fingerprint)
+
+
+def set_attention_cache(max_memory_bytes=0, cache_dir=None, max_disk_bytes=1024 ** 3):
+    """Configure the cache of the attention computed by the neuron view (``neuron_view.show`` and ``get_attention``)
+
+    The cache is disabled by default. Weights modified in place through ``.data`` (e.g. ``weight.data.mul_(2)``) are not
+    detected (see ``model_fingerprint``): call ``clear_attention_cache`` after such edits.
+
+    Args:
+        max_memory_bytes: size of the attention kept in memory, least recently used first out, e.g. 256 * 1024 ** 2.
+            0 (default) disables the cache in memory.
+        cache_dir: directory where attention is also kept across sessions, or None (default) to keep it in memory only
+        max_disk_bytes: size of the files kept in cache_dir, least recently used first out. Defaults to 1GB.
+    """
+    global _max_memory_bytes, _cache_dir, _max_disk_bytes
+    if max_memory_bytes < 0 or max_disk_bytes < 0:
+        raise ValueError("'max_memory_bytes' and 'max_disk_bytes' must not be negative")
+    _max_memory_bytes = max_memory_bytes
+    _cache_dir = cache_dir
+    _max_disk_bytes = max_disk_bytes
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    _evict_memory()
+
+
+def clear_attention_cache():
+    """Remove all entries from the cache, in memory and on disk"""
+    global _memory_bytes
+    _memory.clear()
+    _memory_bytes = 0
+    for path in _disk_entries():
+        os.remove(path)
+
+
+def model_fingerprint(model):
+    """Return a hash of the class, parameters and buffers of a pytorch model
+
+    The hash covers the name, shape, dtype and contents of each tensor, so it is stable across sessions. It is computed
+    once per model, and again after its tensors are modified in place (e.g. by an optimizer step, or by editing some of
+    the weights under torch.no_grad()) or replaced (e.g. by ``model.half()`` or ``model.to(device)``). Tensors modified
+    in place through ``.data`` keep their version counter and storage, so such edits are not detected.
+    """
+    # Imported on use, so that importing bertviz does not load torch
+    import torch
+
+    tensors = list(model.state_dict(keep_vars=True).items())
+    # Cheap to compute: the fingerprint is only recomputed when the signature changes
+    signature = tuple((tensor._version, tensor.dtype, tensor.device, tensor.data_ptr()) for _, tensor in tensors)
+    cached = _fingerprints.get(model)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    digest = hashlib.sha256(type(model).__name__.encode())
+    for name, tensor in tensors:
+        digest.update(f'{name}:{tuple(tensor.shape)}:{tensor.dtype};'.encode())
+        # Hashed as raw bytes, which numpy supports for any dtype (e.g. bfloat16)
+        digest.update(tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy())
+    fingerprint = digest.hexdigest()
+    _fingerprints[model] = (signature, fingerprint)
+    return fingerprint
+
+
+def cache_key(model, model_type, token_ids, token_type_ids, include_queries_and_keys, autocast_dtype=None, layers=None,
+              heads=None):
+    """Return the key of the attention of one input
+
+    The key covers everything the attention depends on: the model (see ``model_fingerprint``), the token ids and token
+    type ids of the input, how the model is run and which of its layers and heads are captured. The tokenizer and
+    sentences need not be part of the key, as inputs that tokenize to the same ids have the same attention.
+    """
+    key = repr((model_fingerprint(model), model_type, list(token_ids), token_type_ids and list(token_type_ids),
+                bool(include_queries_and_keys), str(autocast_dtype), layers and list(layers), heads and list(heads)))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get(key):
+    """Return the cached tensors of key (a dictionary of 'attn' and, optionally, 'queries' and 'keys'), or None"""
+    if not is_enabled():
+        return None
+    tensors = _memory.get(key)
+    if tensors is not None:
+        _memory.move_to_end(key)
+        return tensors
+    tensors = _read(key)
+    if tensors is not None:
+        _add_to_memory(key, tensors)
+    return tensors
+
+
+def put(key, tensors):
+    """Cache tensors (a dictionary of 'attn' and, optionally, 'queries' and 'keys') under key"""
+    if not is_enabled():
+        return
+    tensors = {name: tensor.detach().float().cpu() for name, tensor in tensors.items()}
+    _add_to_memory(key, tensors)
+    _write(key, tensors)
+
+
+def is_enabled():
+    """Return whether attention is cached, in memory or on disk"""
+    return _max_memory_bytes > 0 or (_cache_dir is not None and _max_disk_bytes > 0)
+
+
+def _num_bytes(tensors):
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors.values())
+
+
+def _add_to_memory(key, tensors):
+    global _memory_bytes
+    if key in _memory:
+        _memory_bytes -= _num_bytes(_memory.pop(key))
+    _memory[key] = tensors
+    _memory_bytes += _num_bytes(tensors)
+    _evict_memory()
+
+
+def _evict_memory():
+    global _memory_bytes
+    while _memory and _memory_bytes > _max_memory_bytes:
+        _, tensors = _memory.popitem(last=False)
+        _memory_bytes -= _num_bytes(tensors)
+
+
+def _path(key):
+    return os.path.join(_cache_dir, key + '.npz')
+
+
+def _disk_entries():
+    if _cache_dir is None or not os.path.isdir(_cache_dir):
+        return []
+    return [os.path.join(_cache_dir, name) for name in os.listdir(_cache_dir) if name.endswith('.npz')]
+
+
+def _read(key):
+    # Imported on use, so that importing bertviz does not load torch
+    import numpy as np
+    import torch
+
+    if _cache_dir is None or not os.path.exists(_path(key)):
+        return None
+    try:
+        with np.load(_path(key)) as arrays:
+            tensors = {name: torch.from_numpy(arrays[name]) for name in arrays.files}
+    except (OSError, ValueError):
+        # Partially written or corrupt entry
+        os.remove(_path(key))
+        return None
+    os.utime(_path(key))  # Mark as recently used
+    return tensors
+
+
+def _write(key, tensors):
+    import numpy as np
+
+    if _cache_dir is None or _max_disk_bytes == 0:
+        return
+    # Written under a temporary name, so that readers never see a partial entry
+    temp_path = f'{_path(key)}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **{name: tensor.numpy() for name, tensor in tensors.items()})
+    os.replace(temp_path, _path(key))
+    _evict_disk()
+
+
+def _evict_disk():
+    entries = []
+    for path in _disk_entries():
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:  # Evicted by another process
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= _max_disk_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
@@ -0,0 +1,185 @@
+"""Fit the attention passed to a visualization into a byte budget.
+
+The params of a visualization are dominated by the attention weights, whose number grows with the layers and heads
+and with the square of the input length. ``fit_payload`` estimates their size for each encoding of
+``util.encode_attention`` and, if they exceed the budget, picks the most faithful reduction that fits: a smaller
+precision, then top-k sparsity, then a subset of the layers (and heads, for the model view).
+"""
+
+# Estimated size of one weight in the nested lists returned for precision=None, e.g. '0.012345678918063641, '
+LIST_BYTES_PER_WEIGHT = 22
+# Estimated size of one pixel of a PNG heatmap, after compression and base64 encoding
+HEATMAP_BYTES_PER_WEIGHT = 1
+# Sparse attention keeps at least this many weights per source position before layers or heads are dropped
+MIN_TOP_K = 8
+
+_ITEM_SIZES = {'float32': 4, 'float16': 2, 'uint8': 1, 'uint16': 2}
+
+
+def estimate_payload_bytes(shapes, num_layers, num_heads, precision=None, sparsity=None, heatmaps=False):
+    """Estimate the size of the encoded attention of a visualization
+
+    Args:
+        shapes: (source_seq_len, target_seq_len) of each attention in the visualization, or (source_seq_len,
+            target_seq_len, column_splits) if top_k applies within blocks of targets (see ``util.encode_attention``)
+        num_layers: number of layers included
+        num_heads: number of heads included in each layer
+        precision: precision (see ``util.encode_attention``)
+        sparsity: sparsity (see ``util.encode_attention``). Only 'top_k' is taken into account, so the estimate is an
+            upper bound if 'min_weight' is set.
+        heatmaps: whether the visualization includes heatmap thumbnails
+
+    Returns:
+        Estimated number of bytes
+    """
+    if sparsity is not None and precision is None:
+        precision = 'float32'
+    total = 0
+    for shape in shapes:
+        source_len, target_len = shape[:2]
+        weights = num_layers * num_heads * source_len * target_len
+        if heatmaps:
+            total += weights * HEATMAP_BYTES_PER_WEIGHT
+        if precision is None:
+            total += weights * LIST_BYTES_PER_WEIGHT
+            continue
+        if sparsity is None:
+            encoded = weights * _ITEM_SIZES[precision]
+        else:
+            bounds = [0] + list(shape[2] if len(shape) > 2 else []) + [target_len]
+            # Weights retained for each source position
+            top_k = sum(min(sparsity.get('top_k') or target_len, end - start) for start, end in zip(bounds, bounds[1:]))
+            index_size = 2 if target_len <= 65536 else 4
+            encoded = num_layers * num_heads * source_len * (top_k * (_ITEM_SIZES[precision] + index_size) + 4)
+        total += encoded * 4 // 3  # base64
+        if precision in ('uint8', 'uint16'):
+            total += num_layers * num_heads * LIST_BYTES_PER_WEIGHT  # Scales
+    return total
+
+
+def fit_payload(attn_data, layers, heads, max_payload_bytes, precision=None, sparsity=None, heatmaps=False,
+                keep_layer=None):
+    """Reduce the attention of a visualization to fit in max_payload_bytes
+
+    Reductions are tried in order until the estimated size (see ``estimate_payload_bytes``) fits:
+        1. The given precision and sparsity
+        2. precision='float16', then 'uint8' (unless sparsity is set)
+        3. precision='uint8' with the largest top_k sparsity that fits, down to MIN_TOP_K
+        4. Evenly spaced layers, then (if heads is not None) evenly spaced heads of one layer, with the smallest top_k
+
+    Args:
+        attn_data: attention filters of the visualization. The 'attn' tensors of shape (num_layers, num_heads,
+            source_seq_len, target_seq_len) are sliced in place if layers or heads are dropped.
+        layers: indices of the layers in the 'attn' tensors
+        heads: indices of the heads in the 'attn' tensors, or None if heads may not be dropped
+        max_payload_bytes: byte budget
+        precision: precision requested by the user (see ``util.encode_attention``)
+        sparsity: sparsity requested by the user (see ``util.encode_attention``)
+        heatmaps: whether the visualization includes heatmap thumbnails
+        keep_layer: index of a layer that must be kept, if any
+
+    Returns:
+        Dictionary with the precision, sparsity, layers and heads to use, the estimated size in bytes ('bytes') and a
+        message describing the reductions ('message', None if the attention fits as requested)
+    """
+    # Imported on use, so that importing bertviz does not load torch
+    from .util import column_splits
+
+    shapes = [tuple(d['attn'].shape[-2:]) + (column_splits(attn_data, i),) for i, d in enumerate(attn_data)
+              if 'attn' in d]
+    num_heads = len(heads) if heads is not None else attn_data[0]['attn'].size(1)
+
+    def plan(precision, sparsity, num_layers=len(layers), num_heads=num_heads):
+        size = estimate_payload_bytes(shapes, num_layers, num_heads, precision, sparsity, heatmaps)
+        return {'precision': precision, 'sparsity': sparsity, 'layers': layers, 'heads': heads, 'bytes': size,
+                'message': None}
+
+    requested = plan(precision, sparsity)
+    if requested['bytes'] <= max_payload_bytes:
+        return requested
+    candidates = []
+    if sparsity is None:
+        candidates += [plan(p, None) for p in ('float16', 'uint8')]
+    min_weight = {} if sparsity is None or 'min_weight' not in sparsity else {'min_weight': sparsity['min_weight']}
+    max_top_k = max(shape[1] for shape in shapes)
+    if sparsity is not None and sparsity.get('top_k'):
+        max_top_k = min(max_top_k, sparsity['top_k'])
+    min_top_k = min(MIN_TOP_K, max_top_k)
+    top_k = _largest(min_top_k, max_top_k,
+                     lambda k: plan('uint8', {'top_k': k, **min_weight})['bytes'] <= max_payload_bytes)
+    if top_k is not None:
+        candidates.append(plan('uint8', {'top_k': top_k, **min_weight}))
+    for candidate in candidates:
+        if candidate['bytes'] <= max_payload_bytes and candidate['bytes'] < requested['bytes']:
+            return _describe(candidate, requested, attn_data, max_payload_bytes)
+
+    # Drop layers, then heads
+    sparsity = {'top_k': min_top_k, **min_weight}
+    num_layers = _largest(1, len(layers), lambda n: plan('uint8', sparsity, n)['bytes'] <= max_payload_bytes)
+    if num_layers is not None:
+        candidate = plan('uint8', sparsity, num_layers)
+        candidate['layers'] = _evenly_spaced(layers, num_layers, keep_layer)
+        return _describe(candidate, requested, attn_data, max_payload_bytes)
+    if heads is not None:
+        num_heads = _largest(1, len(heads), lambda n: plan('uint8', sparsity, 1, n)['bytes'] <= max_payload_bytes)
+        if num_heads is not None:
+            candidate = plan('uint8', sparsity, 1, num_heads)
+            candidate['layers'] = _evenly_spaced(layers, 1, keep_layer)
+            candidate['heads'] = _evenly_spaced(heads, num_heads)
+            return _describe(candidate, requested, attn_data, max_payload_bytes)
+    raise ValueError(f"Attention does not fit in max_payload_bytes={max_payload_bytes}, even for a single "
+                     f"{'head' if heads is not None else 'layer'} with precision='uint8' and top_k={min_top_k}. "
+                     f"Please use a shorter input.")
+
+
+def _describe(candidate, requested, attn_data, max_payload_bytes):
+    # Slice the attention to the planned layers and heads, and describe the changes from the request
+    layers, heads = candidate['layers'], candidate['heads']
+    changes = []
+    if candidate['precision'] != requested['precision']:
+        changes.append(f"precision='{candidate['precision']}'")
+    if candidate['sparsity'] != requested['sparsity']:
+        changes.append(f"top_k={candidate['sparsity']['top_k']}")
+    if layers != requested['layers'] or heads != requested['heads']:
+        layer_positions = [requested['layers'].index(layer) for layer in layers]
+        head_positions = slice(None) if heads is None else [requested['heads'].index(head) for head in heads]
+        for d in attn_data:
+            if 'attn' in d:
+                d['attn'] = d['attn'][layer_positions][:, head_positions]
+        changes.append(f"layers {', '.join(str(layer) for layer in layers)}")
+        if heads != requested['heads']:
+            changes.append(f"heads {', '.join(str(head) for head in heads)}")
+    candidate['message'] = (f"Attention reduced to fit in {_format_bytes(max_payload_bytes)} (estimated "
+                            f"{_format_bytes(requested['bytes'])}): {', '.join(changes)}")
+    return candidate
+
+
+def _largest(low, high, fits):
+    # Largest n in [low, high] for which fits(n), assuming that fits(n) implies fits(m) for m < n, or None
+    if high < low or not fits(low):
+        return None
+    while low < high:
+        mid = (low + high + 1) // 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _evenly_spaced(indices, n, keep=None):
+    # n of the indices, spread evenly from first to last, including keep (if not None)
+    if n == 1:
+        return [keep if keep is not None else indices[0]]
+    positions = [round(i * (len(indices) - 1) / (n - 1)) for i in range(n)]
+    selected = [indices[p] for p in positions]
+    if keep is not None and keep not in selected:
+        # Replace the closest selected index
+        keep_position = indices.index(keep)
+        closest = min(range(n), key=lambda i: abs(positions[i] - keep_position))
+        selected[closest] = keep
+    return selected
+
+
+def _format_bytes(num_bytes):
+    return f'{num_bytes / 1e6:.1f} MB' if num_bytes >= 1e6 else f'{num_bytes / 1e3:.0f} kB'
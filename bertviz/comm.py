@@ -0,0 +1,76 @@
+"""Serve attention to visualizations on demand over a Jupyter comm channel.
+
+Views rendered with lazy loading keep their formatted attention in the kernel, and the javascript requests layers
+(through the 'bertviz' comm target) as they are needed.
+"""
+
+from collections import OrderedDict
+
+from .util import encode_attention
+
+TARGET_NAME = 'bertviz'
+MAX_VIEWS = 32  # Attention is kept for the most recently rendered views only
+
+_views = OrderedDict()
+_registered_kernel = None
+
+
+def serve_attention(vis_id, filter_index, attention, precision=None, sparsity=None, column_splits=None):
+    """Keep attention in the kernel so that its layers may be requested by the visualization
+
+    Args:
+        vis_id: id of the root div of the visualization
+        filter_index: index of the attention filter in the visualization params
+        attention: tensor of shape (num_layers, num_heads, source_seq_len, target_seq_len)
+        precision: precision used to encode requested layers (see ``util.encode_attention``). Defaults to 'float32'.
+        sparsity: sparsity used to encode requested layers (see ``util.encode_attention``)
+        column_splits: blocks within which sparsity applies (see ``util.encode_attention``)
+
+    Returns:
+        Placeholder for the encoded attention, with the layers to be filled in by the visualization as they arrive
+    """
+    _register_target()
+    if precision is None:
+        precision = 'float32'
+    _views.setdefault(vis_id, {})[filter_index] = (attention, precision, sparsity, column_splits)
+    _views.move_to_end(vis_id)
+    while len(_views) > MAX_VIEWS:
+        _views.popitem(last=False)
+    return {
+        'dtype': precision,
+        'shape': list(attention.shape),
+        'layers': [None] * attention.size(0),
+        'lazy': True
+    }
+
+
+def _register_target():
+    global _registered_kernel
+    from IPython import get_ipython
+    ipython = get_ipython()
+    kernel = getattr(ipython, 'kernel', None)
+    if kernel is None:
+        raise RuntimeError("Lazy loading of attention requires a running Jupyter kernel")
+    if kernel is not _registered_kernel:
+        kernel.comm_manager.register_target(TARGET_NAME, _open_comm)
+        _registered_kernel = kernel
+
+
+def _open_comm(comm, open_msg):
+    vis_id = open_msg['content']['data']['vis_id']
+
+    @comm.on_msg
+    def _on_msg(msg):
+        request = msg['content']['data']
+        view = _views.get(vis_id)
+        if view is None or request['filter'] not in view:
+            comm.send({'error': "Attention is no longer available in the kernel. Please re-run the cell."})
+            return
+        attention, precision, sparsity, column_splits = view[request['filter']]
+        comm.send({
+            'filter': request['filter'],
+            'layers': [
+                [layer, encode_attention(attention[layer:layer + 1], precision, sparsity, column_splits)]
+                for layer in request['layers']
+            ]
+        })
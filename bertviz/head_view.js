@@ -15,360 +15,463 @@
  * 03/23/22  Daniel SC   Update requirement URLs for d3 and jQuery (source of bug not allowing end result to be displayed on browsers)
  **/
 
-require.config({
-  paths: {
-      d3: 'https://cdnjs.cloudflare.com/ajax/libs/d3/5.7.0/d3.min',
-    jquery: 'https://cdnjs.cloudflare.com/ajax/libs/jquery/2.0.0/jquery.min',
-  }
-});
-
-requirejs(['jquery', 'd3'], function ($, d3) {
-
-    const params = PYTHON_PARAMS; // HACK: PYTHON_PARAMS is a template marker that is replaced by actual params.
-    const TEXT_SIZE = 15;
-    const BOXWIDTH = 110;
-    const BOXHEIGHT = 22.5;
-    const MATRIX_WIDTH = 115;
-    const CHECKBOX_SIZE = 20;
-    const TEXT_TOP = 30;
-
-    console.log("d3 version", d3.version)
-    let headColors;
-    try {
-        headColors = d3.scaleOrdinal(d3.schemeCategory10);
-    } catch (err) {
-        console.log('Older d3 version')
-        headColors = d3.scale.category10();
-    }
-    let config = {};
-    initialize();
-    renderVis();
-
-    function initialize() {
-        config.attention = params['attention'];
-        config.filter = params['default_filter'];
-        config.rootDivId = params['root_div_id'];
-        config.nLayers = config.attention[config.filter]['attn'].length;
-        config.nHeads = config.attention[config.filter]['attn'][0].length;
-        config.layers = params['include_layers']
-
-        if (params['heads']) {
-            config.headVis = new Array(config.nHeads).fill(false);
-            params['heads'].forEach(x => config.headVis[x] = true);
-        } else {
-            config.headVis = new Array(config.nHeads).fill(true);
+define('bertviz/head_view', ['jquery', 'd3'], function ($, d3) {
+
+    // Returns a function that renders the visualization with the params passed from Python
+    return function (params) {
+
+        const TEXT_SIZE = 15;
+        const BOXWIDTH = 110;
+        const BOXHEIGHT = 22.5;
+        const MATRIX_WIDTH = 115;
+        const CHECKBOX_SIZE = 20;
+        const TEXT_TOP = 30;
+
+        console.log("d3 version", d3.version)
+        let headColors;
+        try {
+            headColors = d3.scaleOrdinal(d3.schemeCategory10);
+        } catch (err) {
+            console.log('Older d3 version')
+            headColors = d3.scale.category10();
         }
-        config.initialTextLength = config.attention[config.filter].right_text.length;
-        config.layer_seq = (params['layer'] == null ? 0 : config.layers.findIndex(layer => params['layer'] === layer));
-        config.layer = config.layers[config.layer_seq]
+        let config = {};
+        initialize();
+        renderVis();
+
+        function initialize() {
+            config.attention = decodeAttentionData(params['attention']);
+            config.filter = params['default_filter'];
+            config.rootDivId = params['root_div_id'];
+            config.renderer = params['renderer'];
+            config.nLayers = config.attention[config.filter]['attn'].length;
+            config.nHeads = config.attention[config.filter]['attn'][0].length;
+            config.layers = params['include_layers']
+
+            if (params['heads']) {
+                config.headVis = new Array(config.nHeads).fill(false);
+                params['heads'].forEach(x => config.headVis[x] = true);
+            } else {
+                config.headVis = new Array(config.nHeads).fill(true);
+            }
+            config.initialTextLength = config.attention[config.filter].right_text.length;
+            config.layer_seq = (params['layer'] == null ? 0 : config.layers.findIndex(layer => params['layer'] === layer));
+            config.layer = config.layers[config.layer_seq]
 
-        let layerEl = $(`#${config.rootDivId} #layer`);
-        for (const layer of config.layers) {
-            layerEl.append($("<option />").val(layer).text(layer));
-        }
-        layerEl.val(config.layer).change();
-        layerEl.on('change', function (e) {
-            config.layer = +e.currentTarget.value;
-            config.layer_seq = config.layers.findIndex(layer => config.layer === layer);
-            renderVis();
-        });
-
-        $(`#${config.rootDivId} #filter`).on('change', function (e) {
-            config.filter = e.currentTarget.value;
-            renderVis();
-        });
-    }
-
-    function renderVis() {
-
-        // Load parameters
-        const attnData = config.attention[config.filter];
-        const leftText = attnData.left_text;
-        const rightText = attnData.right_text;
-
-        // Select attention for given layer
-        const layerAttention = attnData.attn[config.layer_seq];
-
-        // Clear vis
-        $(`#${config.rootDivId} #vis`).empty();
-
-        // Determine size of visualization
-        const height = Math.max(leftText.length, rightText.length) * BOXHEIGHT + TEXT_TOP;
-        const svg = d3.select(`#${config.rootDivId} #vis`)
-            .append('svg')
-            .attr("width", "100%")
-            .attr("height", height + "px");
-
-        // Display tokens on left and right side of visualization
-        renderText(svg, leftText, true, layerAttention, 0);
-        renderText(svg, rightText, false, layerAttention, MATRIX_WIDTH + BOXWIDTH);
-
-        // Render attention arcs
-        renderAttention(svg, layerAttention);
-
-        // Draw squares at top of visualization, one for each head
-        drawCheckboxes(0, svg, layerAttention);
-    }
-
-    function renderText(svg, text, isLeft, attention, leftPos) {
-
-        const textContainer = svg.append("svg:g")
-            .attr("id", isLeft ? "left" : "right");
-
-        // Add attention highlights superimposed over words
-        textContainer.append("g")
-            .classed("attentionBoxes", true)
-            .selectAll("g")
-            .data(attention)
-            .enter()
-            .append("g")
-            .attr("head-index", (d, i) => i)
-            .selectAll("rect")
-            .data(d => isLeft ? d : transpose(d)) // if right text, transpose attention to get right-to-left weights
-            .enter()
-            .append("rect")
-            .attr("x", function () {
-                var headIndex = +this.parentNode.getAttribute("head-index");
-                return leftPos + boxOffsets(headIndex);
-            })
-            .attr("y", (+1) * BOXHEIGHT)
-            .attr("width", BOXWIDTH / activeHeads())
-            .attr("height", BOXHEIGHT)
-            .attr("fill", function () {
-                return headColors(+this.parentNode.getAttribute("head-index"))
-            })
-            .style("opacity", 0.0);
-
-        const tokenContainer = textContainer.append("g").selectAll("g")
-            .data(text)
-            .enter()
-            .append("g");
-
-        // Add gray background that appears when hovering over text
-        tokenContainer.append("rect")
-            .classed("background", true)
-            .style("opacity", 0.0)
-            .attr("fill", "lightgray")
-            .attr("x", leftPos)
-            .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT)
-            .attr("width", BOXWIDTH)
-            .attr("height", BOXHEIGHT);
-
-        // Add token text
-        const textEl = tokenContainer.append("text")
-            .text(d => d)
-            .attr("font-size", TEXT_SIZE + "px")
-            .style("cursor", "default")
-            .style("-webkit-user-select", "none")
-            .attr("x", leftPos)
-            .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT);
-
-        if (isLeft) {
-            textEl.style("text-anchor", "end")
-                .attr("dx", BOXWIDTH - 0.5 * TEXT_SIZE)
-                .attr("dy", TEXT_SIZE);
-        } else {
-            textEl.style("text-anchor", "start")
-                .attr("dx", +0.5 * TEXT_SIZE)
-                .attr("dy", TEXT_SIZE);
+            let layerEl = $(`#${config.rootDivId} #layer`);
+            for (const layer of config.layers) {
+                layerEl.append($("<option />").val(layer).text(layer));
+            }
+            layerEl.val(config.layer).change();
+            layerEl.on('change', function (e) {
+                config.layer = +e.currentTarget.value;
+                config.layer_seq = config.layers.findIndex(layer => config.layer === layer);
+                renderVis();
+            });
+
+            $(`#${config.rootDivId} #filter`).on('change', function (e) {
+                config.filter = e.currentTarget.value;
+                renderVis();
+            });
         }
 
-        tokenContainer.on("mouseover", function (d, index) {
+        function renderVis() {
 
-            // Show gray background for moused-over token
-            textContainer.selectAll(".background")
-                .style("opacity", (d, i) => i === index ? 1.0 : 0.0)
+            // Load parameters
+            const attnData = config.attention[config.filter];
+            const leftText = attnData.left_text;
+            const rightText = attnData.right_text;
 
-            // Reset visibility attribute for any previously highlighted attention arcs
-            svg.select("#attention")
-                .selectAll("line[visibility='visible']")
-                .attr("visibility", null)
+            // Select attention for given layer
+            const layerAttention = attnData.attn[config.layer_seq];
 
-            // Hide group containing attention arcs
-            svg.select("#attention").attr("visibility", "hidden");
+            // Clear vis
+            $(`#${config.rootDivId} #vis`).empty();
 
-            // Set to visible appropriate attention arcs to be highlighted
-            if (isLeft) {
-                svg.select("#attention").selectAll("line[left-token-index='" + index + "']").attr("visibility", "visible");
-            } else {
-                svg.select("#attention").selectAll("line[right-token-index='" + index + "']").attr("visibility", "visible");
-            }
+            // Determine size of visualization
+            const height = Math.max(leftText.length, rightText.length) * BOXHEIGHT + TEXT_TOP;
+            config.visHeight = height;
+            const svg = d3.select(`#${config.rootDivId} #vis`)
+                .style("position", "relative") // Container for canvas renderer
+                .append('svg')
+                .attr("width", "100%")
+                .attr("height", height + "px")
+                .style("position", "relative"); // Paint over canvas renderer
+
+            // Display tokens on left and right side of visualization
+            renderText(svg, leftText, true, layerAttention, 0);
+            renderText(svg, rightText, false, layerAttention, MATRIX_WIDTH + BOXWIDTH);
+
+            // Render attention arcs
+            renderAttention(svg, layerAttention);
+
+            // Draw squares at top of visualization, one for each head
+            drawCheckboxes(0, svg, layerAttention);
+        }
 
-            // Update color boxes superimposed over tokens
-            const id = isLeft ? "right" : "left";
-            const leftPos = isLeft ? MATRIX_WIDTH + BOXWIDTH : 0;
-            svg.select("#" + id)
-                .selectAll(".attentionBoxes")
+        function renderText(svg, text, isLeft, attention, leftPos) {
+
+            const textContainer = svg.append("svg:g")
+                .attr("id", isLeft ? "left" : "right");
+
+            // Add attention highlights superimposed over words
+            textContainer.append("g")
+                .classed("attentionBoxes", true)
                 .selectAll("g")
+                .data(attention)
+                .enter()
+                .append("g")
                 .attr("head-index", (d, i) => i)
                 .selectAll("rect")
+                .data(d => isLeft ? d : transpose(d)) // if right text, transpose attention to get right-to-left weights
+                .enter()
+                .append("rect")
                 .attr("x", function () {
-                    const headIndex = +this.parentNode.getAttribute("head-index");
+                    var headIndex = +this.parentNode.getAttribute("head-index");
                     return leftPos + boxOffsets(headIndex);
                 })
-                .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT)
+                .attr("y", (+1) * BOXHEIGHT)
                 .attr("width", BOXWIDTH / activeHeads())
                 .attr("height", BOXHEIGHT)
-                .style("opacity", function (d) {
-                    const headIndex = +this.parentNode.getAttribute("head-index");
-                    if (config.headVis[headIndex])
-                        if (d) {
-                            return d[index];
-                        } else {
+                .attr("fill", function () {
+                    return headColors(+this.parentNode.getAttribute("head-index"))
+                })
+                .style("opacity", 0.0);
+
+            const tokenContainer = textContainer.append("g").selectAll("g")
+                .data(text)
+                .enter()
+                .append("g");
+
+            // Add gray background that appears when hovering over text
+            tokenContainer.append("rect")
+                .classed("background", true)
+                .style("opacity", 0.0)
+                .attr("fill", "lightgray")
+                .attr("x", leftPos)
+                .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT)
+                .attr("width", BOXWIDTH)
+                .attr("height", BOXHEIGHT);
+
+            // Add token text
+            const textEl = tokenContainer.append("text")
+                .text(d => d)
+                .attr("font-size", TEXT_SIZE + "px")
+                .style("cursor", "default")
+                .style("-webkit-user-select", "none")
+                .attr("x", leftPos)
+                .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT);
+
+            if (isLeft) {
+                textEl.style("text-anchor", "end")
+                    .attr("dx", BOXWIDTH - 0.5 * TEXT_SIZE)
+                    .attr("dy", TEXT_SIZE);
+            } else {
+                textEl.style("text-anchor", "start")
+                    .attr("dx", +0.5 * TEXT_SIZE)
+                    .attr("dy", TEXT_SIZE);
+            }
+
+            tokenContainer.on("mouseover", function (d, index) {
+
+                // Show gray background for moused-over token
+                textContainer.selectAll(".background")
+                    .style("opacity", (d, i) => i === index ? 1.0 : 0.0)
+
+                if (config.renderer === 'canvas') {
+                    drawTokenAttentionCanvas(index, isLeft);
+                } else {
+                    // Reset visibility attribute for any previously highlighted attention arcs
+                    svg.select("#attention")
+                        .selectAll("line[visibility='visible']")
+                        .attr("visibility", null)
+
+                    // Hide group containing attention arcs
+                    svg.select("#attention").attr("visibility", "hidden");
+
+                    // Set to visible appropriate attention arcs to be highlighted
+                    if (isLeft) {
+                        svg.select("#attention").selectAll("line[left-token-index='" + index + "']").attr("visibility", "visible");
+                    } else {
+                        svg.select("#attention").selectAll("line[right-token-index='" + index + "']").attr("visibility", "visible");
+                    }
+                }
+
+                // Update color boxes superimposed over tokens
+                const id = isLeft ? "right" : "left";
+                const leftPos = isLeft ? MATRIX_WIDTH + BOXWIDTH : 0;
+                svg.select("#" + id)
+                    .selectAll(".attentionBoxes")
+                    .selectAll("g")
+                    .attr("head-index", (d, i) => i)
+                    .selectAll("rect")
+                    .attr("x", function () {
+                        const headIndex = +this.parentNode.getAttribute("head-index");
+                        return leftPos + boxOffsets(headIndex);
+                    })
+                    .attr("y", (d, i) => TEXT_TOP + i * BOXHEIGHT)
+                    .attr("width", BOXWIDTH / activeHeads())
+                    .attr("height", BOXHEIGHT)
+                    .style("opacity", function (d) {
+                        const headIndex = +this.parentNode.getAttribute("head-index");
+                        if (config.headVis[headIndex])
+                            if (d) {
+                                return attentionWeight(d, index);
+                            } else {
+                                return 0.0;
+                            }
+                        else
                             return 0.0;
-                        }
-                    else
+                    });
+            });
+
+            textContainer.on("mouseleave", function () {
+
+                // Unhighlight selected token
+                d3.select(this).selectAll(".background")
+                    .style("opacity", 0.0);
+
+                // Reset visibility attributes for previously selected lines
+                if (config.renderer === 'canvas') {
+                    compositeAttentionCanvas();
+                } else {
+                    svg.select("#attention")
+                        .selectAll("line[visibility='visible']")
+                        .attr("visibility", null) ;
+                    svg.select("#attention").attr("visibility", "visible");
+                }
+
+                // Reset highlights superimposed over tokens
+                svg.selectAll(".attentionBoxes")
+                    .selectAll("g")
+                    .selectAll("rect")
+                    .style("opacity", 0.0);
+            });
+        }
+
+        function renderAttention(svg, attention) {
+
+            if (config.renderer === 'canvas') {
+                renderAttentionCanvas(attention, config.visHeight);
+                return;
+            }
+
+            // Remove previous dom elements
+            svg.select("#attention").remove();
+
+            // Add new elements
+            svg.append("g")
+                .attr("id", "attention") // Container for all attention arcs
+                .selectAll(".headAttention")
+                .data(attention)
+                .enter()
+                .append("g")
+                .classed("headAttention", true) // Group attention arcs by head
+                .attr("head-index", (d, i) => i)
+                .selectAll(".tokenAttention")
+                .data(d => d)
+                .enter()
+                .append("g")
+                .classed("tokenAttention", true) // Group attention arcs by left token
+                .attr("left-token-index", (d, i) => i)
+                .selectAll("line")
+                .data(d => attentionEdges(d)) // [right token index, weight] pairs
+                .enter()
+                .append("line")
+                .attr("x1", BOXWIDTH)
+                .attr("y1", function () {
+                    const leftTokenIndex = +this.parentNode.getAttribute("left-token-index")
+                    return TEXT_TOP + leftTokenIndex * BOXHEIGHT + (BOXHEIGHT / 2)
+                })
+                .attr("x2", BOXWIDTH + MATRIX_WIDTH)
+                .attr("y2", d => TEXT_TOP + d[0] * BOXHEIGHT + (BOXHEIGHT / 2))
+                .attr("stroke-width", 2)
+                .attr("stroke", function () {
+                    const headIndex = +this.parentNode.parentNode.getAttribute("head-index");
+                    return headColors(headIndex)
+                })
+                .attr("left-token-index", function () {
+                    return +this.parentNode.getAttribute("left-token-index")
+                })
+                .attr("right-token-index", d => d[0])
+            ;
+            updateAttention(svg)
+        }
+
+        function updateAttention(svg) {
+            if (config.renderer === 'canvas') {
+                compositeAttentionCanvas();
+                return;
+            }
+            svg.select("#attention")
+                .selectAll("line")
+                .attr("stroke-opacity", function (d) {
+                    const headIndex = +this.parentNode.parentNode.getAttribute("head-index");
+                    // If head is selected
+                    if (config.headVis[headIndex]) {
+                        // Set opacity to attention weight divided by number of active heads
+                        return d[1] / activeHeads()
+                    } else {
                         return 0.0;
+                    }
+                })
+        }
+
+        function renderAttentionCanvas(attention, height) {
+            // Lines are drawn into a canvas underneath the svg, between the left and right tokens
+            const ratio = window.devicePixelRatio || 1;
+            const canvas = $("<canvas />")
+                .attr("width", Math.ceil(MATRIX_WIDTH * ratio))
+                .attr("height", Math.ceil(height * ratio))
+                .css({
+                    "position": "absolute",
+                    "left": BOXWIDTH + "px",
+                    "top": 0,
+                    "width": MATRIX_WIDTH + "px",
+                    "height": height + "px"
                 });
-        });
+            $(`#${config.rootDivId} #vis`).prepend(canvas);
+            config.canvas = {
+                context: canvas[0].getContext("2d"),
+                attention: attention,
+                height: height,
+                ratio: ratio,
+                heads: new Array(attention.length).fill(null) // Offscreen canvas for each head, drawn on first use
+            };
+            config.canvas.context.scale(ratio, ratio);
+            compositeAttentionCanvas();
+        }
 
-        textContainer.on("mouseleave", function () {
+        function headCanvas(headIndex) {
+            // All lines of a head, drawn once per layer so that toggling heads only needs to composite them
+            if (config.canvas.heads[headIndex] == null) {
+                const canvas = document.createElement("canvas");
+                canvas.width = Math.ceil(MATRIX_WIDTH * config.canvas.ratio);
+                canvas.height = Math.ceil(config.canvas.height * config.canvas.ratio);
+                const context = canvas.getContext("2d");
+                context.scale(config.canvas.ratio, config.canvas.ratio);
+                drawAttentionLines(context, headIndex, 1, null, null);
+                config.canvas.heads[headIndex] = canvas;
+            }
+            return config.canvas.heads[headIndex];
+        }
 
-            // Unhighlight selected token
-            d3.select(this).selectAll(".background")
-                .style("opacity", 0.0);
+        function compositeAttentionCanvas() {
+            const context = config.canvas.context;
+            context.clearRect(0, 0, MATRIX_WIDTH, config.canvas.height);
+            context.globalAlpha = 1 / activeHeads();
+            config.headVis.forEach(function (visible, headIndex) {
+                if (visible) {
+                    context.drawImage(headCanvas(headIndex), 0, 0, MATRIX_WIDTH, config.canvas.height);
+                }
+            });
+        }
 
-            // Reset visibility attributes for previously selected lines
-            svg.select("#attention")
-                .selectAll("line[visibility='visible']")
-                .attr("visibility", null) ;
-            svg.select("#attention").attr("visibility", "visible");
+        function drawTokenAttentionCanvas(index, isLeft) {
+            // Only draw the lines to/from the token under the mouse
+            const context = config.canvas.context;
+            context.clearRect(0, 0, MATRIX_WIDTH, config.canvas.height);
+            config.headVis.forEach(function (visible, headIndex) {
+                if (visible) {
+                    drawAttentionLines(context, headIndex, 1 / activeHeads(), isLeft ? index : null, isLeft ? null : index);
+                }
+            });
+        }
 
-            // Reset highlights superimposed over tokens
-            svg.selectAll(".attentionBoxes")
-                .selectAll("g")
-                .selectAll("rect")
-                .style("opacity", 0.0);
-        });
-    }
-
-    function renderAttention(svg, attention) {
-
-        // Remove previous dom elements
-        svg.select("#attention").remove();
-
-        // Add new elements
-        svg.append("g")
-            .attr("id", "attention") // Container for all attention arcs
-            .selectAll(".headAttention")
-            .data(attention)
-            .enter()
-            .append("g")
-            .classed("headAttention", true) // Group attention arcs by head
-            .attr("head-index", (d, i) => i)
-            .selectAll(".tokenAttention")
-            .data(d => d)
-            .enter()
-            .append("g")
-            .classed("tokenAttention", true) // Group attention arcs by left token
-            .attr("left-token-index", (d, i) => i)
-            .selectAll("line")
-            .data(d => d)
-            .enter()
-            .append("line")
-            .attr("x1", BOXWIDTH)
-            .attr("y1", function () {
-                const leftTokenIndex = +this.parentNode.getAttribute("left-token-index")
-                return TEXT_TOP + leftTokenIndex * BOXHEIGHT + (BOXHEIGHT / 2)
-            })
-            .attr("x2", BOXWIDTH + MATRIX_WIDTH)
-            .attr("y2", (d, rightTokenIndex) => TEXT_TOP + rightTokenIndex * BOXHEIGHT + (BOXHEIGHT / 2))
-            .attr("stroke-width", 2)
-            .attr("stroke", function () {
-                const headIndex = +this.parentNode.parentNode.getAttribute("head-index");
-                return headColors(headIndex)
-            })
-            .attr("left-token-index", function () {
-                return +this.parentNode.getAttribute("left-token-index")
-            })
-            .attr("right-token-index", (d, i) => i)
-        ;
-        updateAttention(svg)
-    }
-
-    function updateAttention(svg) {
-        svg.select("#attention")
-            .selectAll("line")
-            .attr("stroke-opacity", function (d) {
-                const headIndex = +this.parentNode.parentNode.getAttribute("head-index");
-                // If head is selected
-                if (config.headVis[headIndex]) {
-                    // Set opacity to attention weight divided by number of active heads
-                    return d / activeHeads()
-                } else {
-                    return 0.0;
+        function drawAttentionLines(context, headIndex, opacityScale, leftTokenIndex, rightTokenIndex) {
+            const headAttention = config.canvas.attention[headIndex];
+            context.strokeStyle = headColors(headIndex);
+            context.lineWidth = 2;
+            for (let i = 0; i < headAttention.length; i++) {
+                if (leftTokenIndex != null && i !== leftTokenIndex) {
+                    continue;
                 }
-            })
-    }
+                const y1 = TEXT_TOP + i * BOXHEIGHT + (BOXHEIGHT / 2);
+                for (const [j, weight] of attentionEdges(headAttention[i])) {
+                    if (rightTokenIndex != null && j !== rightTokenIndex) {
+                        continue;
+                    }
+                    context.globalAlpha = weight * opacityScale;
+                    context.beginPath();
+                    context.moveTo(0, y1);
+                    context.lineTo(MATRIX_WIDTH, TEXT_TOP + j * BOXHEIGHT + (BOXHEIGHT / 2));
+                    context.stroke();
+                }
+            }
+        }
 
-    function boxOffsets(i) {
-        const numHeadsAbove = config.headVis.reduce(
-            function (acc, val, cur) {
-                return val && cur < i ? acc + 1 : acc;
+        function boxOffsets(i) {
+            const numHeadsAbove = config.headVis.reduce(
+                function (acc, val, cur) {
+                    return val && cur < i ? acc + 1 : acc;
+                }, 0);
+            return numHeadsAbove * (BOXWIDTH / activeHeads());
+        }
+
+        function activeHeads() {
+            return config.headVis.reduce(function (acc, val) {
+                return val ? acc + 1 : acc;
             }, 0);
-        return numHeadsAbove * (BOXWIDTH / activeHeads());
-    }
-
-    function activeHeads() {
-        return config.headVis.reduce(function (acc, val) {
-            return val ? acc + 1 : acc;
-        }, 0);
-    }
-
-    function drawCheckboxes(top, svg) {
-        const checkboxContainer = svg.append("g");
-        const checkbox = checkboxContainer.selectAll("rect")
-            .data(config.headVis)
-            .enter()
-            .append("rect")
-            .attr("fill", (d, i) => headColors(i))
-            .attr("x", (d, i) => i * CHECKBOX_SIZE)
-            .attr("y", top)
-            .attr("width", CHECKBOX_SIZE)
-            .attr("height", CHECKBOX_SIZE);
-
-        function updateCheckboxes() {
-            checkboxContainer.selectAll("rect")
-                .data(config.headVis)
-                .attr("fill", (d, i) => d ? headColors(i): lighten(headColors(i)));
         }
 
-        updateCheckboxes();
+        function drawCheckboxes(top, svg) {
+            const checkboxContainer = svg.append("g");
+            const checkbox = checkboxContainer.selectAll("rect")
+                .data(config.headVis)
+                .enter()
+                .append("rect")
+                .attr("fill", (d, i) => headColors(i))
+                .attr("x", (d, i) => i * CHECKBOX_SIZE)
+                .attr("y", top)
+                .attr("width", CHECKBOX_SIZE)
+                .attr("height", CHECKBOX_SIZE);
+
+            function updateCheckboxes() {
+                checkboxContainer.selectAll("rect")
+                    .data(config.headVis)
+                    .attr("fill", (d, i) => d ? headColors(i): lighten(headColors(i)));
+            }
 
-        checkbox.on("click", function (d, i) {
-            if (config.headVis[i] && activeHeads() === 1) return;
-            config.headVis[i] = !config.headVis[i];
             updateCheckboxes();
-            updateAttention(svg);
-        });
 
-        checkbox.on("dblclick", function (d, i) {
-            // If we double click on the only active head then reset
-            if (config.headVis[i] && activeHeads() === 1) {
-                config.headVis = new Array(config.nHeads).fill(true);
-            } else {
-                config.headVis = new Array(config.nHeads).fill(false);
-                config.headVis[i] = true;
-            }
-            updateCheckboxes();
-            updateAttention(svg);
-        });
-    }
-
-    function lighten(color) {
-        const c = d3.hsl(color);
-        const increment = (1 - c.l) * 0.6;
-        c.l += increment;
-        c.s -= increment;
-        return c;
-    }
-
-    function transpose(mat) {
-        return mat[0].map(function (col, i) {
-            return mat.map(function (row) {
-                return row[i];
+            checkbox.on("click", function (d, i) {
+                if (config.headVis[i] && activeHeads() === 1) return;
+                config.headVis[i] = !config.headVis[i];
+                updateCheckboxes();
+                updateAttention(svg);
             });
-        });
-    }
 
-});
\ No newline at end of file
+            checkbox.on("dblclick", function (d, i) {
+                // If we double click on the only active head then reset
+                if (config.headVis[i] && activeHeads() === 1) {
+                    config.headVis = new Array(config.nHeads).fill(true);
+                } else {
+                    config.headVis = new Array(config.nHeads).fill(false);
+                    config.headVis[i] = true;
+                }
+                updateCheckboxes();
+                updateAttention(svg);
+            });
+        }
+
+        function lighten(color) {
+            const c = d3.hsl(color);
+            const increment = (1 - c.l) * 0.6;
+            c.l += increment;
+            c.s -= increment;
+            return c;
+        }
+
+        function transpose(mat) {
+            // Dense target -> source weights, filled from the weights of each source row that were kept
+            const transposed = Array.from({length: mat[0].length}, () => new Float32Array(mat.length));
+            mat.forEach(function (row, i) {
+                for (const [j, weight] of attentionEdges(row)) {
+                    transposed[j][i] = weight;
+                }
+            });
+            return transposed;
+        }
+
+    };
+});
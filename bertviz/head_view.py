@@ -1,10 +1,8 @@
-import json
-import os
+import html
 import uuid
 
-from IPython.display import display, HTML, Javascript
-
-from .util import format_special_chars, format_attention, num_layers
+from . import profiling
+from .runtime import view_assets, view_html, save_view_html
 
 
 def head_view(
@@ -20,16 +18,28 @@ def head_view(
         encoder_tokens=None,
         decoder_tokens=None,
         include_layers=None,
-        html_action='view'
+        html_action='view',
+        precision=None,
+        sparsity=None,
+        renderer='svg',
+        html_file=None,
+        batch_index=None,
+        attention_mask=None,
+        max_payload_bytes=None
 ):
     """Render head view
 
         Args:
             For self-attention models:
                 attention: list of ``torch.FloatTensor``(one for each layer) of shape
-                    ``(batch_size(must be 1), num_heads, sequence_length, sequence_length)``
-                tokens: list of tokens
-                sentence_b_start: index of first wordpiece in sentence B if input text is sentence pair (optional)
+                    ``(batch_size, num_heads, sequence_length, sequence_length)``
+                tokens: list of tokens, or list of lists of tokens (one for each example in the batch)
+                sentence_b_start: index of first wordpiece in sentence B if input text is sentence pair (optional). For
+                    several examples, may be a list with one index for each example in batch_index.
+                batch_index: index of the example to visualize if batch_size > 1, or list of indices to show several
+                    examples in one visualization, selected from the attention dropdown (optional)
+                attention_mask: tensor of shape ``(batch_size, sequence_length)`` that is 0 for padded positions, which
+                    are removed from the visualization (optional). sentence_b_start ignores padding.
             For encoder-decoder models:
                 encoder_attention: list of ``torch.FloatTensor``(one for each layer) of shape
                     ``(batch_size(must be 1), num_heads, encoder_sequence_length, encoder_sequence_length)``
@@ -48,8 +58,36 @@ def head_view(
                 html_action: Specifies the action to be performed with the generated HTML object
                     - 'view' (default): Displays the generated HTML representation as a notebook cell output
                     - 'return' : Returns an HTML object containing the generated view for further processing or custom visualization
+                    - 'save' : Writes the generated view as a standalone HTML document to html_file, streaming it to
+                        the file so that saving many large views in a loop does not hold them in memory
+                html_file: Path or text file object to write the HTML to, if html_action='save'
+                precision: Specifies how attention weights are passed to the visualization
+                    - None (default): Nested lists of decimal numbers
+                    - 'float32' or 'float16': Binary buffers (one per layer), which are much faster to generate, transfer
+                        and parse for long inputs
+                    - 'uint8' or 'uint16': Binary buffers with weights quantized per head, 2-4x smaller than 'float16'
+                sparsity: Only pass the largest attention weights to the visualization, which reduces the size of the
+                    generated HTML and the number of lines drawn for long inputs. A dictionary with either or both keys:
+                    - 'top_k': Number of weights to keep for each source token
+                    - 'min_weight': Minimum weight to keep
+                    Implies binary encoding ('float32' unless precision is set). For sentence pairs, 'top_k' applies
+                    within each sentence, so that every sentence-pair filter (e.g. Sentence A -> Sentence B) keeps the
+                    top_k weights of each token, and the 'All' filter keeps up to top_k weights in each sentence.
+                renderer: How the attention lines are drawn
+                    - 'svg' (default): One svg element per line
+                    - 'canvas': A single canvas bitmap, which renders and responds to hovering much faster for long inputs
+                max_payload_bytes: Approximate maximum size of the attention passed to the visualization (optional).
+                    If the attention is estimated to be larger, it is reduced to fit, by trying in order: a smaller
+                    precision ('float16', then 'uint8'), top_k sparsity, and evenly spaced layers. The
+                    reductions are shown above the visualization.
     """
+    # Imported on use, so that importing bertviz does not load IPython and torch
+    from IPython.display import display, HTML, Javascript
+    from .budget import fit_payload
+    from .util import format_special_chars, format_attention, self_attention_filters, encode_attention, num_layers, \
+        column_splits
 
+    profiling.start_render('head_view')
     attn_data = []
     if attention is not None:
         if tokens is None:
@@ -60,70 +98,19 @@ def head_view(
                              " argument is only for self-attention models.")
         if include_layers is None:
             include_layers = list(range(num_layers(attention)))
-        attention = format_attention(attention, include_layers)
-        if sentence_b_start is None:
-            attn_data.append(
-                {
-                    'name': None,
-                    'attn': attention.tolist(),
-                    'left_text': tokens,
-                    'right_text': tokens
-                }
-            )
-        else:
-            slice_a = slice(0, sentence_b_start)  # Positions corresponding to sentence A in input
-            slice_b = slice(sentence_b_start, len(tokens))  # Position corresponding to sentence B in input
-            attn_data.append(
-                {
-                    'name': 'All',
-                    'attn': attention.tolist(),
-                    'left_text': tokens,
-                    'right_text': tokens
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence A -> Sentence A',
-                    'attn': attention[:, :, slice_a, slice_a].tolist(),
-                    'left_text': tokens[slice_a],
-                    'right_text': tokens[slice_a]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence B -> Sentence B',
-                    'attn': attention[:, :, slice_b, slice_b].tolist(),
-                    'left_text': tokens[slice_b],
-                    'right_text': tokens[slice_b]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence A -> Sentence B',
-                    'attn': attention[:, :, slice_a, slice_b].tolist(),
-                    'left_text': tokens[slice_a],
-                    'right_text': tokens[slice_b]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence B -> Sentence A',
-                    'attn': attention[:, :, slice_b, slice_a].tolist(),
-                    'left_text': tokens[slice_b],
-                    'right_text': tokens[slice_a]
-                }
-            )
+        attn_data = self_attention_filters(attention, tokens, sentence_b_start, batch_index, attention_mask,
+                                           include_layers, precision=precision)
     elif encoder_attention is not None or decoder_attention is not None or cross_attention is not None:
         if encoder_attention is not None:
             if encoder_tokens is None:
                 raise ValueError("'encoder_tokens' required if 'encoder_attention' is not None")
             if include_layers is None:
                 include_layers = list(range(num_layers(encoder_attention)))
-            encoder_attention = format_attention(encoder_attention, include_layers)
+            encoder_attention = format_attention(encoder_attention, include_layers, precision=precision)
             attn_data.append(
                 {
                     'name': 'Encoder',
-                    'attn': encoder_attention.tolist(),
+                    'attn': encoder_attention,
                     'left_text': encoder_tokens,
                     'right_text': encoder_tokens
                 }
@@ -133,11 +120,11 @@ def head_view(
                 raise ValueError("'decoder_tokens' required if 'decoder_attention' is not None")
             if include_layers is None:
                 include_layers = list(range(num_layers(decoder_attention)))
-            decoder_attention = format_attention(decoder_attention, include_layers)
+            decoder_attention = format_attention(decoder_attention, include_layers, precision=precision)
             attn_data.append(
                 {
                     'name': 'Decoder',
-                    'attn': decoder_attention.tolist(),
+                    'attn': decoder_attention,
                     'left_text': decoder_tokens,
                     'right_text': decoder_tokens
                 }
@@ -149,11 +136,11 @@ def head_view(
                 raise ValueError("'decoder_tokens' required if 'cross_attention' is not None")
             if include_layers is None:
                 include_layers = list(range(num_layers(cross_attention)))
-            cross_attention = format_attention(cross_attention, include_layers)
+            cross_attention = format_attention(cross_attention, include_layers, precision=precision)
             attn_data.append(
                 {
                     'name': 'Cross',
-                    'attn': cross_attention.tolist(),
+                    'attn': cross_attention,
                     'left_text': decoder_tokens,
                     'right_text': encoder_tokens
                 }
@@ -161,6 +148,17 @@ def head_view(
     else:
         raise ValueError("You must specify at least one attention argument.")
 
+    profiling.lap('format_attention')
+    payload_message = None
+    if max_payload_bytes is not None:
+        plan = fit_payload(attn_data, include_layers, None, max_payload_bytes, precision, sparsity, keep_layer=layer)
+        precision, sparsity, include_layers = plan['precision'], plan['sparsity'], plan['layers']
+        payload_message = plan['message']
+        profiling.lap('fit_payload')
+
+    if renderer not in ('svg', 'canvas'):
+        raise ValueError("'renderer' parameter must be 'svg' or 'canvas'")
+
     if layer is not None and layer not in include_layers:
         raise ValueError(f"Layer {layer} is not in include_layers: {include_layers}")
 
@@ -176,63 +174,65 @@ def head_view(
         select_html = f'Attention: <select id="filter">{options}</select>'
     else:
         select_html = ""
+    if payload_message:
+        payload_html = f'<div style="font-size:12px; color:#888; margin:4px 0">{html.escape(payload_message)}</div>'
+    else:
+        payload_html = ""
     vis_html = f"""      
         <div id="{vis_id}" style="font-family:'Helvetica Neue', Helvetica, Arial, sans-serif;">
             <span style="user-select:none">
                 Layer: <select id="layer"></select>
                 {select_html}
             </span>
+            {payload_html}
             <div id='vis'></div>
         </div>
     """
 
-    for d in attn_data:
-        attn_seq_len_left = len(d['attn'][0][0])
-        if attn_seq_len_left != len(d['left_text']):
-            raise ValueError(
-                f"Attention has {attn_seq_len_left} positions, while number of tokens is {len(d['left_text'])} "
-                f"for tokens: {' '.join(d['left_text'])}"
-            )
-        attn_seq_len_right = len(d['attn'][0][0][0])
-        if attn_seq_len_right != len(d['right_text']):
-            raise ValueError(
-                f"Attention has {attn_seq_len_right} positions, while number of tokens is {len(d['right_text'])} "
-                f"for tokens: {' '.join(d['right_text'])}"
-            )
+    for i, d in enumerate(attn_data):
+        if 'attn' in d:  # Sentence-pair filters have no attention of their own
+            attn_seq_len_left = d['attn'].size(-2)
+            if attn_seq_len_left != len(d['left_text']):
+                raise ValueError(
+                    f"Attention has {attn_seq_len_left} positions, while number of tokens is {len(d['left_text'])} "
+                    f"for tokens: {' '.join(d['left_text'])}"
+                )
+            attn_seq_len_right = d['attn'].size(-1)
+            if attn_seq_len_right != len(d['right_text']):
+                raise ValueError(
+                    f"Attention has {attn_seq_len_right} positions, while number of tokens is {len(d['right_text'])} "
+                    f"for tokens: {' '.join(d['right_text'])}"
+                )
+            d['attn'] = encode_attention(d['attn'], precision, sparsity, column_splits(attn_data, i))
+            profiling.lap('encode_attention')
         if prettify_tokens:
             d['left_text'] = format_special_chars(d['left_text'])
             d['right_text'] = format_special_chars(d['right_text'])
+            profiling.lap('format_tokens')
     params = {
         'attention': attn_data,
         'default_filter': "0",
         'root_div_id': vis_id,
         'layer': layer,
         'heads': heads,
-        'include_layers': include_layers
+        'include_layers': include_layers,
+        'renderer': renderer
     }
 
     # require.js must be imported for Colab or JupyterLab:
     if html_action == 'view':
-        display(HTML('<script src="https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"></script>'))
+        libraries_html, vis_js = view_assets('head_view', params)
+        if libraries_html:
+            display(HTML(libraries_html))
         display(HTML(vis_html))
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__)))
-        vis_js = open(os.path.join(__location__, 'head_view.js')).read().replace("PYTHON_PARAMS", json.dumps(params))
         display(Javascript(vis_js))
+        profiling.lap('display')
 
     elif html_action == 'return':
-        html1 = HTML('<script src="https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"></script>')
-
-        html2 = HTML(vis_html)
-
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__)))
-        vis_js = open(os.path.join(__location__, 'head_view.js')).read().replace("PYTHON_PARAMS", json.dumps(params))
-        html3 = Javascript(vis_js)
-        script = '\n<script type="text/javascript">\n' + html3.data + '\n</script>\n'
+        return HTML(view_html('head_view', vis_html, params))
 
-        head_html = HTML(html1.data + html2.data + script)
-        return head_html
+    elif html_action == 'save':
+        save_view_html(html_file, 'head_view', vis_html, params)
 
     else:
-        raise ValueError("'html_action' parameter must be 'view' or 'return")
\ No newline at end of file
+        raise ValueError("'html_action' parameter must be 'view', 'return' or 'save'")
\ No newline at end of file
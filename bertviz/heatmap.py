@@ -0,0 +1,61 @@
+"""Rasterize attention into PNG heatmaps, which are much cheaper to transfer and paint than one line per weight."""
+
+import base64
+import struct
+import zlib
+
+import numpy as np
+
+# d3.schemeCategory10, which model_view.js uses to color each layer
+LAYER_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22',
+                '#17becf']
+
+
+def attention_heatmaps(attention, layers):
+    """Rasterize the attention of each head into a PNG heatmap
+
+    Each pixel (row = source position, column = target position) has the color of the layer, with opacity equal to the
+    attention weight, mirroring the opacity of the lines drawn in the model view.
+
+    Args:
+        attention: tensor of shape (num_layers, num_heads, source_seq_len, target_seq_len)
+        layers: indices of the layers in the model, which determine their colors
+
+    Returns:
+        List of lists of shape [num_layers, num_heads] of 'data:image/png;base64,...' URIs
+    """
+    heatmaps = []
+    # One layer at a time, to bound the memory used for pixels
+    for layer_attention, layer in zip(attention, layers):
+        alpha = np.rint(layer_attention.detach().cpu().float().clamp(0, 1).numpy() * 255).astype(np.uint8)
+        pixels = np.empty(alpha.shape + (4,), dtype=np.uint8)  # num_heads x source_seq_len x target_seq_len x RGBA
+        pixels[..., :3] = _hex_to_rgb(LAYER_COLORS[layer % len(LAYER_COLORS)])
+        pixels[..., 3] = alpha
+        heatmaps.append([
+            'data:image/png;base64,' + base64.b64encode(encode_png(head_pixels)).decode('ascii')
+            for head_pixels in pixels
+        ])
+    return heatmaps
+
+
+def encode_png(pixels):
+    """Encode an array of shape (height, width, 4) of 8-bit RGBA pixels as a PNG image"""
+    height, width, _ = pixels.shape
+    # Each scanline is prefixed with its filter type, 0 (None)
+    scanlines = np.zeros((height, 1 + width * 4), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(height, width * 4)
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)  # 8-bit depth, RGBA color type
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n',
+        _png_chunk(b'IHDR', header),
+        _png_chunk(b'IDAT', zlib.compress(scanlines.tobytes())),
+        _png_chunk(b'IEND', b'')
+    ))
+
+
+def _png_chunk(chunk_type, data):
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+
+def _hex_to_rgb(color):
+    return [int(color[i:i + 2], 16) for i in (1, 3, 5)]
@@ -13,16 +13,11 @@
  * 03/23/22  Daniel SC   Update requirement URLs for d3 and jQuery (source of bug not allowing end result to be displayed on browsers)
  **/
 
-require.config({
-  paths: {
-      d3: 'https://cdnjs.cloudflare.com/ajax/libs/d3/5.7.0/d3.min',
-    jquery: 'https://cdnjs.cloudflare.com/ajax/libs/jquery/2.0.0/jquery.min',
-  }
-});
+define('bertviz/model_view', ['jquery', 'd3'], function ($, d3) {
 
-requirejs(['jquery', 'd3'], function($, d3) {
+    // Returns a function that renders the visualization with the params passed from Python
+    return function (params) {
 
-        const params = PYTHON_PARAMS; // HACK: PYTHON_PARAMS is a template marker that is replaced by actual params.
         const config = {};
 
         const MIN_X = 0;
@@ -63,7 +58,7 @@ requirejs(['jquery', 'd3'], function($, d3) {
             config.rightText = attData.right_text;
             config.attn = attData.attn;
             config.numLayers = config.attn.length;
-            config.numHeads = config.attn[0].length;
+            config.numHeads = config.heads.length;
             config.thumbnailBoxHeight = 7 * (12 / config.totalHeads);
             const axisSize = HEADING_TEXT_SIZE + HEADING_PADDING + TEXT_SIZE + TEXT_PADDING;
             config.thumbnailHeight = Math.max(config.leftText.length, config.rightText.length) * config.thumbnailBoxHeight + 2 * THUMBNAIL_PADDING;
@@ -74,21 +69,138 @@ requirejs(['jquery', 'd3'], function($, d3) {
             const vis = $(`#${config.rootDivId} #vis`)
             vis.empty();
             vis.attr("height", config.divHeight);
+            vis.css("position", "relative"); // Container for canvas thumbnails
             config.svg = d3.select(`#${config.rootDivId} #vis`)
                 .append('svg')
                 .attr("width", DIV_WIDTH)
                 .attr("height", config.divHeight)
-                .attr("fill", getBackgroundColor());
+                .attr("fill", getBackgroundColor())
+                .style("position", "relative"); // Paint over canvas thumbnails
 
             renderAxisLabels();
 
-            var i;
-            var j;
-            for (i = 0; i < config.numLayers; i++) {
-                for (j = 0; j < config.numHeads; j++) {
-                    renderThumbnail(i, j);
+            // Thumbnails are only rendered for layers near the viewport, so that the time to first paint and the size
+            // of the DOM do not grow with the depth of the model
+            config.nearObserver.disconnect();
+            config.farObserver.disconnect();
+            config.nearLayers = new Set();
+            config.farLayers = new Set();
+            config.renderedLayers = new Set();
+            config.pendingDetail = null;
+            for (let i = 0; i < config.numLayers; i++) {
+                renderLayerPlaceholder(i);
+            }
+        }
+
+        function renderLayer(layerIndex) {
+            const layerContainer = config.svg.append("svg:g")
+                .classed("layer", true)
+                .attr("layer-index", layerIndex);
+            for (let j = 0; j < config.numHeads; j++) {
+                renderThumbnail(layerContainer, layerIndex, j);
+            }
+        }
+
+        function removeLayer(layerIndex) {
+            config.svg.selectAll(`.layer[layer-index='${layerIndex}']`).remove();
+            $(`#${config.rootDivId} .attn_canvas[layer-index='${layerIndex}']`).remove();
+        }
+
+        function renderLayerPlaceholder(layerIndex) {
+            // Invisible frame of the row of thumbnails of a layer, which is observed to find out when the layer comes
+            // near the viewport (to render it) and when it gets far away (to remove it)
+            const axisSize = HEADING_TEXT_SIZE + HEADING_PADDING + TEXT_SIZE + TEXT_PADDING;
+            const placeholder = config.svg.append("rect")
+                .classed("layer-placeholder", true)
+                .attr("layer-index", layerIndex)
+                .attr("x", axisSize)
+                .attr("y", layerIndex * config.thumbnailHeight + axisSize)
+                .attr("width", config.numHeads * config.thumbnailWidth)
+                .attr("height", config.thumbnailHeight)
+                .attr("fill", "none");
+            config.nearObserver.observe(placeholder.node());
+            config.farObserver.observe(placeholder.node());
+        }
+
+        function trackLayers(key) {
+            // IntersectionObserver callback that keeps the set config[key] of layers within the observer's root margin
+            return function (entries) {
+                for (const entry of entries) {
+                    const layerIndex = +entry.target.getAttribute("layer-index");
+                    if (entry.isIntersecting) {
+                        config[key].add(layerIndex);
+                    } else {
+                        config[key].delete(layerIndex);
+                    }
+                }
+                updateLayers();
+            };
+        }
+
+        function updateLayers() {
+            const missing = [];
+            for (const layerIndex of config.nearLayers) {
+                if (config.renderedLayers.has(layerIndex)) {
+                    continue;
+                }
+                if (config.attn[layerIndex] == null && config.thumbnails !== 'heatmap') {
+                    missing.push(layerIndex); // Not loaded from the kernel yet
+                } else {
+                    renderLayer(layerIndex);
+                    config.renderedLayers.add(layerIndex);
                 }
             }
+            for (const layerIndex of config.renderedLayers) {
+                if (!config.nearLayers.has(layerIndex) && !config.farLayers.has(layerIndex)) {
+                    removeLayer(layerIndex);
+                    config.renderedLayers.delete(layerIndex);
+                }
+            }
+            if (missing.length > 0) {
+                requestLayers(missing);
+            }
+            config.svg.selectAll(".detail").raise();
+        }
+
+        function attnSource() {
+            // Index of the filter whose attention is shown by the current filter
+            const attnData = params['attention'][config.filter];
+            return attnData.attn_source == null ? +config.filter : attnData.attn_source;
+        }
+
+        function requestLayers(layers) {
+            const source = attnSource();
+            const pending = layers.filter(layer => !config.requestedLayers.has(source + ':' + layer));
+            if (pending.length === 0 || config.comm == null) {
+                return;
+            }
+            pending.forEach(layer => config.requestedLayers.add(source + ':' + layer));
+            config.comm.send({filter: source, layers: pending});
+        }
+
+        function receiveLayers(reply) {
+            if (reply.error) {
+                showMessage(reply.error);
+                return;
+            }
+            addAttentionLayers(params['attention'][reply.filter].attn, reply.layers);
+            config.attention = decodeAttentionData(params['attention']);
+            if (attnSource() !== reply.filter) {
+                return;
+            }
+            config.attn = config.attention[config.filter].attn;
+            for (const [layer] of reply.layers) {
+                if (config.pendingDetail != null && config.pendingDetail[0] === layer) {
+                    const [, head] = config.pendingDetail;
+                    config.pendingDetail = null;
+                    renderDetail(config.attn[layer][head], layer, head);
+                }
+            }
+            updateLayers();
+        }
+
+        function showMessage(message) {
+            $(`#${config.rootDivId} #message`).text(message);
         }
 
         function renderAxisLabels() {
@@ -141,11 +253,23 @@ requirejs(['jquery', 'd3'], function($, d3) {
         }
 
 
-        function renderThumbnail(layerIndex, headIndex) {
+        function renderThumbnail(layerContainer, layerIndex, headIndex) {
             const axisSize = HEADING_TEXT_SIZE + HEADING_PADDING + TEXT_SIZE + TEXT_PADDING
             const x = headIndex * config.thumbnailWidth + axisSize;
             const y = layerIndex * config.thumbnailHeight + axisSize;
-            renderThumbnailAttn(x, y, config.attn[layerIndex][headIndex], layerIndex, headIndex);
+            const att = config.attn[layerIndex] == null ? null : config.attn[layerIndex][headIndex];
+            renderThumbnailAttn(layerContainer, x, y, att, layerIndex, headIndex);
+        }
+
+        function showDetail(layerIndex, headIndex) {
+            // With lazy heatmap thumbnails, the attention of the layer may not be loaded yet; the detail is then rendered
+            // when it arrives
+            if (config.attn[layerIndex] == null) {
+                config.pendingDetail = [layerIndex, headIndex];
+                requestLayers([layerIndex]);
+            } else {
+                renderDetail(config.attn[layerIndex][headIndex], layerIndex, headIndex);
+            }
         }
 
         function renderDetail(att, layerIndex, headIndex) {
@@ -268,9 +392,9 @@ requirejs(['jquery', 'd3'], function($, d3) {
                 .style("opacity", 1);
         }
 
-        function renderThumbnailAttn(x, y, att, layerIndex, headIndex) {
+        function renderThumbnailAttn(layerContainer, x, y, att, layerIndex, headIndex) {
 
-            var attnContainer = config.svg.append("svg:g");
+            var attnContainer = layerContainer.append("svg:g");
 
             var attnBackground = attnContainer.append("rect")
                 .attr("id", 'attn_background_' + layerIndex + "_" + headIndex)
@@ -282,38 +406,45 @@ requirejs(['jquery', 'd3'], function($, d3) {
                 .attr("stroke-width", 2)
                 .attr("stroke", getLayerColor(layerIndex))
                 .attr("stroke-opacity", 0)
-                .attr("fill", getBackgroundColor());
+                .attr("fill", getBackgroundColor())
+                .attr("fill-opacity", config.renderer === 'canvas' ? 0 : 1); // Canvas is drawn underneath svg
             var x1 = x + THUMBNAIL_PADDING;
             var x2 = x1 + config.thumbnailWidth - 14;
             var y1 = y + THUMBNAIL_PADDING;
 
-            attnContainer.selectAll("g")
-                .data(att)
-                .enter()
-                .append("g") // Add group for each source token
-                .attr("source-index", function (d, i) { // Save index of source token
-                    return i;
-                })
-                .selectAll("line")
-                .data(function (d) { // Loop over all target tokens
-                    return d;
-                })
-                .enter() // When entering
-                .append("line")
-                .attr("x1", x1)
-                .attr("y1", function (d) {
-                    var sourceIndex = +this.parentNode.getAttribute("source-index");
-                    return y1 + (sourceIndex + .5) * config.thumbnailBoxHeight;
-                })
-                .attr("x2", x2)
-                .attr("y2", function (d, targetIndex) {
-                    return y1 + (targetIndex + .5) * config.thumbnailBoxHeight;
-                })
-                .attr("stroke-width", 2.2)
-                .attr("stroke", getLayerColor(layerIndex))
-                .attr("stroke-opacity", function (d) {
-                    return d;
-                });
+            if (config.thumbnails === 'heatmap') {
+                renderThumbnailHeatmap(attnContainer, x, y, layerIndex, headIndex);
+            } else if (config.renderer === 'canvas') {
+                renderThumbnailCanvas(x, y, att, layerIndex, headIndex);
+            } else {
+                attnContainer.selectAll("g")
+                    .data(att)
+                    .enter()
+                    .append("g") // Add group for each source token
+                    .attr("source-index", function (d, i) { // Save index of source token
+                        return i;
+                    })
+                    .selectAll("line")
+                    .data(function (d) { // Loop over [target index, weight] pairs
+                        return attentionEdges(d);
+                    })
+                    .enter() // When entering
+                    .append("line")
+                    .attr("x1", x1)
+                    .attr("y1", function (d) {
+                        var sourceIndex = +this.parentNode.getAttribute("source-index");
+                        return y1 + (sourceIndex + .5) * config.thumbnailBoxHeight;
+                    })
+                    .attr("x2", x2)
+                    .attr("y2", function (d) {
+                        return y1 + (d[0] + .5) * config.thumbnailBoxHeight;
+                    })
+                    .attr("stroke-width", 2.2)
+                    .attr("stroke", getLayerColor(layerIndex))
+                    .attr("stroke-opacity", function (d) {
+                        return d[1];
+                    });
+            }
 
             var clickRegion = attnContainer.append("rect")
                 .attr("x", x)
@@ -324,20 +455,21 @@ requirejs(['jquery', 'd3'], function($, d3) {
 
             clickRegion.on("click", function (d, index) {
                 var attnBackgroundOther = config.svg.selectAll(".attn_background");
-                attnBackgroundOther.attr("fill", getBackgroundColor());
+                fillThumbnails(attnBackgroundOther, getBackgroundColor());
                 attnBackgroundOther.attr("stroke-opacity", 0);
 
                 config.svg.selectAll(".detail").remove();
+                config.pendingDetail = null;
                 if (config.detail_layer != layerIndex || config.detail_head != headIndex) {
-                    renderDetail(att, layerIndex, headIndex);
+                    showDetail(layerIndex, headIndex);
                     config.detail_layer = layerIndex;
                     config.detail_head = headIndex;
-                    attnBackground.attr("fill", getHighlightColor());
+                    fillThumbnails(attnBackground, getHighlightColor());
                     attnBackground.attr("stroke-opacity", .8);
                 } else {
                     config.detail_layer = null;
                     config.detail_head = null;
-                    attnBackground.attr("fill", getBackgroundColor());
+                    fillThumbnails(attnBackground, getBackgroundColor());
                     attnBackground.attr("stroke-opacity", 0);
                 }
             });
@@ -345,6 +477,81 @@ requirejs(['jquery', 'd3'], function($, d3) {
             clickRegion.on("mouseover", function (d) {
                 d3.select(this).style("cursor", "pointer");
             });
+
+            if (config.detail_layer === layerIndex && config.detail_head === headIndex) {
+                // Thumbnail of the detail view that was removed while scrolled far away
+                fillThumbnails(attnBackground, getHighlightColor());
+                attnBackground.attr("stroke-opacity", .8);
+            }
+        }
+
+        function renderThumbnailHeatmap(attnContainer, x, y, layerIndex, headIndex) {
+            // Show the heatmap rasterized in Python (rows are source tokens, columns are target tokens). Sentence-pair
+            // filters show the region of the heatmap of their source filter given by their ranges.
+            const attnData = params['attention'][config.filter];
+            const source = params['attention'][attnSource()];
+            const rows = attnData.left_range || [0, source.left_text.length];
+            const columns = attnData.right_range || [0, source.right_text.length];
+            attnContainer.append("svg")
+                .attr("x", x + THUMBNAIL_PADDING)
+                .attr("y", y + THUMBNAIL_PADDING)
+                .attr("width", config.thumbnailWidth - 2 * THUMBNAIL_PADDING)
+                .attr("height", config.leftText.length * config.thumbnailBoxHeight)
+                .attr("viewBox", [columns[0], rows[0], columns[1] - columns[0], rows[1] - rows[0]].join(" "))
+                .attr("preserveAspectRatio", "none")
+                .append("image")
+                .attr("href", source.heatmaps[layerIndex][headIndex])
+                .attr("width", source.right_text.length)
+                .attr("height", source.left_text.length)
+                .attr("preserveAspectRatio", "none")
+                .style("image-rendering", "pixelated");
+        }
+
+        function renderThumbnailCanvas(x, y, att, layerIndex, headIndex) {
+            // Draw all lines of the thumbnail into a single canvas bitmap, positioned underneath the svg
+            const ratio = window.devicePixelRatio || 1;
+            const canvas = $("<canvas />")
+                .attr("id", 'attn_canvas_' + layerIndex + "_" + headIndex)
+                .attr("layer-index", layerIndex)
+                .addClass("attn_canvas")
+                .attr("width", Math.ceil(config.thumbnailWidth * ratio))
+                .attr("height", Math.ceil(config.thumbnailHeight * ratio))
+                .css({
+                    "position": "absolute",
+                    "left": x + "px",
+                    "top": y + "px",
+                    "width": config.thumbnailWidth + "px",
+                    "height": config.thumbnailHeight + "px",
+                    "background-color": getBackgroundColor()
+                });
+            $(`#${config.rootDivId} #vis`).prepend(canvas);
+
+            const context = canvas[0].getContext("2d");
+            context.scale(ratio, ratio);
+            context.strokeStyle = getLayerColor(layerIndex);
+            context.lineWidth = 2.2;
+            const x1 = THUMBNAIL_PADDING;
+            const x2 = x1 + config.thumbnailWidth - 14;
+            for (let sourceIndex = 0; sourceIndex < att.length; sourceIndex++) {
+                const y1 = THUMBNAIL_PADDING + (sourceIndex + .5) * config.thumbnailBoxHeight;
+                for (const [targetIndex, weight] of attentionEdges(att[sourceIndex])) {
+                    context.globalAlpha = weight;
+                    context.beginPath();
+                    context.moveTo(x1, y1);
+                    context.lineTo(x2, THUMBNAIL_PADDING + (targetIndex + .5) * config.thumbnailBoxHeight);
+                    context.stroke();
+                }
+            }
+        }
+
+        function fillThumbnails(attnBackgrounds, color) {
+            attnBackgrounds.attr("fill", color);
+            if (config.renderer === 'canvas') {
+                attnBackgrounds.each(function () {
+                    const canvasId = this.id.replace('attn_background_', 'attn_canvas_');
+                    $(`#${config.rootDivId} #${canvasId}`).css("background-color", color);
+                });
+            }
         }
 
         function renderDetailFrame(x, y, layerIndex) {
@@ -373,8 +580,8 @@ requirejs(['jquery', 'd3'], function($, d3) {
                     return i;
                 })
                 .selectAll("line")
-                .data(function (d) { // Loop over all target tokens
-                    return d;
+                .data(function (d) { // Loop over [target index, weight] pairs
+                    return attentionEdges(d);
                 })
                 .enter()
                 .append("line")
@@ -384,13 +591,13 @@ requirejs(['jquery', 'd3'], function($, d3) {
                     return y + (sourceIndex + .5) * DETAIL_BOX_HEIGHT;
                 })
                 .attr("x2", x + DETAIL_ATTENTION_WIDTH - ATTN_PADDING)
-                .attr("y2", function (d, targetIndex) {
-                    return y + (targetIndex + .5) * DETAIL_BOX_HEIGHT;
+                .attr("y2", function (d) {
+                    return y + (d[0] + .5) * DETAIL_BOX_HEIGHT;
                 })
                 .attr("stroke-width", 2.2)
                 .attr("stroke", getLayerColor(layerIndex))
                 .attr("stroke-opacity", function (d) {
-                    return d;
+                    return d[1];
                 });
         }
 
@@ -411,13 +618,25 @@ requirejs(['jquery', 'd3'], function($, d3) {
         }
 
         function initialize() {
-            config.attention = params['attention'];
+            config.attention = decodeAttentionData(params['attention']);
             config.filter = params['default_filter'];
             config.mode = params['display_mode'];
             config.layers = params['include_layers']
             config.heads = params['include_heads']
             config.totalHeads = params['total_heads']
             config.rootDivId = params['root_div_id'];
+            config.renderer = params['renderer'];
+            config.lazy = params['lazy'];
+            config.thumbnails = params['thumbnails'];
+            config.nearObserver = new IntersectionObserver(trackLayers('nearLayers'), {rootMargin: "50% 0px"});
+            config.farObserver = new IntersectionObserver(trackLayers('farLayers'), {rootMargin: "200% 0px"});
+            if (config.lazy) {
+                config.requestedLayers = new Set();
+                config.comm = openKernelComm('bertviz', {vis_id: config.rootDivId}, receiveLayers);
+                if (config.comm == null) {
+                    showMessage("Lazy loading of attention requires the classic Jupyter notebook or Colab.");
+                }
+            }
             $(`#${config.rootDivId} #filter`).on('change', function (e) {
                 config.filter = e.currentTarget.value;
                 render();
@@ -427,4 +646,5 @@ requirejs(['jquery', 'd3'], function($, d3) {
         initialize();
         render();
 
-    });
\ No newline at end of file
+    };
+});
@@ -1,10 +1,8 @@
-import json
-import os
+import html
 import uuid
 
-from IPython.display import display, HTML, Javascript
-
-from .util import format_special_chars, format_attention, num_layers, num_heads
+from . import profiling
+from .runtime import view_assets, view_html, save_view_html
 
 
 def model_view(
@@ -20,16 +18,30 @@ def model_view(
         decoder_tokens=None,
         include_layers=None,
         include_heads=None,
-        html_action='view'
+        html_action='view',
+        precision=None,
+        sparsity=None,
+        lazy=False,
+        renderer='svg',
+        thumbnails='lines',
+        html_file=None,
+        batch_index=None,
+        attention_mask=None,
+        max_payload_bytes=None
 ):
     """Render model view
 
         Args:
             For self-attention models:
                 attention: list of ``torch.FloatTensor``(one for each layer) of shape
-                    ``(batch_size(must be 1), num_heads, sequence_length, sequence_length)``
-                tokens: list of tokens
-                sentence_b_start: index of first wordpiece in sentence B if input text is sentence pair (optional)
+                    ``(batch_size, num_heads, sequence_length, sequence_length)``
+                tokens: list of tokens, or list of lists of tokens (one for each example in the batch)
+                sentence_b_start: index of first wordpiece in sentence B if input text is sentence pair (optional). For
+                    several examples, may be a list with one index for each example in batch_index.
+                batch_index: index of the example to visualize if batch_size > 1, or list of indices to show several
+                    examples in one visualization, selected from the attention dropdown (optional)
+                attention_mask: tensor of shape ``(batch_size, sequence_length)`` that is 0 for padded positions, which
+                    are removed from the visualization (optional). sentence_b_start ignores padding.
             For encoder-decoder models:
                 encoder_attention: list of ``torch.FloatTensor``(one for each layer) of shape
                     ``(batch_size(must be 1), num_heads, encoder_sequence_length, encoder_sequence_length)``
@@ -49,8 +61,48 @@ def model_view(
                 html_action: Specifies the action to be performed with the generated HTML object
                     - 'view' (default): Displays the generated HTML representation as a notebook cell output
                     - 'return' : Returns an HTML object containing the generated view for further processing or custom visualization
+                    - 'save' : Writes the generated view as a standalone HTML document to html_file, streaming it to
+                        the file so that saving many large views in a loop does not hold them in memory
+                html_file: Path or text file object to write the HTML to, if html_action='save'
+                precision: Specifies how attention weights are passed to the visualization
+                    - None (default): Nested lists of decimal numbers
+                    - 'float32' or 'float16': Binary buffers (one per layer), which are much faster to generate, transfer
+                        and parse for long inputs
+                    - 'uint8' or 'uint16': Binary buffers with weights quantized per head, 2-4x smaller than 'float16'
+                sparsity: Only pass the largest attention weights to the visualization, which reduces the size of the
+                    generated HTML and the number of lines drawn for long inputs. A dictionary with either or both keys:
+                    - 'top_k': Number of weights to keep for each source token
+                    - 'min_weight': Minimum weight to keep
+                    Implies binary encoding ('float32' unless precision is set). For sentence pairs, 'top_k' applies
+                    within each sentence, so that every sentence-pair filter (e.g. Sentence A -> Sentence B) keeps the
+                    top_k weights of each token, and the 'All' filter keeps up to top_k weights in each sentence.
+                lazy: Keep attention in the kernel and load each layer only when it scrolls into view, so that the
+                    initial output is small and deep models do not freeze the browser. Requires html_action='view' in the
+                    classic Jupyter notebook or Colab. Implies binary encoding ('float32' unless precision is set).
+                renderer: How the attention lines of the thumbnails are drawn
+                    - 'svg' (default): One svg element per line
+                    - 'canvas': One canvas bitmap per thumbnail, which renders and responds much faster for long inputs
+                        and many heads. The detail view shown on click is always drawn with svg.
+                thumbnails: How the thumbnails show attention
+                    - 'lines' (default): One line per attention weight, drawn by the renderer
+                    - 'heatmap': One PNG heatmap per head (rows are source tokens, columns are target tokens), rasterized
+                        in Python. Much faster to display for long inputs; lines are only drawn in the detail view shown
+                        on click. With lazy=True, the heatmaps are shown right away and a layer's attention is only
+                        loaded when one of its heads is clicked.
+                max_payload_bytes: Approximate maximum size of the attention passed to the visualization (optional).
+                    If the attention is estimated to be larger, it is reduced to fit, by trying in order: a smaller
+                    precision ('float16', then 'uint8'), top_k sparsity, and evenly spaced layers (then heads). The
+                    reductions are shown above the visualization.
     """
+    # Imported on use, so that importing bertviz does not load IPython and torch
+    from IPython.display import display, HTML, Javascript
+    from .budget import fit_payload
+    from .comm import serve_attention
+    from .heatmap import attention_heatmaps
+    from .util import format_special_chars, format_attention, self_attention_filters, encode_attention, num_layers, \
+        num_heads, column_splits
 
+    profiling.start_render('model_view')
     attn_data = []
     if attention is not None:
         if tokens is None:
@@ -64,59 +116,8 @@ def model_view(
             include_layers = list(range(num_layers(attention)))
         if include_heads is None:
             include_heads = list(range(n_heads))
-        attention = format_attention(attention, include_layers, include_heads)
-        if sentence_b_start is None:
-            attn_data.append(
-                {
-                    'name': None,
-                    'attn': attention.tolist(),
-                    'left_text': tokens,
-                    'right_text': tokens
-                }
-            )
-        else:
-            slice_a = slice(0, sentence_b_start)  # Positions corresponding to sentence A in input
-            slice_b = slice(sentence_b_start, len(tokens))  # Position corresponding to sentence B in input
-            attn_data.append(
-                {
-                    'name': 'All',
-                    'attn': attention.tolist(),
-                    'left_text': tokens,
-                    'right_text': tokens
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence A -> Sentence A',
-                    'attn': attention[:, :, slice_a, slice_a].tolist(),
-                    'left_text': tokens[slice_a],
-                    'right_text': tokens[slice_a]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence B -> Sentence B',
-                    'attn': attention[:, :, slice_b, slice_b].tolist(),
-                    'left_text': tokens[slice_b],
-                    'right_text': tokens[slice_b]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence A -> Sentence B',
-                    'attn': attention[:, :, slice_a, slice_b].tolist(),
-                    'left_text': tokens[slice_a],
-                    'right_text': tokens[slice_b]
-                }
-            )
-            attn_data.append(
-                {
-                    'name': 'Sentence B -> Sentence A',
-                    'attn': attention[:, :, slice_b, slice_a].tolist(),
-                    'left_text': tokens[slice_b],
-                    'right_text': tokens[slice_a]
-                }
-            )
+        attn_data = self_attention_filters(attention, tokens, sentence_b_start, batch_index, attention_mask,
+                                           include_layers, include_heads, precision)
 
     elif encoder_attention is not None or decoder_attention is not None or cross_attention is not None:
         if encoder_attention is not None:
@@ -127,11 +128,11 @@ def model_view(
             n_heads = num_heads(encoder_attention)
             if include_heads is None:
                 include_heads = list(range(n_heads))
-            encoder_attention = format_attention(encoder_attention, include_layers, include_heads)
+            encoder_attention = format_attention(encoder_attention, include_layers, include_heads, precision=precision)
             attn_data.append(
                 {
                     'name': 'Encoder',
-                    'attn': encoder_attention.tolist(),
+                    'attn': encoder_attention,
                     'left_text': encoder_tokens,
                     'right_text': encoder_tokens
                 }
@@ -144,11 +145,11 @@ def model_view(
             n_heads = num_heads(decoder_attention)
             if include_heads is None:
                 include_heads = list(range(n_heads))
-            decoder_attention = format_attention(decoder_attention, include_layers, include_heads)
+            decoder_attention = format_attention(decoder_attention, include_layers, include_heads, precision=precision)
             attn_data.append(
                 {
                     'name': 'Decoder',
-                    'attn': decoder_attention.tolist(),
+                    'attn': decoder_attention,
                     'left_text': decoder_tokens,
                     'right_text': decoder_tokens
                 }
@@ -163,11 +164,11 @@ def model_view(
             n_heads = num_heads(cross_attention)
             if include_heads is None:
                 include_heads = list(range(n_heads))
-            cross_attention = format_attention(cross_attention, include_layers, include_heads)
+            cross_attention = format_attention(cross_attention, include_layers, include_heads, precision=precision)
             attn_data.append(
                 {
                     'name': 'Cross',
-                    'attn': cross_attention.tolist(),
+                    'attn': cross_attention,
                     'left_text': decoder_tokens,
                     'right_text': encoder_tokens
                 }
@@ -175,6 +176,16 @@ def model_view(
     else:
         raise ValueError("You must specify at least one attention argument.")
 
+    profiling.lap('format_attention')
+    payload_message = None
+    if max_payload_bytes is not None:
+        plan = fit_payload(attn_data, include_layers, include_heads, max_payload_bytes, precision, sparsity,
+                           heatmaps=thumbnails == 'heatmap')
+        precision, sparsity, include_layers = plan['precision'], plan['sparsity'], plan['layers']
+        include_heads = plan['heads']
+        payload_message = plan['message']
+        profiling.lap('fit_payload')
+
     # Generate unique div id to enable multiple visualizations in one notebook
     vis_id = 'bertviz-%s'%(uuid.uuid4().hex)
 
@@ -187,31 +198,53 @@ def model_view(
         select_html = f'Attention: <select id="filter">{options}</select>'
     else:
         select_html = ""
+    if payload_message:
+        payload_html = f'<div style="font-size:12px; color:#888; margin:4px 0">{html.escape(payload_message)}</div>'
+    else:
+        payload_html = ""
     vis_html = f"""      
         <div id="{vis_id}" style="font-family:'Helvetica Neue', Helvetica, Arial, sans-serif;">
             <span style="user-select:none">
                 {select_html}
             </span>
+            {payload_html}
+            <div id='message'></div>
             <div id='vis'></div>
         </div>
     """
 
-    for d in attn_data:
-        attn_seq_len_left = len(d['attn'][0][0])
-        if attn_seq_len_left != len(d['left_text']):
-            raise ValueError(
-                f"Attention has {attn_seq_len_left} positions, while number of tokens is {len(d['left_text'])} "
-                f"for tokens: {' '.join(d['left_text'])}"
-            )
-        attn_seq_len_right = len(d['attn'][0][0][0])
-        if attn_seq_len_right != len(d['right_text']):
-            raise ValueError(
-                f"Attention has {attn_seq_len_right} positions, while number of tokens is {len(d['right_text'])} "
-                f"for tokens: {' '.join(d['right_text'])}"
-            )
+    if renderer not in ('svg', 'canvas'):
+        raise ValueError("'renderer' parameter must be 'svg' or 'canvas'")
+    if thumbnails not in ('lines', 'heatmap'):
+        raise ValueError("'thumbnails' parameter must be 'lines' or 'heatmap'")
+    if lazy and html_action != 'view':
+        raise ValueError("'lazy' requires html_action='view'")
+    for i, d in enumerate(attn_data):
+        if 'attn' in d:  # Sentence-pair filters have no attention of their own
+            attn_seq_len_left = d['attn'].size(-2)
+            if attn_seq_len_left != len(d['left_text']):
+                raise ValueError(
+                    f"Attention has {attn_seq_len_left} positions, while number of tokens is {len(d['left_text'])} "
+                    f"for tokens: {' '.join(d['left_text'])}"
+                )
+            attn_seq_len_right = d['attn'].size(-1)
+            if attn_seq_len_right != len(d['right_text']):
+                raise ValueError(
+                    f"Attention has {attn_seq_len_right} positions, while number of tokens is {len(d['right_text'])} "
+                    f"for tokens: {' '.join(d['right_text'])}"
+                )
+            if thumbnails == 'heatmap':
+                d['heatmaps'] = attention_heatmaps(d['attn'], include_layers)
+                profiling.lap('heatmaps')
+            if lazy:
+                d['attn'] = serve_attention(vis_id, i, d['attn'], precision, sparsity, column_splits(attn_data, i))
+            else:
+                d['attn'] = encode_attention(d['attn'], precision, sparsity, column_splits(attn_data, i))
+            profiling.lap('encode_attention')
         if prettify_tokens:
             d['left_text'] = format_special_chars(d['left_text'])
             d['right_text'] = format_special_chars(d['right_text'])
+            profiling.lap('format_tokens')
 
     params = {
         'attention': attn_data,
@@ -220,31 +253,26 @@ def model_view(
         'root_div_id': vis_id,
         'include_layers': include_layers,
         'include_heads': include_heads,
-        'total_heads': n_heads
+        'total_heads': n_heads,
+        'lazy': lazy,
+        'renderer': renderer,
+        'thumbnails': thumbnails
     }
 
     # require.js must be imported for Colab or JupyterLab:
     if html_action == 'view':
-        display(HTML('<script src="https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"></script>'))
+        libraries_html, vis_js = view_assets('model_view', params)
+        if libraries_html:
+            display(HTML(libraries_html))
         display(HTML(vis_html))
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__)))
-        vis_js = open(os.path.join(__location__, 'model_view.js')).read().replace("PYTHON_PARAMS", json.dumps(params))
         display(Javascript(vis_js))
+        profiling.lap('display')
 
     elif html_action == 'return':
-        html1 = HTML('<script src="https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"></script>')
-
-        html2 = HTML(vis_html)
-
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__)))
-        vis_js = open(os.path.join(__location__, 'model_view.js')).read().replace("PYTHON_PARAMS", json.dumps(params))
-        html3 = Javascript(vis_js)
-        script = '\n<script type="text/javascript">\n' + html3.data + '\n</script>\n'
+        return HTML(view_html('model_view', vis_html, params))
 
-        head_html = HTML(html1.data + html2.data + script)
-        return head_html
+    elif html_action == 'save':
+        save_view_html(html_file, 'model_view', vis_html, params)
 
     else:
-        raise ValueError("'html_action' parameter must be 'view' or 'return")
\ No newline at end of file
+        raise ValueError("'html_action' parameter must be 'view', 'return' or 'save'")
\ No newline at end of file
@@ -14,17 +14,11 @@
  * 04/02/22  Jesse Vig   Enable multiple neuron views per notebook
  **/
 
-require.config({
-    paths: {
-        d3: 'https://cdnjs.cloudflare.com/ajax/libs/d3/5.7.0/d3.min',
-        jquery: 'https://cdnjs.cloudflare.com/ajax/libs/jquery/2.0.0/jquery.min',
-    }
-});
+define('bertviz/neuron_view', ['jquery', 'd3'], function ($, d3) {
 
-requirejs(['jquery', 'd3'],
-    function ($, d3) {
+    // Returns a function that renders the visualization with the params passed from Python
+    return function (params) {
 
-        const params = window.bertviz_params
         const config = {};
         initialize();
 
@@ -965,7 +959,7 @@ requirejs(['jquery', 'd3'],
         }
 
         function initialize() {
-            config.attention = params['attention'];
+            config.attention = decodeAttentionData(params['attention']);
             config.filter = params['default_filter'];
             var attentionFilter = config.attention[config.filter];
             config.nLayers = attentionFilter['attn'].length;
@@ -1010,4 +1004,5 @@ requirejs(['jquery', 'd3'],
 
         render();
 
-    });
+    };
+});
@@ -25,18 +25,19 @@
 This module is designed to be called from an ipython notebook.
 """
 
-import json
-import os
 import uuid
-from collections import defaultdict
+from contextlib import contextmanager
 
-import torch
-from IPython.display import display, HTML, Javascript
+from . import profiling
+from .runtime import view_assets, view_html, save_view_html
 
 
 def show(model, model_type, tokenizer, sentence_a, sentence_b=None, display_mode='dark', layer=None, head=None,
-         html_action='view'):
+         html_action='view', precision=None, html_file=None):
+    # Imported on use, so that importing bertviz does not load IPython
+    from IPython.display import display, HTML, Javascript
 
+    profiling.start_render('neuron_view')
     if sentence_b:
         attn_dropdown = """
             <span class="dropdown-label">Attention: </span><select id="filter">
@@ -63,9 +64,9 @@ def show(model, model_type, tokenizer, sentence_a, sentence_b=None, display_mode
         </div>
      """
 
-    __location__ = os.path.realpath(
-        os.path.join(os.getcwd(), os.path.dirname(__file__)))
-    attn_data = get_attention(model, model_type, tokenizer, sentence_a, sentence_b, include_queries_and_keys=True)
+    attn_data = get_attention(model, model_type, tokenizer, sentence_a, sentence_b, include_queries_and_keys=True,
+                              precision=precision)
+    profiling.lap('get_attention')
     if model_type == 'gpt2':
         bidirectional = False
     else:
@@ -79,26 +80,23 @@ def show(model, model_type, tokenizer, sentence_a, sentence_b=None, display_mode
         'layer': layer,
         'head': head
     }
-    vis_js = open(os.path.join(__location__, 'neuron_view.js')).read()
-    html1 = HTML('<script src="https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.6/require.min.js"></script>')
-    html2 = HTML(vis_html)
-
     if html_action == 'view':
-        display(html1)
-        display(html2)
-        display(Javascript('window.bertviz_params = %s' % json.dumps(params)))
+        libraries_html, vis_js = view_assets('neuron_view', params)
+        if libraries_html:
+            display(HTML(libraries_html))
+        display(HTML(vis_html))
         display(Javascript(vis_js))
+        profiling.lap('display')
     elif html_action == 'return':
-        script1 = '\n<script type="text/javascript">\n' + Javascript(
-            'window.bertviz_params = %s' % json.dumps(params)).data + '\n</script>\n'
-        script2 = '\n<script type="text/javascript">\n' + Javascript(vis_js).data + '\n</script>\n'
-        neuron_html = HTML(html1.data + html2.data + script1 + script2)
-        return neuron_html
+        return HTML(view_html('neuron_view', vis_html, params))
+    elif html_action == 'save':
+        save_view_html(html_file, 'neuron_view', vis_html, params)
     else:
-        raise ValueError("'html_action' parameter must be 'view' or 'return")
+        raise ValueError("'html_action' parameter must be 'view', 'return' or 'save'")
 
 
-def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, include_queries_and_keys=False):
+def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, include_queries_and_keys=False,
+                  precision=None, autocast_dtype=None, num_threads=None, layers=None, heads=None):
     """Compute representation of attention to pass to the d3 visualization
 
     Args:
@@ -108,6 +106,16 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
         sentence_a: Sentence A string
         sentence_b: Sentence B string
         include_queries_and_keys: Indicates whether to include queries/keys in results
+        precision: None (default) to return attn/queries/keys as nested lists, or a precision supported by
+            ``util.encode_attention`` to return them as binary buffers. Queries and keys are never quantized; they are
+            encoded as 'float16' if precision is 'uint8' or 'uint16'.
+        autocast_dtype: None (default) to run the model in its own dtype, or a dtype (e.g. torch.bfloat16) to run it
+            under ``torch.autocast`` on its device. Faster on CPUs with bfloat16 support, at the cost of precision.
+        num_threads: number of threads used by torch on CPU while running the model, or None (default) to keep the
+            current number
+        layers: indices of the layers to include, or None (default) for all layers. The attention of other layers is
+            neither kept by the model nor converted, and 'attn', 'queries' and 'keys' hold the included layers only.
+        heads: indices of the heads to include in each layer, or None (default) for all heads
 
     Returns:
       Dictionary of attn representations with the structure:
@@ -118,7 +126,7 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
         'ab': Sentence A -> Sentence B attention (source = A, target = B) (if sentence_b is not None)
         'ba': Sentence B -> Sentence A attention (source = B, target = A) (if sentence_b is not None)
       }
-      where each value is a dictionary:
+      where 'all' is a dictionary:
       {
         'left_text': list of source tokens, to be displayed on the left of the vis
         'right_text': list of target tokens, to be displayed on the right of the vis
@@ -126,10 +134,268 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
         'queries' (optional): list of query vector arrays, one for each layer. Each has shape (num_heads, source_seq_len, vector_size)
         'keys' (optional): list of key vector arrays, one for each layer. Each has shape (num_heads, target_seq_len, vector_size)
       }
+      and the sentence-pair values do not copy the attention/queries/keys of 'all' but describe which part of it they
+      cover:
+      {
+        'attn_source': 'all'
+        'left_text': list of source tokens, to be displayed on the left of the vis
+        'right_text': list of target tokens, to be displayed on the right of the vis
+        'left_range': [start, end) positions of the source tokens in 'all', i.e. the rows of its attention and queries
+        'right_range': [start, end) positions of the target tokens in 'all', i.e. the columns of its attention and the
+            rows of its keys
+      }
     """
+    return get_attention_batch(model, model_type, tokenizer, [(sentence_a, sentence_b)], batch_size=1,
+                               include_queries_and_keys=include_queries_and_keys, precision=precision,
+                               autocast_dtype=autocast_dtype, num_threads=num_threads, layers=layers, heads=heads)[0]
+
+
+def get_attention_batch(model, model_type, tokenizer, sentences, batch_size=32, include_queries_and_keys=False,
+                        precision=None, autocast_dtype=None, num_threads=None, layers=None, heads=None):
+    """Compute representations of attention for many inputs, running the model on batches of inputs
+
+    Inputs are sorted by length and padded to the longest input of their batch, with an attention mask so that padding
+    does not change the attention (GPT-2 needs no mask, as its attention is causal and padding is at the end). Padding
+    is removed from the results. The model runs without autograd, and the outputs of each layer are released once
+    copied. Inputs whose attention is cached (see ``attention_cache.set_attention_cache``) are not run again.
+
+    Args:
+        model: pytorch-transformers model
+        model_type: type of model. Valid values 'bert', 'gpt2', 'xlnet', 'roberta'
+        tokenizer: pytorch-transformers tokenizer
+        sentences: list of inputs, each a sentence string or a (sentence_a, sentence_b) pair
+        batch_size: number of inputs in each forward pass of the model
+        include_queries_and_keys: Indicates whether to include queries/keys in results
+        precision: see ``get_attention``
+        autocast_dtype: see ``get_attention``
+        num_threads: see ``get_attention``
+        layers: see ``get_attention``
+        heads: see ``get_attention``
+
+    Returns:
+        List of representations of attention (see ``get_attention``), one for each input, in order
+    """
+    # Imported on use, so that importing bertviz does not load torch
+    import torch
+    from . import attention_cache
 
     if model_type not in ('bert', 'gpt2', 'xlnet', 'roberta'):
         raise ValueError("Invalid model type:", model_type)
+    inputs = []
+    for sentence in sentences:
+        sentence_a, sentence_b = (sentence, None) if isinstance(sentence, str) else sentence
+        inputs.append(_tokenize(model_type, tokenizer, sentence_a, sentence_b))
+
+    device = next(model.parameters()).device
+    if model_type == 'gpt2' or tokenizer._pad_token is None:
+        pad_id = 0  # Padding is never attended to
+    else:
+        pad_id = tokenizer.convert_tokens_to_ids([tokenizer.pad_token])[0]
+    results = [None] * len(inputs)
+    cache_keys = [None] * len(inputs)
+    uncached = []
+    for i, (ids, tokens_a, tokens_b, types) in enumerate(inputs):
+        tensors = None
+        # Keys are not computed if the cache is disabled, as fingerprinting the model reads all of its weights
+        if attention_cache.is_enabled():
+            cache_keys[i] = attention_cache.cache_key(model, model_type, ids, types, include_queries_and_keys,
+                                                      autocast_dtype, layers, heads)
+            tensors = attention_cache.get(cache_keys[i])
+        if tensors is None:
+            uncached.append(i)
+        else:
+            results[i] = _format_results(model_type, tokenizer, tokens_a, tokens_b, tensors['attn'],
+                                         tensors.get('queries'), tensors.get('keys'), precision)
+    # Batch inputs of similar lengths together, to minimize padding
+    order = sorted(uncached, key=lambda i: len(inputs[i][0]))
+    model.eval()
+    capture = {'layers': layers, 'heads': heads, 'queries_keys': include_queries_and_keys}
+    for batch_start in range(0, len(order), batch_size):
+        batch = order[batch_start:batch_start + batch_size]
+        lengths = [len(inputs[i][0]) for i in batch]
+        max_len = max(lengths)
+        token_ids = torch.full((len(batch), max_len), pad_id, dtype=torch.long)
+        token_type_ids = None
+        for row, i in enumerate(batch):
+            ids, types = inputs[i][0], inputs[i][3]
+            token_ids[row, :len(ids)] = torch.tensor(ids)
+            if types is not None:
+                if token_type_ids is None:
+                    token_type_ids = torch.zeros_like(token_ids)
+                token_type_ids[row, :len(types)] = torch.tensor(types)
+        kwargs = {}
+        if token_type_ids is not None:
+            kwargs['token_type_ids'] = token_type_ids.to(device)
+        if model_type != 'gpt2' and min(lengths) < max_len:
+            attention_mask = (torch.arange(max_len)[None, :] < torch.tensor(lengths)[:, None]).long()
+            kwargs['attention_mask'] = attention_mask.to(device)
+
+        # Call model to get attention data
+        with _inference(model, device, capture, autocast_dtype, num_threads):
+            # Layers that are not captured have no attention data
+            attn_data_list = [attn_data for attn_data in model(token_ids.to(device), **kwargs)[-1]
+                              if attn_data is not None]
+        captured = ('attn', 'queries', 'keys') if include_queries_and_keys else ('attn',)
+        # Copy attention and, optionally, queries and keys of each input across layers, without padding, releasing the
+        # outputs of each layer once copied
+        stacked = [{} for _ in batch]
+        num_layers = len(attn_data_list)
+        for layer in range(num_layers):
+            attn_data = attn_data_list[layer]
+            attn_data_list[layer] = None
+            for row, length in enumerate(lengths):
+                for key in captured:
+                    # attn: [num_heads, seq_len, seq_len], queries/keys: [num_heads, seq_len, vector_size]
+                    value = attn_data[key][row, :, :length]
+                    if key == 'attn':
+                        value = value[..., :length]
+                    if key not in stacked[row]:
+                        stacked[row][key] = torch.empty((num_layers,) + value.shape, dtype=torch.float32,
+                                                        device=value.device)
+                    stacked[row][key][layer] = value
+            del attn_data
+        for row, i in enumerate(batch):
+            _, tokens_a, tokens_b, _ = inputs[i]
+            if cache_keys[i] is not None:
+                attention_cache.put(cache_keys[i], stacked[row])
+            results[i] = _format_results(model_type, tokenizer, tokens_a, tokens_b, stacked[row]['attn'],
+                                         stacked[row].get('queries'), stacked[row].get('keys'), precision)
+            stacked[row] = None
+    return results
+
+
+def iter_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, include_queries_and_keys=False,
+                   autocast_dtype=None, num_threads=None, layers=None, heads=None):
+    """Compute the attention of an input layer by layer, yielding the attention of each layer as soon as the model has
+    computed it
+
+    The model runs in a background thread, one layer ahead of the caller at most, so that the attention of a layer may
+    be processed (e.g. written to disk) while the next one is computed, and the attention of all layers is never held
+    at once. Attention is not cached.
+
+    Args:
+        model: pytorch-transformers model
+        model_type: type of model. Valid values 'bert', 'gpt2', 'xlnet', 'roberta'
+        tokenizer: pytorch-transformers tokenizer
+        sentence_a: Sentence A string
+        sentence_b: Sentence B string
+        include_queries_and_keys: Indicates whether to include queries/keys in results
+        autocast_dtype: see ``get_attention``
+        num_threads: see ``get_attention``
+        layers: indices of the layers to yield, or None (default) for all layers
+        heads: indices of the heads to include in each layer, or None (default) for all heads
+
+    Yields:
+        (layer, attn, queries, keys) for each layer, in order, where layer is the index of the layer in the model, attn
+        is a float32 tensor of shape [num_heads, seq_len, seq_len] on the CPU and queries and keys are tensors of shape
+        [num_heads, seq_len, vector_size] (None if include_queries_and_keys is False). They are ordinary tensors that
+        may be modified in place, e.g. to accumulate statistics across inputs.
+    """
+    # Imported on use, so that importing bertviz does not load torch
+    import queue
+    import threading
+    import torch
+
+    if model_type not in ('bert', 'gpt2', 'xlnet', 'roberta'):
+        raise ValueError("Invalid model type:", model_type)
+    token_ids, _, _, token_type_ids = _tokenize(model_type, tokenizer, sentence_a, sentence_b)
+    device = next(model.parameters()).device
+    kwargs = {}
+    if token_type_ids is not None:
+        kwargs['token_type_ids'] = torch.tensor([token_type_ids], device=device)
+    capture = {'layers': layers, 'heads': heads, 'queries_keys': include_queries_and_keys}
+    records = queue.Queue(maxsize=1)
+    stopped = threading.Event()
+
+    def put(record):
+        # Wait for the caller to take the previous record, unless it stopped iterating
+        while not stopped.is_set():
+            try:
+                records.put(record, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+        raise _Stopped()
+
+    def forward_hook(layer):
+        def hook(module, inputs, outputs):
+            attn_data = outputs[-1]
+            if attn_data is None:  # Layer not captured
+                return None
+            if not isinstance(attn_data, dict):  # XLM returns attention only
+                attn_data = {'attn': attn_data}
+            put((layer,) + tuple(attn_data[key][0].detach().float().cpu() if key in attn_data else None
+                                 for key in ('attn', 'queries', 'keys')))
+            # Drop the attention from the outputs of the model, so that it does not keep the attention of every layer
+            return outputs[:-1] + type(outputs)([None])
+        return hook
+
+    def run():
+        try:
+            # Under no_grad, as tensors created in inference mode cannot be modified in place by the caller
+            with _inference(model, device, capture, autocast_dtype, num_threads, inference_mode=False):
+                model(torch.tensor([token_ids], device=device), **kwargs)
+            put(None)
+        except _Stopped:
+            pass
+        except Exception as e:
+            try:
+                put(e)
+            except _Stopped:
+                pass
+
+    model.eval()
+    modules = [module for module in model.modules() if hasattr(module, 'attention_capture')]
+    handles = [module.register_forward_hook(forward_hook(layer)) for layer, module in enumerate(modules)]
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        while True:
+            record = records.get()
+            if record is None:
+                return
+            if isinstance(record, Exception):
+                raise record
+            yield record
+    finally:
+        stopped.set()
+        thread.join()
+        for handle in handles:
+            handle.remove()
+
+
+class _Stopped(Exception):
+    # Raised in the model thread of iter_attention when the caller stops iterating
+    pass
+
+
+@contextmanager
+def _inference(model, device, capture, autocast_dtype, num_threads, inference_mode=True):
+    # Run the model without autograd, capturing the attention selected by capture, optionally under autocast and with
+    # num_threads threads. With inference_mode=False, the model runs under no_grad instead (see iter_attention).
+    import torch
+
+    num_threads_before = torch.get_num_threads()
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    try:
+        model.set_attention_capture(capture)
+        # inference_mode (torch>=1.9) also skips version counting, on top of no_grad
+        with getattr(torch, 'inference_mode', torch.no_grad)() if inference_mode else torch.no_grad():
+            if autocast_dtype is None:
+                yield
+            else:
+                with torch.autocast(device.type, dtype=autocast_dtype):
+                    yield
+    finally:
+        model.set_attention_capture(None)
+        if num_threads is not None:
+            torch.set_num_threads(num_threads_before)
+
+
+def _tokenize(model_type, tokenizer, sentence_a, sentence_b):
+    # Return the token ids of the input, its tokens in sentence A and B (None if no sentence B), and its token type
+    # ids (None if the model uses none)
     if not sentence_a:
         raise ValueError("Sentence A is required")
     is_sentence_pair = bool(sentence_b)
@@ -153,7 +419,7 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
         if model_type == 'bert':
             tokens_a = [tokenizer.cls_token] + tokenizer.tokenize(sentence_a) + [tokenizer.sep_token]
             tokens_b = tokenizer.tokenize(sentence_b) + [tokenizer.sep_token]
-            token_type_ids = torch.LongTensor([[0] * len(tokens_a) + [1] * len(tokens_b)])
+            token_type_ids = [0] * len(tokens_a) + [1] * len(tokens_b)
         elif model_type == 'roberta':
             tokens_a = [tokenizer.cls_token] + tokenizer.tokenize(sentence_a) + [tokenizer.sep_token]
             tokens_b = [tokenizer.sep_token] + tokenizer.tokenize(sentence_b) + [tokenizer.sep_token]
@@ -162,49 +428,12 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
             tokens_b = tokenizer.tokenize(sentence_b)
 
     token_ids = tokenizer.convert_tokens_to_ids(tokens_a + (tokens_b if tokens_b else []))
-    tokens_tensor = torch.tensor(token_ids).unsqueeze(0)
+    return token_ids, tokens_a, tokens_b, token_type_ids
 
-    # Call model to get attention data
-    model.eval()
-    if token_type_ids is not None:
-        output = model(tokens_tensor, token_type_ids=token_type_ids)
-    else:
-        output = model(tokens_tensor)
-    attn_data_list = output[-1]
-
-    # Populate map with attn data and, optionally, query, key data
-    attn_dict = defaultdict(list)
-    if include_queries_and_keys:
-        queries_dict = defaultdict(list)
-        keys_dict = defaultdict(list)
-
-    if is_sentence_pair:
-        slice_a = slice(0, len(tokens_a))  # Positions corresponding to sentence A in input
-        slice_b = slice(len(tokens_a), len(tokens_a) + len(tokens_b))  # Position corresponding to sentence B in input
-    for layer, attn_data in enumerate(attn_data_list):
-        # Process attention
-        attn = attn_data['attn'][0]  # assume batch_size=1; shape = [num_heads, source_seq_len, target_seq_len]
-        attn_dict['all'].append(attn.tolist())
-        if is_sentence_pair:
-            attn_dict['aa'].append(
-                attn[:, slice_a, slice_a].tolist())  # Append A->A attention for layer, across all heads
-            attn_dict['bb'].append(
-                attn[:, slice_b, slice_b].tolist())  # Append B->B attention for layer, across all heads
-            attn_dict['ab'].append(
-                attn[:, slice_a, slice_b].tolist())  # Append A->B attention for layer, across all heads
-            attn_dict['ba'].append(
-                attn[:, slice_b, slice_a].tolist())  # Append B->A attention for layer, across all heads
-        # Process queries and keys
-        if include_queries_and_keys:
-            queries = attn_data['queries'][0]  # assume batch_size=1; shape = [num_heads, seq_len, vector_size]
-            keys = attn_data['keys'][0]  # assume batch_size=1; shape = [num_heads, seq_len, vector_size]
-            queries_dict['all'].append(queries.tolist())
-            keys_dict['all'].append(keys.tolist())
-            if is_sentence_pair:
-                queries_dict['a'].append(queries[:, slice_a, :].tolist())
-                keys_dict['a'].append(keys[:, slice_a, :].tolist())
-                queries_dict['b'].append(queries[:, slice_b, :].tolist())
-                keys_dict['b'].append(keys[:, slice_b, :].tolist())
+
+def _format_results(model_type, tokenizer, tokens_a, tokens_b, attn, queries, keys, precision):
+    # Representation of the attention of one input, as returned by get_attention
+    from .util import encode_attention
 
     tokens_a = format_special_chars(tokens_a)
     if tokens_b:
@@ -216,56 +445,52 @@ def get_attention(model, model_type, tokenizer, sentence_a, sentence_b=None, inc
 
     results = {
         'all': {
-            'attn': attn_dict['all'],
+            'attn': encode_attention(attn, precision),
             'left_text': tokens_a + (tokens_b if tokens_b else []),
             'right_text': tokens_a + (tokens_b if tokens_b else [])
         }
     }
-    if is_sentence_pair:
+    if queries is not None:
+        # Queries and keys may be negative, so they are never quantized
+        vector_precision = 'float16' if precision in ('uint8', 'uint16') else precision
+        results['all'].update({
+            'queries': encode_attention(queries, vector_precision),
+            'keys': encode_attention(keys, vector_precision),
+        })
+    if tokens_b:
+        # Sentence-pair filters are views into 'all', derived in the browser from these ranges
+        range_a = [0, len(tokens_a)]  # Positions corresponding to sentence A in input
+        range_b = [len(tokens_a), len(tokens_a) + len(tokens_b)]  # Position corresponding to sentence B in input
         results.update({
             'aa': {
-                'attn': attn_dict['aa'],
+                'attn_source': 'all',
+                'left_range': range_a,
+                'right_range': range_a,
                 'left_text': tokens_a,
                 'right_text': tokens_a
             },
             'bb': {
-                'attn': attn_dict['bb'],
+                'attn_source': 'all',
+                'left_range': range_b,
+                'right_range': range_b,
                 'left_text': tokens_b,
                 'right_text': tokens_b
             },
             'ab': {
-                'attn': attn_dict['ab'],
+                'attn_source': 'all',
+                'left_range': range_a,
+                'right_range': range_b,
                 'left_text': tokens_a,
                 'right_text': tokens_b
             },
             'ba': {
-                'attn': attn_dict['ba'],
+                'attn_source': 'all',
+                'left_range': range_b,
+                'right_range': range_a,
                 'left_text': tokens_b,
                 'right_text': tokens_a
             }
         })
-    if include_queries_and_keys:
-        results['all'].update({
-            'queries': queries_dict['all'],
-            'keys': keys_dict['all'],
-        })
-        if is_sentence_pair:
-            results['aa'].update({
-                'queries': queries_dict['a'],
-                'keys': keys_dict['a'],
-            })
-            results['bb'].update({
-                'queries': queries_dict['b'],
-                'keys': keys_dict['b'],
-            })
-            results['ab'].update({
-                'queries': queries_dict['a'],
-                'keys': keys_dict['b'],
-            })
-            results['ba'].update({
-                'queries': queries_dict['b'],
-                'keys': keys_dict['a'],
-            })
     return results
 
 
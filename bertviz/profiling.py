@@ -0,0 +1,161 @@
+"""Timings and sizes of the stages of rendering visualizations, to tell whether slow views are Python- or browser-bound.
+
+Views record the time of each stage with ``lap`` as they go, which does nothing unless a ``profile`` block is active.
+The browser reports its own timings for each visualization to the console and, if it is connected to a kernel,
+through the 'bertviz_profile' comm target.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+TARGET_NAME = 'bertviz_profile'
+MAX_PENDING = 32  # Browser timings are awaited for the most recent visualizations only
+# Key of an attention filter -> section of the output
+_FILTER_SECTIONS = {'attn': 'attention', 'heatmaps': 'heatmaps', 'left_text': 'tokens', 'right_text': 'tokens'}
+
+_active = []  # Profiles of the enclosing profile blocks
+_lap_start = None
+_pending = OrderedDict()  # vis_id -> records awaiting browser timings
+_registered_kernel = None
+
+
+class RenderProfile:
+    """Timings and sizes of the visualizations rendered in a ``profile`` block
+
+    Attributes:
+        renders: one dictionary for each visualization rendered, in order:
+            {
+                'view': 'head_view', 'model_view' or 'neuron_view'
+                'vis_id': id of the root div of the visualization
+                'stages': dictionary of stage -> wall time in seconds, in the order the stages ran. Stages are
+                    'format_attention' (or 'get_attention' for the neuron view), 'fit_payload', 'heatmaps',
+                    'encode_attention' (including base64 encoding), 'format_tokens', 'assemble' (html and javascript
+                    templates), 'serialize' (json) and 'display', as applicable.
+                'sizes': dictionary of section -> size in bytes of the output: 'libraries', 'scripts' (bertviz
+                    javascript), 'attention', 'heatmaps', 'tokens' and 'params' (other params)
+                'browser': dictionary of stage -> time in milliseconds, reported by the browser after rendering
+                    (possibly after the profile block ends): 'load' (loading libraries and modules), 'mount' (decoding
+                    attention and rendering) and 'paint' (until the next frame is painted). Empty until reported.
+            }
+    """
+
+    def __init__(self):
+        self.renders = []
+
+    def summary(self):
+        """Return a table of the timings and sizes of each visualization"""
+        lines = []
+        for render in self.renders:
+            lines.append(f"{render['view']} ({render['vis_id']})")
+            for stage, seconds in render['stages'].items():
+                lines.append(f"  {stage:<20}{seconds * 1000:>10.1f} ms")
+            for stage, milliseconds in render['browser'].items():
+                lines.append(f"  {'browser ' + stage:<20}{milliseconds:>10.1f} ms")
+            for section, num_bytes in render['sizes'].items():
+                lines.append(f"  {section + ' size':<20}{num_bytes / 1000:>10.1f} kB")
+        return '\n'.join(lines)
+
+
+@contextmanager
+def profile():
+    """Record the timings and output sizes of the visualizations rendered in a ``with`` block
+
+    Example:
+        with bertviz.profile() as prof:
+            model_view(attention, tokens)
+        print(prof.summary())
+
+    Browser timings arrive once the visualization is displayed, and can be printed from a later cell.
+
+    Yields:
+        ``RenderProfile``
+    """
+    prof = RenderProfile()
+    _register_target()
+    _active.append(prof)
+    try:
+        yield prof
+    finally:
+        _active.remove(prof)
+
+
+def _current_renders():
+    # Records of the visualization being rendered, one for each active profile
+    return [prof.renders[-1] for prof in _active if prof.renders]
+
+
+def is_profiling():
+    """Return whether a ``profile`` block is active"""
+    return bool(_active)
+
+
+def start_render(view):
+    """Start recording a visualization, with its first stage starting now"""
+    global _lap_start
+    if not _active:
+        return
+    for prof in _active:
+        prof.renders.append({'view': view, 'vis_id': None, 'stages': {}, 'sizes': {}, 'browser': {}})
+    _lap_start = time.perf_counter()
+
+
+def lap(stage):
+    """Add the time since the start of the render, or the previous lap, to the given stage"""
+    global _lap_start
+    if not _active or _lap_start is None:
+        return
+    now = time.perf_counter()
+    for record in _current_renders():
+        record['stages'][stage] = record['stages'].get(stage, 0) + now - _lap_start
+    _lap_start = now
+
+
+def add_size(section, num_bytes):
+    for record in _current_renders():
+        record['sizes'][section] = record['sizes'].get(section, 0) + num_bytes
+
+
+def add_params_sizes(params):
+    """Record the size of each section of the params, excluding the time spent measuring from the stages"""
+    global _lap_start
+    records = _current_renders()
+    if not records:
+        return
+    start = time.perf_counter()
+    attention = params.get('attention', [])
+    # A list of attention filters, or a dictionary of filter name -> filter in the neuron view
+    for d in attention.values() if isinstance(attention, dict) else attention:
+        for key, value in d.items():
+            add_size(_FILTER_SECTIONS.get(key, 'params'), len(json.dumps(value)))
+    for key, value in params.items():
+        if key != 'attention':
+            add_size('params', len(json.dumps(value)))
+    vis_id = params.get('root_div_id')
+    for record in records:
+        record['vis_id'] = vis_id
+    _pending[vis_id] = records
+    while len(_pending) > MAX_PENDING:
+        _pending.popitem(last=False)
+    if _lap_start is not None:
+        _lap_start += time.perf_counter() - start
+
+
+def _register_target():
+    global _registered_kernel
+    try:
+        from IPython import get_ipython
+    except ImportError:
+        return
+    kernel = getattr(get_ipython(), 'kernel', None)
+    if kernel is not None and kernel is not _registered_kernel:
+        kernel.comm_manager.register_target(TARGET_NAME, _open_comm)
+        _registered_kernel = kernel
+
+
+def _open_comm(comm, open_msg):
+    data = open_msg['content']['data']
+    for record in _pending.pop(data.get('vis_id'), []):
+        record['browser'].update(data.get('timings', {}))
+    comm.close()
@@ -0,0 +1,154 @@
+"""Javascript runtime of the visualizations.
+
+Each visualization script defines a require.js module ('bertviz/head_view', 'bertviz/model_view' or
+'bertviz/neuron_view') returning a function that renders the visualization for the given params. By default, every
+visualization carries the libraries, its module and the call that mounts it. Once ``init_notebook`` has loaded all
+modules into the notebook, visualizations only carry their params and the mount call.
+"""
+
+import io
+import json
+import os
+import warnings
+
+from . import profiling
+from .assets import in_colab, library_assets, read_asset
+
+VIEWS = ('head_view', 'model_view', 'neuron_view')
+
+_initialized = False
+
+
+def init_notebook():
+    """Load the javascript of all visualizations into the notebook once
+
+    Visualizations displayed afterwards in this session (with html_action='view') no longer embed the javascript, which
+    makes notebooks with many visualizations much smaller and faster to render. If the output of this call is cleared,
+    or the notebook is reloaded, call init_notebook() again before displaying more visualizations. Visualizations
+    returned with html_action='return' or saved with html_action='save' always embed the javascript, as they may be
+    displayed anywhere.
+
+    This has no effect in Colab (other than a warning), which renders the output of each cell in its own iframe: the
+    javascript loaded by this call would not be available to visualizations in other cells, so they keep embedding it.
+    """
+    global _initialized
+    if in_colab():
+        warnings.warn("init_notebook() has no effect in Colab, where each cell's output is rendered in its own iframe: "
+                      "visualizations keep embedding their javascript")
+        return
+    # Imported on use, so that importing bertviz does not load IPython
+    from IPython.display import display, HTML, Javascript
+    libraries_html, libraries_js = library_assets('view')
+    if libraries_html:
+        display(HTML(libraries_html))
+    out = io.StringIO()
+    out.write(libraries_js)
+    for name in ('util',) + VIEWS:
+        out.write(read_asset(name + '.js'))
+    display(Javascript(out.getvalue()))
+    _initialized = True
+
+
+def view_assets(view, params):
+    """Return the html and javascript that display a visualization in the notebook (for html_action='view')
+
+    Args:
+        view: 'head_view', 'model_view' or 'neuron_view'
+        params: params of the visualization, passed to its javascript
+
+    Returns:
+        Tuple of html to insert before the visualization (loads require.js, may be empty) and javascript that mounts
+        the visualization, including the modules it needs unless they were loaded by ``init_notebook``
+    """
+    out = io.StringIO()
+    if _initialized:
+        _write_view_js(out, view, params, None)
+        return '', out.getvalue()
+    libraries_html, libraries_js = library_assets('view')
+    profiling.add_size('libraries', len(libraries_html) + len(libraries_js))
+    _write_view_js(out, view, params, libraries_js)
+    return libraries_html, out.getvalue()
+
+
+def view_html(view, vis_html, params):
+    """Return the standalone html of a visualization (for html_action='return'), assembled in a single buffer
+
+    Args:
+        view: 'head_view', 'model_view' or 'neuron_view'
+        vis_html: html of the elements of the visualization
+        params: params of the visualization, passed to its javascript
+    """
+    out = io.StringIO()
+    _write_view_html(out, view, vis_html, params)
+    return out.getvalue()
+
+
+def save_view_html(html_file, view, vis_html, params):
+    """Write the standalone html of a visualization (for html_action='save')
+
+    The html, including the params, is streamed to the file rather than assembled in memory, so that memory use stays
+    flat when saving many large visualizations.
+
+    Args:
+        html_file: path of the file to write, or text file object to write to
+        view: 'head_view', 'model_view' or 'neuron_view'
+        vis_html: html of the elements of the visualization
+        params: params of the visualization, passed to its javascript
+    """
+    if html_file is None:
+        raise ValueError("'html_file' is required if html_action='save'")
+    if isinstance(html_file, (str, os.PathLike)):
+        with open(html_file, 'w', encoding='utf-8') as f:
+            _write_view_html(f, view, vis_html, params, stream=True)
+    else:
+        _write_view_html(html_file, view, vis_html, params, stream=True)
+
+
+def _write_view_html(out, view, vis_html, params, stream=False):
+    libraries_html, libraries_js = library_assets('return')
+    profiling.add_size('libraries', len(libraries_html) + len(libraries_js))
+    out.write(libraries_html)
+    out.write(vis_html)
+    out.write('\n<script type="text/javascript">\n')
+    _write_view_js(out, view, params, libraries_js, stream)
+    out.write('\n</script>\n')
+    profiling.lap('assemble')
+
+
+def _write_view_js(out, view, params, libraries_js, stream=False):
+    # The modules are omitted if libraries_js is None, i.e. they were loaded by init_notebook. Streaming params is
+    # slower than serializing them at once, but does not hold their json in memory.
+    profile = profiling.is_profiling()
+    if profile:
+        # Start of the browser timings reported by reportRenderTimings (util.js)
+        out.write("var bertvizRenderStart = performance.now();\n")
+    if libraries_js is not None:
+        out.write(libraries_js)
+        util_js, view_js = read_asset('util.js'), read_asset(view + '.js')
+        profiling.add_size('scripts', len(util_js) + len(view_js))
+        out.write(util_js)
+        out.write(view_js)
+    if profile:
+        profiling.add_params_sizes(params)
+        out.write("(function (start) {\n")
+        # Required as a module, as the functions of util.js are not globals once init_notebook has loaded it: notebooks
+        # run the javascript of each output in a function scope
+        out.write("requirejs(['bertviz/%s', 'bertviz/util'], function (mount, util) {\n" % view)
+    else:
+        out.write("requirejs(['bertviz/%s'], function (mount) {\n" % view)
+    if profile:
+        out.write("    const loaded = performance.now();\n")
+    out.write("    mount(")
+    profiling.lap('assemble')
+    if stream:
+        json.dump(params, out)
+    else:
+        out.write(json.dumps(params))
+    profiling.lap('serialize')
+    out.write(");\n")
+    if profile:
+        vis_id = json.dumps(params['root_div_id'])
+        out.write("    util.reportRenderTimings(%s, start, loaded, performance.now());\n" % vis_id)
+        out.write("});\n})(bertvizRenderStart);\n")
+    else:
+        out.write("});\n")
@@ -0,0 +1,74 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import bertviz
+from bertviz import assets
+
+
+class TestAssets(unittest.TestCase):
+
+    def tearDown(self):
+        bertviz.set_asset_mode('cdn')
+
+    def test_cdn(self):
+        html, js = assets.library_assets('view')
+        self.assertIn(assets.REQUIRE_JS_URL, html)
+        self.assertIn("d3: 'https://cdnjs.cloudflare.com/ajax/libs/d3/5.7.0/d3.min'", js)
+
+    def test_inline(self):
+        bertviz.set_asset_mode('inline')
+        for html_action in ('view', 'view', 'return'):
+            html, js = assets.library_assets(html_action)
+            self.assertNotIn('cdnjs', html + js)
+            self.assertIn('RequireJS 2.3.7', html)
+            self.assertIn("define('d3', [], function () {", js)
+            self.assertIn("define('jquery', [], function () {", js)
+            self.assertNotIn('</script', js)
+
+    def test_once(self):
+        bertviz.set_asset_mode('once')
+        html, js = assets.library_assets('view')
+        self.assertIn("define('d3'", js)
+        self.assertEqual(assets.library_assets('view'), ('', ''))
+        html, js = assets.library_assets('return')
+        self.assertIn("define('d3'", js)
+        bertviz.set_asset_mode('once')
+        html, js = assets.library_assets('view')
+        self.assertIn("define('d3'", js)
+
+    def test_once_colab(self):
+        # Each output is rendered in its own iframe, so every visualization embeds the libraries
+        bertviz.set_asset_mode('once')
+        with mock.patch.dict(sys.modules, {'google.colab': mock.MagicMock()}):
+            for _ in range(2):
+                html, js = assets.library_assets('view')
+                self.assertIn("define('d3'", js)
+
+    def test_read_asset(self):
+        self.assertIs(assets.read_asset('util.js'), assets.read_asset('util.js'))
+        self.assertIn('RequireJS', assets.read_asset('lib/require.min.js'))
+
+    def test_read_asset_dev_mode(self):
+        package_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, package_dir)
+        path = os.path.join(package_dir, 'test.js')
+        with open(path, 'w') as f:
+            f.write('// v1')
+        os.utime(path, (0, 0))
+        with mock.patch.multiple(assets, PACKAGE_DIR=package_dir, DEV_MODE=True, files=None, _asset_cache={}):
+            self.assertEqual(assets.read_asset('test.js'), '// v1')
+            with open(path, 'w') as f:
+                f.write('// v2')
+            self.assertEqual(assets.read_asset('test.js'), '// v2')
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            bertviz.set_asset_mode('local')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
-from bertviz.neuron_view import get_attention
-from bertviz.transformers_neuron_view import BertTokenizer, BertModel, BertConfig, GPT2Model, GPT2Tokenizer, \
-    XLNetModel, XLNetTokenizer, BertForSequenceClassification, BertForQuestionAnswering, RobertaModel, RobertaTokenizer
+from bertviz.attention_cache import set_attention_cache
+from bertviz.neuron_view import get_attention, get_attention_batch, iter_attention
+from bertviz.transformers_neuron_view import BertTokenizer, BertModel, BertConfig, GPT2Config, GPT2Model, \
+    GPT2Tokenizer, XLNetModel, XLNetTokenizer, BertForSequenceClassification, BertForQuestionAnswering, RobertaModel, RobertaTokenizer
 
 import unittest
 import torch
@@ -13,6 +14,19 @@ class TestAttention(unittest.TestCase):
         if not do_tests == 'true':
             print('You must set environmental variable BERTVIZ_DO_TESTS to "true" in order to perform unit tests. (The tests consume a large amount of disk space.)')
             quit()
+        # Every call runs the model
+        set_attention_cache(max_memory_bytes=0)
+
+    def tearDown(self):
+        set_attention_cache()
+
+    @staticmethod
+    def get_filter_attention(attn_data, name):
+        # Sentence-pair filters are described by the positions they cover in the 'all' attention
+        left_start, left_end = attn_data[name]['left_range']
+        right_start, right_end = attn_data[name]['right_range']
+        return [[[row[right_start:right_end] for row in head[left_start:left_end]] for head in layer]
+                for layer in attn_data[attn_data[name]['attn_source']]['attn']]
 
     def test_bert_attn(self):
         config = BertConfig.from_json_file('fixtures/config.json')
@@ -39,10 +53,10 @@ class TestAttention(unittest.TestCase):
             self.assertEqual(attn_data['bb']['right_text'], tokens_2)
 
             attn_all = attn_data['all']['attn']
-            attn_aa = attn_data['aa']['attn']
-            attn_ab = attn_data['ab']['attn']
-            attn_ba = attn_data['ba']['attn']
-            attn_bb = attn_data['bb']['attn']
+            attn_aa = self.get_filter_attention(attn_data, 'aa')
+            attn_ab = self.get_filter_attention(attn_data, 'ab')
+            attn_ba = self.get_filter_attention(attn_data, 'ba')
+            attn_bb = self.get_filter_attention(attn_data, 'bb')
             num_layers = len(attn_all)
             for layer in range(num_layers):
                 attn_all_layer = torch.tensor(attn_all[layer])
@@ -84,6 +98,96 @@ class TestAttention(unittest.TestCase):
                 expected = torch.ones(num_heads, seq_len, dtype=torch.float32)
                 self.assertTrue(torch.allclose(sum_probs, expected))
 
+    def test_bert_attn_batch(self):
+        config = BertConfig.from_json_file('fixtures/config.json')
+        tokenizer = BertTokenizer('fixtures/vocab.txt')
+        model = BertModel(config)
+        sentences = ['The quickest brown fox jumped over the lazy dog',
+                     ('The quick brown fox', 'jumped over the laziest elmo'),
+                     'The dog',
+                     ('the fox', 'the dog')]
+        batch = get_attention_batch(model, 'bert', tokenizer, sentences, batch_size=3, include_queries_and_keys=True)
+        self.assertEqual(len(batch), len(sentences))
+        for sentence, attn_data in zip(sentences, batch):
+            sentence_a, sentence_b = (sentence, None) if isinstance(sentence, str) else sentence
+            expected = get_attention(model, 'bert', tokenizer, sentence_a, sentence_b, include_queries_and_keys=True)
+            self.assertEqual(attn_data.keys(), expected.keys())
+            self.assertEqual(attn_data['all']['left_text'], expected['all']['left_text'])
+            for key in ('attn', 'queries', 'keys'):
+                self.assertTrue(torch.allclose(torch.tensor(attn_data['all'][key]),
+                                               torch.tensor(expected['all'][key]), atol=1e-5))
+
+    def test_bert_attn_inference_options(self):
+        config = BertConfig.from_json_file('fixtures/config.json')
+        tokenizer = BertTokenizer('fixtures/vocab.txt')
+        model = BertModel(config)
+        sentence_a = 'The quickest brown fox jumped over the lazy dog'
+        num_threads = torch.get_num_threads()
+        expected = get_attention(model, 'bert', tokenizer, sentence_a, include_queries_and_keys=True)
+        attn_data = get_attention(model, 'bert', tokenizer, sentence_a, include_queries_and_keys=True,
+                                  autocast_dtype=torch.bfloat16, num_threads=1)
+        self.assertEqual(torch.get_num_threads(), num_threads)
+        for key in ('attn', 'queries', 'keys'):
+            self.assertTrue(torch.allclose(torch.tensor(attn_data['all'][key]), torch.tensor(expected['all'][key]),
+                                           atol=0.05))
+
+    def test_bert_attn_capture(self):
+        config = BertConfig.from_json_file('fixtures/config.json')
+        tokenizer = BertTokenizer('fixtures/vocab.txt')
+        model = BertModel(config)
+        sentence_a = 'The quickest brown fox jumped over the lazy dog'
+        sentence_b = "the quick brown fox jumped over the laziest elmo"
+        expected = get_attention(model, 'bert', tokenizer, sentence_a, sentence_b, include_queries_and_keys=True)
+        attn_data = get_attention(model, 'bert', tokenizer, sentence_a, sentence_b, include_queries_and_keys=True,
+                                  layers=[3, 7], heads=[0, 2])
+        for key in ('attn', 'queries', 'keys'):
+            self.assertEqual(attn_data['all'][key],
+                             [[expected['all'][key][layer][head] for head in (0, 2)] for layer in (3, 7)])
+        self.assertEqual(attn_data['ab']['left_range'], expected['ab']['left_range'])
+
+        attn_data = get_attention(model, 'bert', tokenizer, sentence_a, layers=[1])
+        self.assertNotIn('queries', attn_data['all'])
+        self.assertEqual(len(attn_data['all']['attn']), 1)
+        self.assertIsNone(model.encoder.layer[0].attention.self.attention_capture)
+
+        with self.assertRaises(ValueError):
+            get_attention(model, 'bert', tokenizer, sentence_a, layers=[12])
+
+    def test_gpt2_attention_capture(self):
+        model = GPT2Model(GPT2Config(vocab_size_or_config_json_file=18, n_positions=16, n_ctx=16, n_embd=12, n_layer=3,
+                                     n_head=3))
+        model.eval()
+        token_ids = torch.tensor([[1, 2, 3, 4]])
+        expected = model(token_ids)[-1]
+        model.set_attention_capture({'layers': [1], 'heads': [2], 'queries_keys': False})
+        attn_data_list = model(token_ids)[-1]
+        self.assertIsNone(attn_data_list[0])
+        self.assertIsNone(attn_data_list[2])
+        self.assertEqual(list(attn_data_list[1]), ['attn'])
+        self.assertTrue(torch.equal(attn_data_list[1]['attn'], expected[1]['attn'][:, [2]]))
+
+    def test_bert_iter_attention(self):
+        config = BertConfig.from_json_file('fixtures/config.json')
+        tokenizer = BertTokenizer('fixtures/vocab.txt')
+        model = BertModel(config)
+        sentence_a = 'The quickest brown fox jumped over the lazy dog'
+        sentence_b = "the quick brown fox jumped over the laziest elmo"
+        expected = get_attention(model, 'bert', tokenizer, sentence_a, sentence_b, include_queries_and_keys=True)
+        records = list(iter_attention(model, 'bert', tokenizer, sentence_a, sentence_b, include_queries_and_keys=True))
+        self.assertEqual([record[0] for record in records], list(range(config.num_hidden_layers)))
+        for layer, attn, queries, keys in records:
+            self.assertTrue(torch.allclose(attn, torch.tensor(expected['all']['attn'][layer])))
+            self.assertTrue(torch.allclose(queries, torch.tensor(expected['all']['queries'][layer])))
+            self.assertTrue(torch.allclose(keys, torch.tensor(expected['all']['keys'][layer])))
+        attn.mul_(2)  # Ordinary tensors, not inference tensors
+
+        records = iter_attention(model, 'bert', tokenizer, sentence_a, layers=[2, 5], heads=[1])
+        layer, attn, queries, keys = next(records)
+        self.assertEqual((layer, attn.shape[0], queries, keys), (2, 1, None, None))
+        records.close()  # Stops the model
+        self.assertEqual(len(model.encoder.layer[0].attention.self._forward_hooks), 0)
+        self.assertIsNone(model.encoder.layer[0].attention.self.attention_capture)
+
     def test_roberta_attn(self):
         model = RobertaModel.from_pretrained('roberta-base')
         tokenizer = RobertaTokenizer.from_pretrained('roberta-base')
@@ -107,10 +211,10 @@ class TestAttention(unittest.TestCase):
         self.assertEqual(attn_data['bb']['right_text'], tokens_2)
 
         attn_all = attn_data['all']['attn']
-        attn_aa = attn_data['aa']['attn']
-        attn_ab = attn_data['ab']['attn']
-        attn_ba = attn_data['ba']['attn']
-        attn_bb = attn_data['bb']['attn']
+        attn_aa = self.get_filter_attention(attn_data, 'aa')
+        attn_ab = self.get_filter_attention(attn_data, 'ab')
+        attn_ba = self.get_filter_attention(attn_data, 'ba')
+        attn_bb = self.get_filter_attention(attn_data, 'bb')
         num_layers = len(attn_all)
         for layer in range(num_layers):
             attn_all_layer = torch.tensor(attn_all[layer])
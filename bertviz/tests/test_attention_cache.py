@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+
+import torch
+
+from bertviz import attention_cache
+from bertviz.attention_cache import clear_attention_cache, model_fingerprint, set_attention_cache
+from bertviz.neuron_view import get_attention
+from bertviz.transformers_neuron_view import BertConfig, BertModel, BertTokenizer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+MAX_MEMORY_BYTES = 256 * 1024 ** 2
+
+
+class CountingBertModel(BertModel):
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.num_calls = 0
+
+    def forward(self, *args, **kwargs):
+        self.num_calls += 1
+        return super().forward(*args, **kwargs)
+
+
+class TestAttentionCache(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.tokenizer = BertTokenizer(os.path.join(FIXTURES_DIR, 'vocab.txt'))
+        self.model = CountingBertModel(BertConfig.from_json_file(os.path.join(FIXTURES_DIR, 'config.json')))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        set_attention_cache(max_memory_bytes=MAX_MEMORY_BYTES)
+        clear_attention_cache()
+
+    def tearDown(self):
+        set_attention_cache()
+        clear_attention_cache()
+        self.temp_dir.cleanup()
+
+    def get_attention(self, sentence_a, sentence_b=None, **kwargs):
+        return get_attention(self.model, 'bert', self.tokenizer, sentence_a, sentence_b, **kwargs)
+
+    def test_memory(self):
+        expected = self.get_attention('The quick brown fox', 'jumped over the lazy dog')
+        self.assertEqual(self.get_attention('The quick brown fox', 'jumped over the lazy dog'), expected)
+        self.assertEqual(self.model.num_calls, 1)
+
+        # Different inputs or options
+        self.get_attention('The quick brown fox')
+        self.get_attention('The quick brown fox', include_queries_and_keys=True)
+        self.assertEqual(self.model.num_calls, 3)
+        self.assertIn('queries', self.get_attention('The quick brown fox', include_queries_and_keys=True)['all'])
+        self.assertEqual(self.model.num_calls, 3)
+
+        # Weights modified in place
+        with torch.no_grad():
+            self.model.pooler.dense.bias.add_(1)
+        self.get_attention('The quick brown fox')
+        self.assertEqual(self.model.num_calls, 4)
+
+        set_attention_cache(max_memory_bytes=0)
+        self.get_attention('The quick brown fox')
+        self.assertEqual(self.model.num_calls, 5)
+
+    def test_weights_edited_in_place(self):
+        # Large enough that a sample of the weights of each tensor would miss most of them
+        config = BertConfig.from_json_file(os.path.join(FIXTURES_DIR, 'config.json'))
+        config.vocab_size = 30000
+        self.model = CountingBertModel(config)
+        expected = self.get_attention('The quick brown fox')
+        token_id = self.tokenizer.convert_tokens_to_ids(['quick'])[0]
+        with torch.no_grad():
+            self.model.embeddings.word_embeddings.weight[token_id] += 5.0
+        self.assertNotEqual(self.get_attention('The quick brown fox'), expected)
+        self.assertEqual(self.model.num_calls, 2)
+
+    def test_weights_edited_through_data(self):
+        # Not detected, as the version counters of the tensors are not bumped: the entries must be cleared
+        expected = self.get_attention('The quick brown fox')
+        with torch.no_grad():
+            self.model.embeddings.word_embeddings.weight.data.mul_(5)
+        self.assertEqual(self.get_attention('The quick brown fox'), expected)
+        clear_attention_cache()
+        self.assertNotEqual(self.get_attention('The quick brown fox'), expected)
+        self.assertEqual(self.model.num_calls, 2)
+
+        # Not cached by default
+        set_attention_cache()
+        expected = self.get_attention('The quick brown fox')
+        self.model.embeddings.word_embeddings.weight.data.mul_(5)
+        self.assertNotEqual(self.get_attention('The quick brown fox'), expected)
+        self.assertEqual(self.model.num_calls, 4)
+
+    def test_weights_converted(self):
+        # Replacing the tensors of the model (as .half() and .to() do) keeps their version counters
+        fingerprint = model_fingerprint(self.model)
+        self.model.half()
+        self.assertNotEqual(model_fingerprint(self.model), fingerprint)
+        fingerprint = model_fingerprint(self.model)
+        self.model.float()
+        self.assertNotEqual(model_fingerprint(self.model), fingerprint)
+
+    def test_disabled(self):
+        set_attention_cache(max_memory_bytes=0)
+        self.get_attention('The quick brown fox')
+        self.get_attention('The quick brown fox')
+        self.assertEqual(self.model.num_calls, 2)
+        self.assertNotIn(self.model, attention_cache._fingerprints)  # Model not fingerprinted
+
+    def test_memory_eviction(self):
+        self.get_attention('The quick brown fox')
+        set_attention_cache(max_memory_bytes=attention_cache._memory_bytes)
+        self.get_attention('The lazy dog')  # Evicts the attention of 'The quick brown fox'
+        self.get_attention('The lazy dog')
+        self.assertEqual(self.model.num_calls, 2)
+        self.get_attention('The quick brown fox')
+        self.assertEqual(self.model.num_calls, 3)
+
+    def test_disk(self):
+        set_attention_cache(cache_dir=self.temp_dir.name)
+        expected = self.get_attention('The quick brown fox', include_queries_and_keys=True)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        # A new session, with the same weights
+        set_attention_cache(max_memory_bytes=0, cache_dir=self.temp_dir.name)
+        model = self.model
+        self.model = CountingBertModel(model.config)
+        self.model.load_state_dict(model.state_dict())
+        self.assertEqual(self.get_attention('The quick brown fox', include_queries_and_keys=True), expected)
+        self.assertEqual(self.model.num_calls, 0)
+
+        entry_size = os.path.getsize(os.path.join(self.temp_dir.name, os.listdir(self.temp_dir.name)[0]))
+        set_attention_cache(cache_dir=self.temp_dir.name, max_disk_bytes=entry_size)
+        self.get_attention('The lazy dog', include_queries_and_keys=True)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        clear_attention_cache()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import torch
+
+from bertviz.budget import estimate_payload_bytes, fit_payload
+from bertviz.util import encode_attention, format_attention
+
+
+class TestBudget(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        # 12 layers x 4 heads x 64 x 64
+        self.attention = format_attention(tuple(torch.softmax(torch.randn(1, 4, 64, 64), dim=-1) for _ in range(12)))
+
+    def attn_data(self):
+        return [{'name': None, 'attn': self.attention, 'left_text': ['a'] * 64, 'right_text': ['a'] * 64}]
+
+    def encoded_bytes(self, attention, precision, sparsity=None):
+        encoded = encode_attention(attention, precision, sparsity)
+        return sum(len(layer) for layer in encoded['layers']) + sum(len(layer) for layer in encoded.get('indptr', [])) \
+            + sum(len(layer) for layer in encoded.get('indices', []))
+
+    def test_estimate_payload_bytes(self):
+        shapes = [(64, 64)]
+        for precision, sparsity in (('float32', None), ('float16', None), ('uint8', None), ('uint8', {'top_k': 8})):
+            estimate = estimate_payload_bytes(shapes, 12, 4, precision, sparsity)
+            self.assertAlmostEqual(estimate / self.encoded_bytes(self.attention, precision, sparsity), 1, delta=0.05)
+        # top_k applies within each sentence of a sentence pair
+        self.assertEqual(estimate_payload_bytes([(64, 64, [32])], 12, 4, 'uint8', {'top_k': 8}),
+                         estimate_payload_bytes(shapes, 12, 4, 'uint8', {'top_k': 16}))
+
+    def test_fit_payload(self):
+        layers, heads = list(range(12)), list(range(4))
+        plan = fit_payload(self.attn_data(), layers, heads, 10 ** 7)
+        self.assertEqual((plan['precision'], plan['sparsity'], plan['message']), (None, None, None))
+
+        plan = fit_payload(self.attn_data(), layers, heads, 600_000)
+        self.assertEqual((plan['precision'], plan['sparsity']), ('float16', None))
+        self.assertIn("precision='float16'", plan['message'])
+
+        plan = fit_payload(self.attn_data(), layers, heads, 150_000)
+        self.assertEqual(plan['precision'], 'uint8')
+        self.assertLess(plan['sparsity']['top_k'], 64)
+        self.assertLessEqual(plan['bytes'], 150_000)
+
+        attn_data = self.attn_data()
+        plan = fit_payload(attn_data, layers, heads, 40_000)
+        self.assertEqual(plan['sparsity'], {'top_k': 8})
+        self.assertEqual(plan['layers'][0], 0)
+        self.assertEqual(plan['layers'][-1], 11)
+        self.assertEqual(plan['heads'], heads)
+        self.assertEqual(attn_data[0]['attn'].shape, (len(plan['layers']), 4, 64, 64))
+        self.assertTrue(torch.equal(attn_data[0]['attn'][-1], self.attention[11]))
+        self.assertIn('layers 0, ', plan['message'])
+
+        attn_data = self.attn_data()
+        plan = fit_payload(attn_data, layers, heads, 6_000)
+        self.assertEqual((plan['layers'], plan['heads']), ([0], [0, 3]))
+        self.assertTrue(torch.equal(attn_data[0]['attn'], self.attention[[0]][:, [0, 3]]))
+
+        plan = fit_payload(self.attn_data(), layers, None, 40_000, keep_layer=5)
+        self.assertIn(5, plan['layers'])
+
+        with self.assertRaises(ValueError):
+            fit_payload(self.attn_data(), layers, None, 6_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import base64
+import struct
+import unittest
+import zlib
+
+import numpy as np
+import torch
+
+from bertviz.heatmap import attention_heatmaps, encode_png
+from bertviz.util import format_attention
+
+
+class TestHeatmap(unittest.TestCase):
+
+    def decode_png(self, png):
+        self.assertEqual(png[:8], b'\x89PNG\r\n\x1a\n')
+        chunks = {}
+        offset = 8
+        while offset < len(png):
+            length, = struct.unpack('>I', png[offset:offset + 4])
+            chunk_type = png[offset + 4:offset + 8]
+            data = png[offset + 8:offset + 8 + length]
+            crc, = struct.unpack('>I', png[offset + 8 + length:offset + 12 + length])
+            self.assertEqual(crc, zlib.crc32(chunk_type + data))
+            chunks[chunk_type] = data
+            offset += 12 + length
+        self.assertIn(b'IEND', chunks)
+        width, height, bit_depth, color_type = struct.unpack('>IIBB', chunks[b'IHDR'][:10])
+        self.assertEqual((bit_depth, color_type), (8, 6))
+        scanlines = np.frombuffer(zlib.decompress(chunks[b'IDAT']), dtype=np.uint8).reshape(height, 1 + width * 4)
+        self.assertTrue((scanlines[:, 0] == 0).all())
+        return scanlines[:, 1:].reshape(height, width, 4)
+
+    def test_encode_png(self):
+        pixels = np.random.RandomState(0).randint(0, 256, size=(3, 5, 4)).astype(np.uint8)
+        self.assertTrue(np.array_equal(self.decode_png(encode_png(pixels)), pixels))
+
+    def test_attention_heatmaps(self):
+        torch.manual_seed(0)
+        attention = format_attention(tuple(torch.softmax(torch.randn(1, 2, 4, 4), dim=-1) for _ in range(3)))
+        heatmaps = attention_heatmaps(attention[1:], layers=[1, 12])
+        self.assertEqual([len(layer) for layer in heatmaps], [2, 2])
+        prefix = 'data:image/png;base64,'
+        for layer, (layer_heatmaps, color) in enumerate(zip(heatmaps, ([255, 127, 14], [44, 160, 44]))):
+            for head, heatmap in enumerate(layer_heatmaps):
+                self.assertTrue(heatmap.startswith(prefix))
+                pixels = self.decode_png(base64.b64decode(heatmap[len(prefix):]))
+                self.assertEqual(pixels.shape, (4, 4, 4))
+                self.assertTrue((pixels[..., :3] == color).all())
+                expected = np.rint(attention[layer + 1, head].numpy() * 255)
+                self.assertTrue(np.array_equal(pixels[..., 3], expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
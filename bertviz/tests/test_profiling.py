@@ -0,0 +1,69 @@
+import os
+import unittest
+
+import torch
+
+import bertviz
+from bertviz import model_view, profiling
+from bertviz.attention_cache import set_attention_cache
+from bertviz.neuron_view import show
+from bertviz.transformers_neuron_view import BertConfig, BertModel, BertTokenizer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class FakeComm:
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_profile(self):
+        attention = tuple(torch.softmax(torch.randn(1, 2, 4, 4), dim=-1) for _ in range(2))
+        tokens = ['a', 'b', 'c', 'd']
+        model_view(attention, tokens, html_action='return')  # Not recorded
+        with bertviz.profile() as prof:
+            html = model_view(attention, tokens, html_action='return', precision='float16', thumbnails='heatmap').data
+        self.assertEqual(len(prof.renders), 1)
+        render = prof.renders[0]
+        self.assertEqual(render['view'], 'model_view')
+        self.assertIn(render['vis_id'], html)
+        self.assertEqual(list(render['stages']), ['format_attention', 'heatmaps', 'encode_attention', 'format_tokens',
+                                                  'assemble', 'serialize'])
+        self.assertTrue(all(seconds >= 0 for seconds in render['stages'].values()))
+        self.assertEqual(set(render['sizes']), {'libraries', 'scripts', 'attention', 'heatmaps', 'tokens', 'params'})
+        self.assertIn("requirejs(['bertviz/model_view', 'bertviz/util'], function (mount, util) {", html)
+        self.assertIn(f"util.reportRenderTimings(\"{render['vis_id']}\", start, loaded, performance.now());", html)
+        self.assertNotIn('reportRenderTimings("', model_view(attention, tokens, html_action='return').data)
+
+        # Timings reported by the browser
+        comm = FakeComm()
+        timings = {'load': 1.5, 'mount': 20.0, 'paint': 3.0}
+        profiling._open_comm(comm, {'content': {'data': {'vis_id': render['vis_id'], 'timings': timings}}})
+        self.assertTrue(comm.closed)
+        self.assertEqual(render['browser'], timings)
+        self.assertIn('browser mount', prof.summary())
+
+    def test_profile_neuron_view(self):
+        tokenizer = BertTokenizer(os.path.join(FIXTURES_DIR, 'vocab.txt'))
+        model = BertModel(BertConfig.from_json_file(os.path.join(FIXTURES_DIR, 'config.json')))
+        set_attention_cache(max_memory_bytes=0)
+        try:
+            with bertviz.profile() as prof:
+                html = show(model, 'bert', tokenizer, 'the quick fox', 'the dog', html_action='return').data
+        finally:
+            set_attention_cache()
+        render = prof.renders[0]
+        self.assertEqual(render['view'], 'neuron_view')
+        self.assertIn(render['vis_id'], html)
+        self.assertEqual(list(render['stages']), ['get_attention', 'assemble', 'serialize'])
+        self.assertEqual(set(render['sizes']), {'libraries', 'scripts', 'attention', 'tokens', 'params'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import bertviz
+from bertviz import runtime
+from bertviz.assets import read_asset
+
+
+class TestRuntime(unittest.TestCase):
+
+    def tearDown(self):
+        runtime._initialized = False
+        bertviz.set_asset_mode('cdn')
+
+    def test_view_assets(self):
+        params = {'root_div_id': 'bertviz-test'}
+        html, js = runtime.view_assets('head_view', params)
+        self.assertIn('require.min.js', html)
+        self.assertIn("define('bertviz/head_view'", js)
+        self.assertNotIn("define('bertviz/model_view'", js)
+        self.assertTrue(js.endswith("requirejs(['bertviz/head_view'], function (mount) {\n"
+                                    "    mount({\"root_div_id\": \"bertviz-test\"});\n});\n"))
+
+    def test_init_notebook(self):
+        bertviz.set_asset_mode('once')
+        bertviz.init_notebook()
+        params = {'root_div_id': 'bertviz-test'}
+        html, js = runtime.view_assets('model_view', params)
+        self.assertEqual(html, '')
+        self.assertTrue(js.startswith("requirejs(['bertviz/model_view']"))
+        # Returned html must be self-contained
+        html = runtime.view_html('model_view', '<div id="bertviz-test"></div>', params)
+        self.assertIn('RequireJS', html)
+        self.assertIn("define('d3'", html)
+        self.assertIn("define('bertviz/model_view'", html)
+        self.assertTrue(html.endswith('mount({"root_div_id": "bertviz-test"});\n});\n\n</script>\n'))
+
+    def test_init_notebook_profile(self):
+        # The functions of util.js are not globals once loaded by init_notebook, so the timings reporter is required
+        bertviz.init_notebook()
+        with bertviz.profile():
+            html, js = runtime.view_assets('head_view', {'root_div_id': 'bertviz-test'})
+        self.assertNotIn('function reportRenderTimings', js)
+        self.assertIn("requirejs(['bertviz/head_view', 'bertviz/util'], function (mount, util) {", js)
+        self.assertIn('util.reportRenderTimings("bertviz-test", start, loaded, performance.now());', js)
+        self.assertIn("define('bertviz/util'", read_asset('util.js'))
+
+    def test_init_notebook_colab(self):
+        # Each output is rendered in its own iframe, so visualizations must keep embedding their javascript
+        with mock.patch.dict(sys.modules, {'google.colab': mock.MagicMock()}):
+            with self.assertWarns(UserWarning):
+                bertviz.init_notebook()
+            html, js = runtime.view_assets('model_view', {'root_div_id': 'bertviz-test'})
+        self.assertIn('require.min.js', html)
+        self.assertIn("define('bertviz/model_view'", js)
+
+    def test_save_view_html(self):
+        params = {'root_div_id': 'bertviz-test', 'attention': [[0.25, 0.75]]}
+        vis_html = '<div id="bertviz-test"></div>'
+        expected = runtime.view_html('head_view', vis_html, params)
+        out = io.StringIO()
+        runtime.save_view_html(out, 'head_view', vis_html, params)
+        self.assertEqual(out.getvalue(), expected)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'head_view.html')
+            runtime.save_view_html(path, 'head_view', vis_html, params)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), expected)
+        with self.assertRaises(ValueError):
+            runtime.save_view_html(None, 'head_view', vis_html, params)
+
+    def test_lazy_imports(self):
+        # In a fresh interpreter, as other tests load these modules
+        code = ("import sys; import bertviz; from bertviz.transformers_neuron_view import BertTokenizer; "
+                "print(sorted(m for m in ('torch', 'IPython', 'boto3', 'requests', 'bertviz.transformers_neuron_view."
+                "modeling_bert') if m in sys.modules))")
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))
+        self.assertEqual(output.decode().strip(), '[]')
+
+
+if __name__ == "__main__":
+    unittest.main()
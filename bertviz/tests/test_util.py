@@ -0,0 +1,186 @@
+import base64
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+
+from bertviz.util import column_splits, format_attention, encode_attention, num_heads, num_layers, \
+    self_attention_filters, sparsity_mask, to_host
+
+
+class TestUtil(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.attention = tuple(torch.softmax(torch.randn(1, 4, 6, 6), dim=-1) for _ in range(3))
+
+    def decode(self, encoded):
+        dtype = {'float32': np.float32, 'float16': np.float16, 'uint8': np.uint8, 'uint16': np.uint16}[encoded['dtype']]
+        layers = [np.frombuffer(base64.b64decode(layer), dtype=dtype) for layer in encoded['layers']]
+        if 'indptr' not in encoded:
+            decoded = torch.tensor(np.stack(layers).astype(np.float32)).reshape(encoded['shape'])
+        if 'indptr' in encoded:
+            index_dtype = {'uint16': np.uint16, 'uint32': np.uint32}[encoded['index_dtype']]
+            num_layers, num_heads, source_len, target_len = encoded['shape']
+            dense = torch.zeros(num_layers, num_heads * source_len, target_len)
+            for layer in range(num_layers):
+                indptr = np.frombuffer(base64.b64decode(encoded['indptr'][layer]), dtype=np.uint32)
+                indices = np.frombuffer(base64.b64decode(encoded['indices'][layer]), dtype=index_dtype)
+                for row in range(num_heads * source_len):
+                    for i in range(indptr[row], indptr[row + 1]):
+                        dense[layer, row, indices[i]] = float(layers[layer][i])
+            decoded = dense.reshape(encoded['shape'])
+        if 'scale' in encoded:
+            decoded = decoded * torch.tensor(encoded['scale'])[:, :, None, None]
+        return decoded
+
+    def test_format_attention_stacked(self):
+        batch_attention = tuple(torch.softmax(torch.randn(3, 4, 6, 6), dim=-1) for _ in range(3))
+        stacked = torch.stack(batch_attention)
+        for layers, heads, batch_index in ((None, None, 1), ([1, 2], [0, 1, 2], 0), ([2, 0], [3, 1], 2),
+                                           ([0, 2], None, [2, 0]), (None, [1, 3], [0, 1])):
+            expected = format_attention(batch_attention, layers, heads, batch_index)
+            self.assertTrue(torch.equal(format_attention(stacked, layers, heads, batch_index), expected))
+            self.assertTrue(torch.equal(format_attention(stacked.numpy(), layers, heads, batch_index), expected))
+        # Contiguous selections are views
+        self.assertEqual(format_attention(stacked, [1, 2], [0, 1], 2).data_ptr(), stacked[1, 2].data_ptr())
+        single_attention = [layer[:1] for layer in batch_attention]
+        self.assertTrue(torch.equal(format_attention(stacked[:, :1]), format_attention(single_attention)))
+        with self.assertRaises(ValueError):
+            format_attention(stacked)
+        with self.assertRaises(ValueError):
+            format_attention(stacked[0])
+        self.assertEqual((num_layers(stacked), num_heads(stacked)), (3, 4))
+        self.assertEqual((num_layers(stacked.numpy()), num_heads(stacked.numpy())), (3, 4))
+        self.assertEqual(num_heads([layer.numpy() for layer in batch_attention]), 4)
+
+    def test_format_attention_memmap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'attention.npy')
+            stacked = torch.stack(self.attention)
+            np.save(filename, stacked.numpy())
+            attention = np.load(filename, mmap_mode='r')
+            self.assertTrue(torch.equal(format_attention(attention, heads=[0, 2]), stacked[:, 0, [0, 2]]))
+            formatted = format_attention(attention, layers=[1, 2])
+            self.assertTrue(torch.equal(formatted, stacked[1:, 0]))
+            del attention, formatted
+
+    def test_to_host(self):
+        attention = torch.stack(self.attention)
+        self.assertIs(to_host(attention, torch.float16), attention)
+
+    @unittest.skipUnless(torch.cuda.is_available(), "requires CUDA")
+    def test_to_host_cuda(self):
+        attention = torch.stack(self.attention)
+        host = to_host(attention.cuda(), torch.float16)
+        self.assertEqual((host.device.type, host.dtype), ('cpu', torch.float16))
+        self.assertTrue(host.is_pinned())
+        self.assertTrue(torch.equal(host, attention.half()))
+        host = to_host(attention.half().cuda(), torch.float32)
+        self.assertEqual(host.dtype, torch.float16)
+        formatted = format_attention([layer.cuda() for layer in self.attention], heads=[1, 2])
+        self.assertEqual((formatted.device.type, formatted.dtype), ('cpu', torch.float32))
+        self.assertTrue(torch.equal(formatted, format_attention(self.attention, heads=[1, 2])))
+
+    def test_encode_attention_lists(self):
+        attention = format_attention(self.attention)
+        self.assertEqual(encode_attention(attention), attention.tolist())
+
+    def test_encode_attention_binary(self):
+        attention = format_attention(self.attention, layers=[0, 2], heads=[1, 3])
+        encoded = encode_attention(attention, 'float32')
+        self.assertEqual(encoded['shape'], [2, 2, 6, 6])
+        self.assertEqual(len(encoded['layers']), 2)
+        self.assertTrue(torch.equal(self.decode(encoded), attention))
+        encoded = encode_attention(attention, 'float16')
+        self.assertTrue(torch.allclose(self.decode(encoded), attention, atol=1e-3))
+
+    def test_encode_attention_quantized(self):
+        attention = format_attention(self.attention)
+        for precision, levels in (('uint8', 255), ('uint16', 65535)):
+            encoded = encode_attention(attention, precision)
+            self.assertEqual(len(encoded['scale']), 3)
+            self.assertEqual(len(encoded['scale'][0]), 4)
+            decoded = self.decode(encoded)
+            max_error = (decoded - attention).abs().max().item()
+            self.assertAlmostEqual(encoded['max_error'], max_error, places=6)
+            self.assertLessEqual(max_error, attention.max().item() / levels)
+
+    def test_encode_attention_sparse(self):
+        attention = format_attention(self.attention)
+        encoded = encode_attention(attention, sparsity={'top_k': 2})
+        self.assertEqual(encoded['dtype'], 'float32')
+        decoded = self.decode(encoded)
+        self.assertTrue(torch.equal((decoded > 0).sum(dim=-1), torch.full((3, 4, 6), 2)))
+        top_k = attention.topk(2, dim=-1)
+        self.assertTrue(torch.equal(decoded.gather(-1, top_k.indices), top_k.values))
+
+        encoded = encode_attention(attention, 'uint8', sparsity={'top_k': 3, 'min_weight': 0.2})
+        decoded = self.decode(encoded)
+        expected = sparsity_mask(attention, top_k=3, min_weight=0.2)
+        self.assertTrue(torch.equal(decoded > 0, expected))
+        self.assertLessEqual((decoded - attention)[expected].abs().max().item(), encoded['max_error'] + 1e-6)
+
+        with self.assertRaises(ValueError):
+            encode_attention(attention, sparsity={'k': 2})
+
+    def test_encode_attention_sparse_sentence_pair(self):
+        attention = format_attention(self.attention)
+        filters = self_attention_filters(self.attention, list('abcdef'), sentence_b_start=4)
+        self.assertEqual(column_splits(filters, 0), [4])
+        decoded = self.decode(encode_attention(attention, sparsity={'top_k': 1}, column_splits=[4]))
+        # Each token keeps its largest weight in each sentence
+        for start, end in ((0, 4), (4, 6)):
+            block = attention[..., start:end]
+            top_k = block.topk(1, dim=-1)
+            self.assertTrue(torch.equal(decoded[..., start:end].gather(-1, top_k.indices), top_k.values))
+            num_retained = (decoded[..., start:end] > 0).sum(dim=-1)
+            self.assertTrue(torch.equal(num_retained, torch.ones(3, 4, 6, dtype=torch.long)))
+
+    def test_encode_attention_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            encode_attention(format_attention(self.attention), 'float64')
+
+    def test_self_attention_filters(self):
+        filters = self_attention_filters(self.attention, list('abcdef'), sentence_b_start=2, layers=[0, 2])
+        self.assertEqual([f['name'] for f in filters], ['All', 'Sentence A -> Sentence A', 'Sentence B -> Sentence B',
+                                                        'Sentence A -> Sentence B', 'Sentence B -> Sentence A'])
+        self.assertTrue(torch.equal(filters[0]['attn'], format_attention(self.attention, layers=[0, 2])))
+        self.assertEqual(filters[3]['attn_source'], 0)
+        self.assertEqual(filters[3]['left_text'], ['a', 'b'])
+        self.assertEqual(filters[3]['right_text'], list('cdef'))
+
+    def test_self_attention_filters_batch(self):
+        batch_attention = tuple(torch.softmax(torch.randn(3, 4, 6, 6), dim=-1) for _ in range(2))
+        tokens = [list('abcdef'), list('ghij') + ['[PAD]'] * 2, list('klmnop')]
+        attention_mask = torch.tensor([[1] * 6, [1] * 4 + [0] * 2, [1] * 6])
+        with self.assertRaises(ValueError):
+            self_attention_filters(batch_attention, tokens)
+
+        filters = self_attention_filters(batch_attention, tokens, batch_index=1, attention_mask=attention_mask,
+                                         heads=[0, 3])
+        self.assertEqual(len(filters), 1)
+        self.assertIsNone(filters[0]['name'])
+        self.assertEqual(filters[0]['left_text'], list('ghij'))
+        expected = torch.stack([layer[1, [0, 3], :4, :4] for layer in batch_attention])
+        self.assertTrue(torch.equal(filters[0]['attn'], expected))
+        # NumPy integers, e.g. from np.argmax
+        filters = self_attention_filters(batch_attention, tokens, sentence_b_start=np.int64(2),
+                                         batch_index=np.int64(1), attention_mask=attention_mask, heads=[0, 3])
+        self.assertEqual(filters[0]['name'], 'All')
+        self.assertTrue(torch.equal(filters[0]['attn'], expected))
+
+        filters = self_attention_filters(batch_attention, tokens, sentence_b_start=[2, 3], batch_index=[1, 2],
+                                         attention_mask=attention_mask)
+        self.assertEqual([f['name'] for f in filters][::5], ['Example 1', 'Example 2'])
+        self.assertEqual(filters[6]['name'], 'Example 2: Sentence A -> Sentence A')
+        self.assertEqual(filters[6]['attn_source'], 5)
+        self.assertEqual(filters[6]['left_text'], list('klm'))
+        self.assertEqual(filters[1]['right_text'], list('gh'))
+        self.assertTrue(torch.equal(filters[5]['attn'], torch.stack([layer[2] for layer in batch_attention])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,46 +1,69 @@
 __version__ = "1.1.0"
-from .tokenization_bert import BertTokenizer, BasicTokenizer, WordpieceTokenizer
-from .tokenization_openai import OpenAIGPTTokenizer
-from .tokenization_transfo_xl import (TransfoXLTokenizer, TransfoXLCorpus)
-from .tokenization_gpt2 import GPT2Tokenizer
-from .tokenization_xlnet import XLNetTokenizer, SPIECE_UNDERLINE
-from .tokenization_xlm import XLMTokenizer
-from .tokenization_roberta import RobertaTokenizer
-
-from .tokenization_utils import (PreTrainedTokenizer)
-
-from .modeling_bert import (BertConfig, BertPreTrainedModel, BertModel, BertForPreTraining,
-                            BertForMaskedLM, BertForNextSentencePrediction,
-                            BertForSequenceClassification, BertForMultipleChoice,
-                            BertForTokenClassification, BertForQuestionAnswering,
-                            load_tf_weights_in_bert, BERT_PRETRAINED_MODEL_ARCHIVE_MAP,
-                            BERT_PRETRAINED_CONFIG_ARCHIVE_MAP)
-from .modeling_openai import (OpenAIGPTConfig, OpenAIGPTPreTrainedModel, OpenAIGPTModel,
-                              OpenAIGPTLMHeadModel, OpenAIGPTDoubleHeadsModel,
-                              load_tf_weights_in_openai_gpt, OPENAI_GPT_PRETRAINED_CONFIG_ARCHIVE_MAP,
-                              OPENAI_GPT_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_transfo_xl import (TransfoXLConfig, TransfoXLModel, TransfoXLLMHeadModel,
-                                  load_tf_weights_in_transfo_xl, TRANSFO_XL_PRETRAINED_CONFIG_ARCHIVE_MAP,
-                                  TRANSFO_XL_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_gpt2 import (GPT2Config, GPT2PreTrainedModel, GPT2Model,
-                            GPT2LMHeadModel, GPT2DoubleHeadsModel,
-                            load_tf_weights_in_gpt2, GPT2_PRETRAINED_CONFIG_ARCHIVE_MAP,
-                            GPT2_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_xlnet import (XLNetConfig,
-                             XLNetPreTrainedModel, XLNetModel, XLNetLMHeadModel,
-                             XLNetForSequenceClassification, XLNetForQuestionAnswering,
-                             load_tf_weights_in_xlnet, XLNET_PRETRAINED_CONFIG_ARCHIVE_MAP,
-                             XLNET_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_xlm import (XLMConfig, XLMPreTrainedModel , XLMModel,
-                           XLMWithLMHeadModel, XLMForSequenceClassification,
-                           XLMForQuestionAnswering, XLM_PRETRAINED_CONFIG_ARCHIVE_MAP,
-                           XLM_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_roberta import (RobertaConfig, RobertaForMaskedLM, RobertaModel, RobertaForSequenceClassification,
-                               ROBERTA_PRETRAINED_CONFIG_ARCHIVE_MAP, ROBERTA_PRETRAINED_MODEL_ARCHIVE_MAP)
-from .modeling_utils import (WEIGHTS_NAME, CONFIG_NAME, TF_WEIGHTS_NAME,
-                          PretrainedConfig, PreTrainedModel, prune_layer, Conv1D)
-
-# from .optimization import (AdamW, ConstantLRSchedule, WarmupConstantSchedule, WarmupCosineSchedule,
-#                            WarmupCosineWithHardRestartsSchedule, WarmupLinearSchedule)
-
-from .file_utils import (PYTORCH_TRANSFORMERS_CACHE, PYTORCH_PRETRAINED_BERT_CACHE, cached_path)
+
+import importlib
+
+# Attributes are loaded from their module on first access (PEP 562), so that e.g. using the BERT classes does not
+# import every model and tokenizer module, along with their dependencies (boto3, requests, regex, ...)
+_IMPORTS = {
+    'tokenization_bert': ['BertTokenizer', 'BasicTokenizer', 'WordpieceTokenizer'],
+    'tokenization_openai': ['OpenAIGPTTokenizer'],
+    'tokenization_transfo_xl': ['TransfoXLTokenizer', 'TransfoXLCorpus'],
+    'tokenization_gpt2': ['GPT2Tokenizer'],
+    'tokenization_xlnet': ['XLNetTokenizer', 'SPIECE_UNDERLINE'],
+    'tokenization_xlm': ['XLMTokenizer'],
+    'tokenization_roberta': ['RobertaTokenizer'],
+
+    'tokenization_utils': ['PreTrainedTokenizer'],
+
+    'modeling_bert': ['BertConfig', 'BertPreTrainedModel', 'BertModel', 'BertForPreTraining',
+                      'BertForMaskedLM', 'BertForNextSentencePrediction',
+                      'BertForSequenceClassification', 'BertForMultipleChoice',
+                      'BertForTokenClassification', 'BertForQuestionAnswering',
+                      'load_tf_weights_in_bert', 'BERT_PRETRAINED_MODEL_ARCHIVE_MAP',
+                      'BERT_PRETRAINED_CONFIG_ARCHIVE_MAP'],
+    'modeling_openai': ['OpenAIGPTConfig', 'OpenAIGPTPreTrainedModel', 'OpenAIGPTModel',
+                        'OpenAIGPTLMHeadModel', 'OpenAIGPTDoubleHeadsModel',
+                        'load_tf_weights_in_openai_gpt', 'OPENAI_GPT_PRETRAINED_CONFIG_ARCHIVE_MAP',
+                        'OPENAI_GPT_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_transfo_xl': ['TransfoXLConfig', 'TransfoXLModel', 'TransfoXLLMHeadModel',
+                            'load_tf_weights_in_transfo_xl', 'TRANSFO_XL_PRETRAINED_CONFIG_ARCHIVE_MAP',
+                            'TRANSFO_XL_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_gpt2': ['GPT2Config', 'GPT2PreTrainedModel', 'GPT2Model',
+                      'GPT2LMHeadModel', 'GPT2DoubleHeadsModel',
+                      'load_tf_weights_in_gpt2', 'GPT2_PRETRAINED_CONFIG_ARCHIVE_MAP',
+                      'GPT2_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_xlnet': ['XLNetConfig',
+                       'XLNetPreTrainedModel', 'XLNetModel', 'XLNetLMHeadModel',
+                       'XLNetForSequenceClassification', 'XLNetForQuestionAnswering',
+                       'load_tf_weights_in_xlnet', 'XLNET_PRETRAINED_CONFIG_ARCHIVE_MAP',
+                       'XLNET_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_xlm': ['XLMConfig', 'XLMPreTrainedModel', 'XLMModel',
+                     'XLMWithLMHeadModel', 'XLMForSequenceClassification',
+                     'XLMForQuestionAnswering', 'XLM_PRETRAINED_CONFIG_ARCHIVE_MAP',
+                     'XLM_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_roberta': ['RobertaConfig', 'RobertaForMaskedLM', 'RobertaModel', 'RobertaForSequenceClassification',
+                         'ROBERTA_PRETRAINED_CONFIG_ARCHIVE_MAP', 'ROBERTA_PRETRAINED_MODEL_ARCHIVE_MAP'],
+    'modeling_utils': ['WEIGHTS_NAME', 'CONFIG_NAME', 'TF_WEIGHTS_NAME',
+                       'PretrainedConfig', 'PreTrainedModel', 'prune_layer', 'Conv1D'],
+
+    # 'optimization': ['AdamW', 'ConstantLRSchedule', 'WarmupConstantSchedule', 'WarmupCosineSchedule',
+    #                  'WarmupCosineWithHardRestartsSchedule', 'WarmupLinearSchedule'],
+
+    'file_utils': ['PYTORCH_TRANSFORMERS_CACHE', 'PYTORCH_PRETRAINED_BERT_CACHE', 'cached_path'],
+}
+_ATTRIBUTE_MODULES = {name: module for module, names in _IMPORTS.items() for name in names}
+
+__all__ = list(_ATTRIBUTE_MODULES)
+
+
+def __getattr__(name):
+    module = _ATTRIBUTE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value  # Later accesses don't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTE_MODULES))
@@ -35,7 +35,7 @@ from torch import nn
 from torch.nn import CrossEntropyLoss, MSELoss
 
 from .modeling_utils import (WEIGHTS_NAME, CONFIG_NAME, PretrainedConfig, PreTrainedModel,
-                             prune_linear_layer, add_start_docstrings)
+                             prune_linear_layer, add_start_docstrings, capture_attention)
 
 logger = logging.getLogger(__name__)
 
@@ -285,6 +285,7 @@ class BertSelfAttention(nn.Module):
                 "The hidden size (%d) is not a multiple of the number of attention "
                 "heads (%d)" % (config.hidden_size, config.num_attention_heads))
         self.output_attentions = config.output_attentions
+        self.attention_capture = None  # See PreTrainedModel.set_attention_capture
 
         self.num_attention_heads = config.num_attention_heads
         self.attention_head_size = int(config.hidden_size / config.num_attention_heads)
@@ -334,11 +335,11 @@ class BertSelfAttention(nn.Module):
         context_layer = context_layer.view(*new_context_layer_shape)
 
         if self.output_attentions:
-            attn_data = {
+            attn_data = capture_attention({
                 'attn': attention_probs,
                 'queries': query_layer,
                 'keys': key_layer
-            }
+            }, self.attention_capture)
             outputs = (context_layer, attn_data)
         else:
             outputs = (context_layer,)
@@ -36,7 +36,7 @@ from torch.nn.parameter import Parameter
 
 from .modeling_utils import (Conv1D, CONFIG_NAME, WEIGHTS_NAME, PretrainedConfig,
                              PreTrainedModel, prune_conv1d_layer, SequenceSummary,
-                             add_start_docstrings)
+                             add_start_docstrings, capture_attention)
 from .modeling_bert import BertLayerNorm as LayerNorm
 
 logger = logging.getLogger(__name__)
@@ -222,6 +222,7 @@ class Attention(nn.Module):
     def __init__(self, nx, n_ctx, config, scale=False):
         super(Attention, self).__init__()
         self.output_attentions = config.output_attentions
+        self.attention_capture = None  # See PreTrainedModel.set_attention_capture
 
         n_state = nx  # in Attention: n_state=768 (nx=n_embd)
         # [switch nx => n_state from Block to Attention to keep identical to TF implem]
@@ -307,11 +308,11 @@ class Attention(nn.Module):
 
         if self.output_attentions:
             attention_probs = attn_outputs[1]
-            attn_data = {
+            attn_data = capture_attention({
                 'attn': attention_probs,
                 'queries': query,
                 'keys': key.transpose(-1, -2)
-            }
+            }, self.attention_capture)
             outputs = [a, present, attn_data]
         else:
             outputs = [a, present]
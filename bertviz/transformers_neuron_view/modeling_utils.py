@@ -346,6 +346,38 @@ class PreTrainedModel(nn.Module):
         base_model = getattr(self, self.base_model_prefix, self)  # get the base model if needed
         base_model._prune_heads(heads_to_prune)
 
+    def set_attention_capture(self, capture=None):
+        """ Select the attention returned by the self-attention modules of the model when ``config.output_attentions``
+            is set, so that the attention of other layers and heads is neither kept nor returned.
+
+            Arguments:
+
+                capture: None (default) to return the attention (and queries and keys, for the models that return them)
+                    of every layer and head, or a dict with the optional keys:
+
+                    - ``layers``: indices of the layers whose attention is returned (default: all). The attention of
+                      other layers is returned as None.
+                    - ``heads``: indices of the heads whose attention is returned in the selected layers (default: all)
+                    - ``queries_keys``: whether to return queries and keys (default: True)
+        """
+        modules = [module for module in self.modules() if hasattr(module, 'attention_capture')]
+        if capture is None:
+            for module in modules:
+                module.attention_capture = None
+            return
+        unknown = set(capture) - {'layers', 'heads', 'queries_keys'}
+        if unknown:
+            raise ValueError("Unknown keys in capture: {}".format(', '.join(sorted(unknown))))
+        layers = capture.get('layers')
+        if layers is not None and any(layer < 0 or layer >= len(modules) for layer in layers):
+            raise ValueError("Layers in capture must be between 0 and {}".format(len(modules) - 1))
+        for i, module in enumerate(modules):
+            if layers is not None and i not in layers:
+                module.attention_capture = False
+            else:
+                module.attention_capture = {'heads': capture.get('heads'),
+                                            'queries_keys': capture.get('queries_keys', True)}
+
     def save_pretrained(self, save_directory):
         """ Save a model and its configuration file to a directory, so that it
             can be re-loaded using the `:func:`~pytorch_transformers.PreTrainedModel.from_pretrained`` class method.
@@ -919,3 +951,23 @@ def prune_layer(layer, index, dim=None):
         return prune_conv1d_layer(layer, index, dim=1 if dim is None else dim)
     else:
         raise ValueError("Can't prune layer of class {}".format(layer.__class__))
+
+
+def capture_attention(attn_data, capture):
+    """ Select the attention of one layer to return, given the capture spec of its self-attention module (see
+        :func:`PreTrainedModel.set_attention_capture`).
+
+        Arguments:
+
+            attn_data: dict of 'attn' and, optionally, 'queries' and 'keys' tensors of shape
+                (batch_size, num_heads, ...)
+            capture: None to return all of attn_data, False to return None, or a dict of 'heads' (None for all heads)
+                and 'queries_keys'
+    """
+    if capture is None:
+        return attn_data
+    if capture is False:
+        return None
+    heads = capture['heads']
+    return {key: value if heads is None else value[:, heads] for key, value in attn_data.items()
+            if key == 'attn' or capture['queries_keys']}
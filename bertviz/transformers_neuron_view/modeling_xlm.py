@@ -31,7 +31,7 @@ from torch.nn import functional as F
 from torch.nn import CrossEntropyLoss, MSELoss
 
 from .modeling_utils import (PretrainedConfig, PreTrainedModel, add_start_docstrings,
-                             prune_linear_layer, SequenceSummary, SQuADHead)
+                             prune_linear_layer, SequenceSummary, SQuADHead, capture_attention)
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +256,7 @@ class MultiHeadAttention(nn.Module):
         super(MultiHeadAttention, self).__init__()
         self.layer_id = next(MultiHeadAttention.NEW_ID)
         self.output_attentions = config.output_attentions
+        self.attention_capture = None  # See PreTrainedModel.set_attention_capture
         self.dim = dim
         self.n_heads = n_heads
         self.dropout = config.attention_dropout
@@ -344,7 +345,9 @@ class MultiHeadAttention(nn.Module):
 
         outputs = (self.out_lin(context),)
         if self.output_attentions:
-            outputs = outputs + (weights,)
+            # Returns no queries and keys
+            attn_data = capture_attention({'attn': weights}, self.attention_capture)
+            outputs = outputs + (attn_data and attn_data['attn'],)
         return outputs
 
 
@@ -35,7 +35,7 @@ from torch.nn import CrossEntropyLoss, MSELoss
 
 from .modeling_utils import (CONFIG_NAME, WEIGHTS_NAME, PretrainedConfig, PreTrainedModel,
                              SequenceSummary, PoolerAnswerClass, PoolerEndLogits, PoolerStartLogits,
-                             add_start_docstrings)
+                             add_start_docstrings, capture_attention)
 
 
 logger = logging.getLogger(__name__)
@@ -360,6 +360,7 @@ class XLNetRelativeAttention(nn.Module):
     def __init__(self, config):
         super(XLNetRelativeAttention, self).__init__()
         self.output_attentions = config.output_attentions
+        self.attention_capture = None  # See PreTrainedModel.set_attention_capture
 
         if config.d_model % config.n_head != 0:
             raise ValueError(
@@ -542,9 +543,11 @@ class XLNetRelativeAttention(nn.Module):
 
         outputs = (output_h, output_g)
         if self.output_attentions:
-            attn_data = {
-                'attn': attn_prob.permute(2, 3, 0, 1).contiguous(),
-            }
+            attn_data = capture_attention({
+                'attn': attn_prob.permute(2, 3, 0, 1),
+            }, self.attention_capture)
+            if attn_data is not None:
+                attn_data['attn'] = attn_data['attn'].contiguous()
             # TΩΩΩ Add query, key, etc. info (Uses different mechanism than standard transformer)
             outputs = outputs + (attn_data,)
         return outputs
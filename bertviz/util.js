@@ -0,0 +1,293 @@
+/**
+ * @fileoverview Helpers shared by the head view, model view and neuron view.
+ **/
+
+/**
+ * Decode the attention data of each attention filter, given as an array or object of filters. A filter with an
+ * 'attn_source' (e.g. Sentence A -> Sentence B) carries no attention of its own: its attention is a view into the
+ * attention of filter 'attn_source' restricted to the source positions in 'left_range' and the target positions in
+ * 'right_range'. Queries are restricted to the source positions and keys to the target positions.
+ */
+function decodeAttentionData(attention) {
+    const decoded = Array.isArray(attention) ? [] : {};
+    for (const [name, attnData] of Object.entries(attention)) {
+        if (attnData.attn_source == null) {
+            decoded[name] = Object.assign({}, attnData, {attn: decodeAttention(attnData.attn)});
+            if (attnData.queries) {
+                decoded[name].queries = decodeAttention(attnData.queries);
+                decoded[name].keys = decodeAttention(attnData.keys);
+            }
+        }
+    }
+    for (const [name, attnData] of Object.entries(attention)) {
+        if (attnData.attn_source != null) {
+            const source = decoded[attnData.attn_source];
+            decoded[name] = Object.assign({}, attnData, {
+                attn: sliceAttention(source.attn, attnData.left_range, attnData.right_range)
+            });
+            if (source.queries) {
+                decoded[name].queries = sliceAttention(source.queries, attnData.left_range, null);
+                decoded[name].keys = sliceAttention(source.keys, attnData.right_range, null);
+            }
+        }
+    }
+    return decoded;
+}
+
+/**
+ * Restrict attn[layer][head] to the rows in rowRange and, if given, the columns in columnRange, without copying
+ * typed-array rows.
+ */
+function sliceAttention(attn, rowRange, columnRange) {
+    return attn.map(layer => layer == null ? null : layer.map(head => {
+        const rows = head.slice(rowRange[0], rowRange[1]);
+        if (columnRange == null) {
+            return rows;
+        }
+        return rows.map(row => sliceRow(row, columnRange));
+    }));
+}
+
+function sliceRow(row, columnRange) {
+    if (row.indices) {
+        // Sparse row: keep the weights in columnRange, renumbering their target positions from its start
+        const start = searchSorted(row.indices, columnRange[0]);
+        const end = searchSorted(row.indices, columnRange[1]);
+        return {
+            indices: row.indices.subarray(start, end).map(index => index - columnRange[0]),
+            values: row.values.subarray(start, end),
+            length: columnRange[1] - columnRange[0]
+        };
+    }
+    return row.subarray ? row.subarray(columnRange[0], columnRange[1]) : row.slice(columnRange[0], columnRange[1]);
+}
+
+/**
+ * Decode attention as produced by util.encode_attention into nested arrays indexed as attn[layer][head][source][target].
+ * Nested lists (the default JSON encoding) are returned unchanged. Binary encodings are decoded (and dequantized) into
+ * one Float32Array per layer, and each source row is a zero-copy subarray view into it. Sparse encodings are not
+ * expanded: each source row is an object {indices, values, length} holding the target positions and weights of the
+ * weights that were kept, and the number of target positions. Use attentionEdges and attentionWeight to read rows of
+ * either kind.
+ */
+function decodeAttention(attn) {
+    if (Array.isArray(attn)) {
+        return attn;
+    }
+    // Decoded layers are cached on the encoded attention, so that lazily loaded layers can be decoded as they arrive.
+    // Layers that have not been loaded yet are null.
+    if (attn.decoded == null) {
+        attn.decoded = new Array(attn.shape[0]).fill(null);
+    }
+    for (let layer = 0; layer < attn.shape[0]; layer++) {
+        if (attn.decoded[layer] == null && attn.layers[layer] != null) {
+            attn.decoded[layer] = decodeAttentionLayer(attn, layer);
+        }
+    }
+    return attn.decoded.slice();
+}
+
+/**
+ * Add layers of lazily loaded attention, as sent by the kernel (see comm.py) in reply to a request for the layers.
+ */
+function addAttentionLayers(attn, layers) {
+    for (const [layer, encoded] of layers) {
+        for (const key of ['layers', 'scale', 'indptr', 'indices']) {
+            if (encoded[key]) {
+                if (attn[key] == null) {
+                    attn[key] = new Array(attn.shape[0]).fill(null);
+                }
+                attn[key][layer] = encoded[key][0];
+            }
+        }
+        if (encoded.index_dtype) {
+            attn.index_dtype = encoded.index_dtype;
+        }
+    }
+}
+
+/**
+ * Open a comm channel to the kernel in the classic Jupyter notebook or Colab. Messages received from the kernel are
+ * passed to onMessage. Returns an object with a send(data) method, or null if no kernel is reachable from this page.
+ */
+function openKernelComm(targetName, data, onMessage) {
+    if (window.google && google.colab && google.colab.kernel && google.colab.kernel.comms) {
+        const opened = google.colab.kernel.comms.open(targetName, data);
+        opened.then(async function (comm) {
+            for await (const message of comm.messages) {
+                onMessage(message.data);
+            }
+        });
+        return {send: message => opened.then(comm => comm.send(message))};
+    }
+    if (window.Jupyter && Jupyter.notebook && Jupyter.notebook.kernel) {
+        const comm = Jupyter.notebook.kernel.comm_manager.new_comm(targetName, data);
+        comm.on_msg(msg => onMessage(msg.content.data));
+        return {send: message => comm.send(message)};
+    }
+    return null;
+}
+
+/**
+ * Report the browser timings (in milliseconds) of a visualization rendered in a bertviz.profile() block: loading the
+ * libraries and modules (from the start of its script), mounting it and painting the next frame. Timings are logged to
+ * the console, and sent to the kernel if it is reachable.
+ */
+function reportRenderTimings(visId, start, loaded, mounted) {
+    requestAnimationFrame(function () {
+        // Callbacks scheduled from an animation frame run after it is painted
+        setTimeout(function () {
+            const timings = {load: loaded - start, mount: mounted - loaded, paint: performance.now() - mounted};
+            console.log(`bertviz: render timings of ${visId} (ms)`, timings);
+            openKernelComm('bertviz_profile', {vis_id: visId, timings: timings}, function () {});
+        });
+    });
+}
+
+/**
+ * Return [target index, weight] pairs for one source row of attention. Zero weights, including weights dropped by sparse
+ * encodings, would be drawn fully transparent, so they are skipped to avoid creating DOM elements for them.
+ */
+function attentionEdges(row) {
+    const edges = [];
+    if (row.indices) {
+        for (let i = 0; i < row.indices.length; i++) {
+            if (row.values[i] !== 0) {
+                edges.push([row.indices[i], row.values[i]]);
+            }
+        }
+        return edges;
+    }
+    for (let i = 0; i < row.length; i++) {
+        if (row[i] !== 0) {
+            edges.push([i, row[i]]);
+        }
+    }
+    return edges;
+}
+
+/**
+ * Return the weight of one target position in one source row of attention, which is zero if a sparse encoding dropped
+ * it.
+ */
+function attentionWeight(row, index) {
+    if (row.indices) {
+        const i = searchSorted(row.indices, index);
+        return row.indices[i] === index ? row.values[i] : 0;
+    }
+    return row[index];
+}
+
+function decodeAttentionLayer(attn, layer) {
+    const [, nHeads, nSource, nTarget] = attn.shape;
+    let values = decodeBuffer(attn.layers[layer], attn.dtype);
+    // Offset of the weights of each (head, source position) row in values: compressed sparse rows hold only the weights
+    // that were kept
+    const indptr = attn.indptr ? decodeBuffer(attn.indptr[layer], 'uint32') : null;
+    const rowOffset = row => indptr ? indptr[row] : row * nTarget;
+    if (attn.scale) {
+        values = dequantize(values, attn.scale[layer], head => rowOffset(head * nSource));
+    }
+    const indices = indptr ? decodeBuffer(attn.indices[layer], attn.index_dtype) : null;
+    const heads = [];
+    for (let head = 0; head < nHeads; head++) {
+        const rows = [];
+        for (let source = 0; source < nSource; source++) {
+            const start = rowOffset(head * nSource + source);
+            const end = rowOffset(head * nSource + source + 1);
+            if (indices) {
+                rows.push({indices: indices.subarray(start, end), values: values.subarray(start, end), length: nTarget});
+            } else {
+                rows.push(values.subarray(start, end));
+            }
+        }
+        heads.push(rows);
+    }
+    return heads;
+}
+
+function decodeBuffer(b64, dtype) {
+    const binary = atob(b64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    if (dtype === 'float32') {
+        return new Float32Array(bytes.buffer);
+    } else if (dtype === 'float16') {
+        const halves = new Uint16Array(bytes.buffer);
+        const values = new Float32Array(halves.length);
+        const table = float16Table();
+        for (let i = 0; i < halves.length; i++) {
+            values[i] = table[halves[i]];
+        }
+        return values;
+    } else if (dtype === 'uint8') {
+        return bytes;
+    } else if (dtype === 'uint16') {
+        return new Uint16Array(bytes.buffer);
+    } else if (dtype === 'uint32') {
+        return new Uint32Array(bytes.buffer);
+    }
+    throw new Error("Unsupported attention dtype: " + dtype);
+}
+
+function searchSorted(sorted, value) {
+    // Index of the first element of a sorted array that is not less than value
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+        const mid = (low + high) >> 1;
+        if (sorted[mid] < value) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+function dequantize(quantized, headScales, headOffset) {
+    // Map quantization levels back to attention weights using the step size of each head, whose levels start at
+    // headOffset(head)
+    const values = new Float32Array(quantized.length);
+    for (let head = 0; head < headScales.length; head++) {
+        const scale = headScales[head];
+        const end = headOffset(head + 1);
+        for (let i = headOffset(head); i < end; i++) {
+            values[i] = quantized[i] * scale;
+        }
+    }
+    return values;
+}
+
+var FLOAT16_TABLE = null;
+
+function float16Table() {
+    // Lookup table from every IEEE 754 half-precision bit pattern to its value
+    if (FLOAT16_TABLE == null) {
+        FLOAT16_TABLE = new Float32Array(65536);
+        for (let h = 0; h < 65536; h++) {
+            const sign = (h & 0x8000) ? -1 : 1;
+            const exponent = (h >> 10) & 0x1f;
+            const fraction = h & 0x3ff;
+            let value;
+            if (exponent === 0) {
+                value = fraction * Math.pow(2, -24);
+            } else if (exponent === 31) {
+                value = fraction ? NaN : Infinity;
+            } else {
+                value = (1 + fraction / 1024) * Math.pow(2, exponent - 15);
+            }
+            FLOAT16_TABLE[h] = sign * value;
+        }
+    }
+    return FLOAT16_TABLE;
+}
+
+// Helpers used outside of the view modules, e.g. by the mount call of visualizations rendered in a bertviz.profile()
+// block (see runtime.py). The function declarations of this file are not globals once init_notebook() has loaded it, as
+// notebooks run the javascript of each output in a function scope.
+define('bertviz/util', [], function () {
+    return {reportRenderTimings: reportRenderTimings};
+});
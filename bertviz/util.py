@@ -1,29 +1,351 @@
+import base64
+import warnings
+
+import numpy as np
 import torch
 
+_PRECISION_DTYPES = {
+    'float32': np.dtype('<f4'),
+    'float16': np.dtype('<f2'),
+    'uint8': np.dtype('u1'),
+    'uint16': np.dtype('<u2')
+}
+_INDEX_DTYPES = {
+    'uint16': np.dtype('<u2'),
+    'uint32': np.dtype('<u4')
+}
+_QUANTIZATION_LEVELS = {
+    'uint8': 255,
+    'uint16': 65535
+}
+
+
+def format_attention(attention, layers=None, heads=None, batch_index=None, precision=None):
+    """Format attention into a single tensor of shape (num_layers, num_heads, seq_len, seq_len)
+
+    Args:
+        attention: list of tensors (one for each layer) of shape (batch_size, num_heads, seq_len, seq_len), or a tensor
+            or numpy array (possibly memory-mapped) of shape (num_layers, batch_size, num_heads, seq_len, seq_len)
+        layers: indices of layers to include. Defaults to all layers.
+        heads: indices of heads to include. Defaults to all heads.
+        batch_index: index of the example to include, or list of indices, which adds a dimension for the examples
+            after the layers. Defaults to the only example of a batch of size 1.
+        precision: precision the attention will be encoded with (see ``encode_attention``). Attention on a GPU is cast
+            to a smaller dtype on the device if the precision allows, e.g. to float16 for 'float16'.
 
-def format_attention(attention, layers=None, heads=None):
+    Stacked attention is not copied if the selected layers, examples and heads are contiguous, and is otherwise
+    gathered in a single indexing operation. Numpy arrays are only read where selected. Attention on a GPU is copied
+    to the host in a single transfer (see ``to_host``), after selection.
+    """
+    dtype = torch.float16 if precision == 'float16' else torch.float32
+    if isinstance(attention, (torch.Tensor, np.ndarray)):
+        return to_host(_format_stacked_attention(attention, layers, heads, batch_index), dtype)
     if layers:
         attention = [attention[layer_index] for layer_index in layers]
     squeezed = []
     for layer_attention in attention:
-        # 1 x num_heads x seq_len x seq_len
+        layer_attention = torch.as_tensor(layer_attention)
+        # batch_size x num_heads x seq_len x seq_len
         if len(layer_attention.shape) != 4:
             raise ValueError("The attention tensor does not have the correct number of dimensions. Make sure you set "
                              "output_attentions=True when initializing your model.")
-        layer_attention = layer_attention.squeeze(0)
+        if batch_index is None:
+            layer_attention = layer_attention.squeeze(0)
+        else:
+            # Index or list of indices of examples in the batch
+            layer_attention = layer_attention[batch_index]
         if heads:
-            layer_attention = layer_attention[heads]
+            layer_attention = layer_attention[..., heads, :, :]
         squeezed.append(layer_attention)
-    # num_layers x num_heads x seq_len x seq_len
-    return torch.stack(squeezed)
+    # num_layers x [num_examples x] num_heads x seq_len x seq_len
+    return to_host(torch.stack(squeezed), dtype)
+
+
+def to_host(attention, dtype=None, non_blocking=False):
+    """Copy attention to host memory in a single transfer
+
+    Args:
+        attention: tensor on any device. Tensors already in host memory are returned as is.
+        dtype: dtype to cast to on the device before the transfer, if it is smaller than the dtype of the attention
+        non_blocking: return as soon as the transfer is queued. The result must not be read before synchronizing with
+            the device, e.g. with ``torch.cuda.synchronize()``.
+
+    Returns:
+        Tensor in host memory (pinned if copied from a CUDA device)
+    """
+    if attention.device.type == 'cpu':
+        return attention
+    attention = attention.detach()
+    if dtype is not None and torch.finfo(dtype).bits < torch.finfo(attention.dtype).bits:
+        attention = attention.to(dtype)
+    host = torch.empty(attention.shape, dtype=attention.dtype, pin_memory=attention.device.type == 'cuda')
+    return host.copy_(attention, non_blocking=non_blocking)
+
+
+def _format_stacked_attention(attention, layers, heads, batch_index):
+    if attention.ndim != 5:
+        raise ValueError("Stacked attention must have shape (num_layers, batch_size, num_heads, seq_len, seq_len).")
+    if batch_index is None:
+        if attention.shape[1] != 1:
+            raise ValueError(f"Attention has batch size {attention.shape[1]}. Please set 'batch_index' to the "
+                             f"examples to visualize.")
+        batch_index = 0
+    selectors = [_selector(layers or None), _selector(batch_index), _selector(heads or None)]
+    # Basic indexing (integers and slices) returns a view
+    attention = attention[tuple(slice(None) if isinstance(s, list) else s for s in selectors)]
+    # Gather the remaining lists of indices at once, broadcasting them against each other (an open mesh), along with
+    # the dimensions before them
+    remaining = [s for s in selectors if not isinstance(s, int)]
+    lists = [i for i, s in enumerate(remaining) if isinstance(s, list)]
+    if lists:
+        index = []
+        for i, selector in enumerate(remaining[:lists[-1] + 1]):
+            values = selector if isinstance(selector, list) else range(attention.shape[i])
+            shape = [1] * (lists[-1] + 1)
+            shape[i] = -1
+            if isinstance(attention, np.ndarray):
+                index.append(np.asarray(values).reshape(shape))
+            else:
+                index.append(torch.as_tensor(values, device=attention.device).reshape(shape))
+        attention = attention[tuple(index)]
+    if isinstance(attention, np.ndarray):
+        with warnings.catch_warnings():
+            # Read-only (e.g. memory-mapped) arrays are shared with torch, which never writes to them here
+            warnings.simplefilter('ignore', UserWarning)
+            attention = torch.from_numpy(attention)
+    return attention
+
+
+def _selector(indices):
+    # Index for one dimension: None for all, an integer, a slice for consecutive indices, or a list of indices
+    if indices is None:
+        return slice(None)
+    if isinstance(indices, (int, np.integer)):
+        return int(indices)
+    indices = [int(i) for i in indices]
+    if indices == list(range(indices[0], indices[0] + len(indices))):
+        return slice(indices[0], indices[0] + len(indices))
+    return indices
+
+
+def self_attention_filters(attention, tokens, sentence_b_start=None, batch_index=None, attention_mask=None,
+                           layers=None, heads=None, precision=None):
+    """Format self-attention into attention filters, the entries of the 'attention' param of the head and model views
+
+    Args:
+        attention: list of ``torch.FloatTensor``(one for each layer) of shape
+            ``(batch_size, num_heads, sequence_length, sequence_length)``
+        tokens: list of tokens, or list of lists of tokens (one for each example in the batch)
+        sentence_b_start: index of first wordpiece in sentence B (ignoring padding) if input text is sentence pair, or
+            list of such indices (one for each index in batch_index)
+        batch_index: index of the example to visualize if batch_size > 1, or list of indices to visualize several
+            examples, which may then be selected in the visualization
+        attention_mask: tensor of shape ``(batch_size, sequence_length)`` that is 0 for padded positions, which are
+            removed from the attention and tokens
+        layers: indices of layers to include
+        heads: indices of heads to include
+        precision: precision the attention will be encoded with (see ``format_attention``)
+
+    Returns:
+        List of attention filters. Filters named 'Sentence A -> Sentence B' etc. are views into the attention of the
+        filter at index 'attn_source', restricted to 'left_range' and 'right_range'.
+    """
+    if batch_index is None:
+        if attention[0].shape[0] != 1:
+            raise ValueError(f"Attention has batch size {attention[0].shape[0]}. Please set 'batch_index' to the "
+                             f"examples to visualize.")
+        batch_indices = [0]
+    elif isinstance(batch_index, (int, np.integer)):
+        batch_indices = [int(batch_index)]
+    else:
+        batch_indices = [int(i) for i in batch_index]
+    gallery = not (batch_index is None or isinstance(batch_index, (int, np.integer)))
+    if isinstance(sentence_b_start, (int, np.integer)) or sentence_b_start is None:
+        sentence_b_start = [sentence_b_start] * len(batch_indices)
+    if len(sentence_b_start) != len(batch_indices):
+        raise ValueError("'sentence_b_start' must have one index for each example in 'batch_index'")
+
+    # num_layers x num_examples x num_heads x seq_len x seq_len
+    attention = format_attention(attention, layers, heads, batch_indices, precision)
+    filters = []
+    for i, example_index in enumerate(batch_indices):
+        example_attention = attention[:, i]
+        example_tokens = tokens if not tokens or isinstance(tokens[0], str) else tokens[example_index]
+        if attention_mask is not None:
+            positions = torch.as_tensor(attention_mask)[example_index].nonzero(as_tuple=True)[0]
+            if len(example_tokens) == example_attention.size(-1):  # Tokens include padding
+                example_tokens = [example_tokens[p] for p in positions.tolist()]
+            positions = positions.to(example_attention.device)
+            example_attention = example_attention[..., positions[:, None], positions]
+        name = f'Example {example_index}' if gallery else None
+        filters.extend(_sentence_filters(example_attention, example_tokens, sentence_b_start[i], name, len(filters)))
+    return filters
+
+
+def _sentence_filters(attention, tokens, sentence_b_start, name, index):
+    # Filters for one input, the first of which will be at the given index in the list of filters
+    if sentence_b_start is None:
+        return [
+            {
+                'name': name,
+                'attn': attention,
+                'left_text': tokens,
+                'right_text': tokens
+            }
+        ]
+    # Sentence-pair filters are views into the 'All' attention, derived in the browser from these ranges
+    range_a = [0, sentence_b_start]  # Positions corresponding to sentence A in input
+    range_b = [sentence_b_start, len(tokens)]  # Position corresponding to sentence B in input
+    filters = [
+        {
+            'name': name or 'All',
+            'attn': attention,
+            'left_text': tokens,
+            'right_text': tokens
+        }
+    ]
+    for filter_name, left_range, right_range in (
+            ('Sentence A -> Sentence A', range_a, range_a),
+            ('Sentence B -> Sentence B', range_b, range_b),
+            ('Sentence A -> Sentence B', range_a, range_b),
+            ('Sentence B -> Sentence A', range_b, range_a)):
+        filters.append(
+            {
+                'name': f'{name}: {filter_name}' if name else filter_name,
+                'attn_source': index,
+                'left_range': left_range,
+                'right_range': right_range,
+                'left_text': tokens[slice(*left_range)],
+                'right_text': tokens[slice(*right_range)]
+            }
+        )
+    return filters
+
+
+def column_splits(attn_data, index):
+    """Return the target positions (other than 0) at which the sentence-pair filters that are views into the attention
+    of filter index start, e.g. [sentence_b_start] for a sentence pair, or [] if there are no such filters"""
+    return sorted({d['right_range'][0] for d in attn_data if d.get('attn_source') == index} - {0})
+
+
+def sparsity_mask(attention, top_k=None, min_weight=None, column_splits=None):
+    """Return boolean mask of the attention weights to retain
+
+    Args:
+        attention: tensor of shape (..., source_seq_len, target_seq_len)
+        top_k: retain only the top_k largest weights for each source position
+        min_weight: retain only weights greater than or equal to min_weight
+        column_splits: target positions splitting the targets into blocks (see ``column_splits``), within each of which
+            top_k applies separately, so that the weights of each block retain their own top_k
+    """
+    mask = torch.ones_like(attention, dtype=torch.bool)
+    if top_k is not None:
+        bounds = [0] + list(column_splits or []) + [attention.size(-1)]
+        for start, end in zip(bounds, bounds[1:]):
+            if top_k < end - start:
+                top_indices = attention[..., start:end].topk(top_k, dim=-1).indices
+                mask[..., start:end] = torch.zeros_like(mask[..., start:end]).scatter_(-1, top_indices, True)
+    if min_weight is not None:
+        mask &= attention >= min_weight
+    return mask
+
+
+def encode_attention(attention, precision=None, sparsity=None, column_splits=None):
+    """Convert formatted attention into a representation that can be passed to the javascript visualization
+
+    Args:
+        attention: tensor of shape (num_layers, num_heads, source_seq_len, target_seq_len), as returned by
+            ``format_attention``
+        precision: None (default) to return nested lists, or one of 'float32', 'float16', 'uint8', 'uint16' to return
+            each layer as a base64-encoded little-endian binary buffer that is decoded by ``decodeAttention`` in
+            util.js. 'uint8' and 'uint16' quantize the (non-negative) weights of each head linearly between zero and
+            the maximum weight of the head.
+        sparsity: None (default) to encode all weights, or a dictionary with keys 'top_k' and/or 'min_weight' (see
+            ``sparsity_mask``) to encode only the retained weights in compressed sparse row (CSR) format. Implies
+            binary encoding, with precision 'float32' if precision is None.
+        column_splits: target positions at which the blocks of sentence-pair filters start (see ``column_splits``).
+            'top_k' applies within each block, so that e.g. the Sentence A -> Sentence B filter keeps the top_k weights
+            of each token of sentence A in sentence B, and the attention as a whole keeps up to top_k weights per block.
+
+    Returns:
+        Nested lists of shape (num_layers, num_heads, source_seq_len, target_seq_len) if precision is None, otherwise
+        a dictionary with the structure:
+        {
+            'dtype': precision
+            'shape': [num_layers, num_heads, source_seq_len, target_seq_len]
+            'layers': list of base64 strings, one for each layer
+            'scale' (quantized only): list of lists of shape [num_layers, num_heads], the value of one quantization
+                step for each head
+            'max_error' (quantized only): maximum absolute difference between original and decoded weights (of the
+                retained weights, if sparse)
+            'indptr' (sparse only): list of base64 uint32 buffers, one for each layer, of length
+                num_heads * source_seq_len + 1. The retained weights of row r of the layer are
+                layers[indptr[r]:indptr[r + 1]].
+            'indices' (sparse only): list of base64 buffers, one for each layer, holding the target position of each
+                retained weight
+            'index_dtype' (sparse only): 'uint16' or 'uint32', the dtype of the indices buffers
+        }
+    """
+    if sparsity is not None:
+        unknown = set(sparsity) - {'top_k', 'min_weight'}
+        if unknown:
+            raise ValueError(f"Invalid sparsity options: {', '.join(sorted(unknown))}. "
+                             f"Must be one of 'top_k', 'min_weight'")
+        if precision is None:
+            precision = 'float32'
+    if precision is None:
+        return attention.tolist()
+    if precision not in _PRECISION_DTYPES:
+        raise ValueError(f"Invalid precision: {precision}. Must be one of None, "
+                         f"{', '.join(repr(p) for p in _PRECISION_DTYPES)}")
+    attention = attention.detach().cpu().float()
+    encoded = {
+        'dtype': precision,
+        'shape': list(attention.shape)
+    }
+    mask = None if sparsity is None else sparsity_mask(attention, column_splits=column_splits, **sparsity)
+    if precision in _QUANTIZATION_LEVELS:
+        # One quantization step per layer/head, chosen so that the largest weight in the head maps to the top level
+        scale = attention.flatten(2).amax(dim=-1) / _QUANTIZATION_LEVELS[precision]
+        scale = torch.where(scale > 0, scale, torch.ones_like(scale))
+        step = scale[:, :, None, None]
+        quantized = torch.round(attention / step)
+        error = (quantized * step - attention).abs()
+        if mask is not None:
+            error = error[mask]
+        encoded['scale'] = scale.tolist()
+        encoded['max_error'] = error.max().item() if error.numel() else 0.0
+        attention = quantized
+    dtype = _PRECISION_DTYPES[precision]
+    if mask is None:
+        values = attention.numpy().astype(dtype, copy=False)
+        encoded['layers'] = [_b64encode(layer) for layer in values]
+        return encoded
+
+    # Compressed sparse row representation of each layer, treating each (head, source position) pair as a row
+    index_dtype = 'uint16' if attention.size(-1) <= 65536 else 'uint32'
+    encoded.update({'layers': [], 'indptr': [], 'indices': [], 'index_dtype': index_dtype})
+    for layer_attention, layer_mask in zip(attention, mask):
+        row_lengths = layer_mask.flatten(0, 1).sum(dim=-1)
+        indptr = torch.cat((row_lengths.new_zeros(1), row_lengths.cumsum(dim=0)))
+        indices = layer_mask.nonzero()[:, -1]
+        encoded['layers'].append(_b64encode(layer_attention[layer_mask].numpy().astype(dtype, copy=False)))
+        encoded['indptr'].append(_b64encode(indptr.numpy().astype('<u4')))
+        encoded['indices'].append(_b64encode(indices.numpy().astype(_INDEX_DTYPES[index_dtype])))
+    return encoded
+
+
+def _b64encode(array):
+    return base64.b64encode(array.tobytes()).decode('ascii')
 
 
 def num_layers(attention):
+    # List of per-layer tensors, or stacked tensor or array of shape (num_layers, batch_size, num_heads, ...)
     return len(attention)
 
 
 def num_heads(attention):
-    return attention[0][0].size(0)
+    return attention[0][0].shape[0]
 
 
 def format_special_chars(tokens):
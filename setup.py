@@ -19,5 +19,5 @@ setup(
     license="Apache 2.0",
     packages=["bertviz"],
     include_package_data=True,
-    install_requires=["transformers>=2.0", "torch>=1.0", "tqdm", "boto3", "requests", "regex", "sentencepiece", "IPython>=7.14"],
+    install_requires=["transformers>=2.0", "torch>=1.0", "numpy", "tqdm", "boto3", "requests", "regex", "sentencepiece", "IPython>=7.14"],
 )
\ No newline at end of file